@@ -58,6 +58,7 @@ from .non_linear.optimize.pyswarms import PySwarmsLocal
 from .non_linear.paths import Paths
 from .non_linear.paths import convert_paths
 from .non_linear.paths import make_path
+from .non_linear.samples import LazySamples
 from .non_linear.samples import MCMCSamples
 from .non_linear.samples import NestSamples
 from .non_linear.samples import OptimizerSamples
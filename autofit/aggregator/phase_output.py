@@ -5,6 +5,7 @@ import pickle
 import dill
 
 from autofit.non_linear import abstract_search
+from autofit.non_linear.samples import LazySamples, PDFSamples, load_from_binary
 
 
 class PhaseOutput:
@@ -104,6 +105,56 @@ class PhaseOutput:
                 self.__model = pickle.loads(f.read())
         return self.__model
 
+    @property
+    def samples(self):
+        """
+        The samples of the search of this phase.
+
+        If the search wrote a summary of its samples, values in the summary such as the maximum log likelihood
+        instance and median PDF vector are given without unpickling the samples, which are only loaded if anything
+        else is needed.
+
+        The summary and samples.pickle are written when the search completes. For a search which did not complete,
+        for example because it was stopped, the samples written so far are read from the binary samples file as
+        PDFSamples, which do not include values specific to the search such as the log evidence.
+        """
+        try:
+            return LazySamples.from_json(
+                model=self.model,
+                filename=os.path.join(self.directory, "samples", "summary.json"),
+                load=self._load_samples
+            )
+        except FileNotFoundError:
+            return self._load_samples()
+
+    def _load_samples(self):
+        samples = self.__getattr__("samples")
+        if samples is not None:
+            return samples
+        try:
+            return PDFSamples(
+                model=self.model,
+                samples=load_from_binary(
+                    os.path.join(self.directory, "samples", "samples.bin")
+                )
+            )
+        except FileNotFoundError:
+            return None
+
+    @property
+    def equal_weight_samples(self) -> PDFSamples:
+        """
+        Equally weighted samples of the posterior found in this phase, with one sample per effective sample.
+
+        These are read from a memory mapped file, so the full samples of the search are not loaded.
+        """
+        return PDFSamples(
+            model=self.model,
+            samples=load_from_binary(
+                os.path.join(self.directory, "samples", "samples_equal_weights.bin")
+            )
+        )
+
     def __str__(self):
         return self.text
 
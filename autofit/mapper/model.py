@@ -17,8 +17,8 @@ class AbstractModel(ModelObject):
                 else:
                     setattr(instance, key, value)
 
-        add_items(self.__dict__)
-        add_items(other.__dict__)
+        add_items(_attributes(self))
+        add_items(_attributes(other))
         return instance
 
     def copy(self):
@@ -101,7 +101,7 @@ class AbstractModel(ModelObject):
         return list(
             filter(
                 lambda t: t[0] != "id" and not t[0].startswith("_") and isinstance(t[1], class_type),
-                self.__dict__.items(),
+                _attributes(self).items(),
             )
         )
 
@@ -148,56 +148,119 @@ def populate(obj, collection: ResultsCollection):
         return obj
 
 
-@DynamicRecursionCache()
+def _attributes(obj) -> dict:
+    """
+    The attributes of an object by name.
+
+    Views of a parameter vector hold their attributes as properties rather than in
+    __dict__, so for a view the properties named by its _view_keys are read instead.
+    """
+    keys = getattr(type(obj), "_view_keys", None)
+    if keys is not None:
+        return {key: getattr(obj, key) for key in keys}
+    return obj.__dict__
+
+
+def _public_items(obj):
+    """
+    An iterator over the public attributes of an object or items of a dictionary,
+    or None if the object cannot be searched.
+    """
+    if isinstance(obj, dict):
+        d = obj
+    else:
+        try:
+            d = _attributes(obj)
+        except (AttributeError, TypeError):
+            return None
+
+    items = list(d.items())
+    if not all(isinstance(key, str) for key, _ in items):
+        return None
+
+    return iter([
+        (key, value)
+        for key, value in items
+        if not key.startswith("_")
+    ])
+
+
 def path_instances_of_class(
         obj, cls: type, ignore_class: Optional[Union[type, Tuple[type]]] = None
 ):
     """
-    Recursively search the object for instances of a given class
+    Search the object for instances of a given class
+
+    The object graph is traversed depth first with an explicit stack. Objects which
+    are already being searched further up the current path are skipped, so cycles
+    terminate without placeholders.
 
     Parameters
     ----------
     obj
-        The object to recursively search
+        The object to search
     cls
         The type to search for
     ignore_class
-        A type or
+        A type or tuple of types whose instances and their children are ignored
 
     Returns
     -------
-    instance of type
+    Tuples containing the path to and instance of each object of the given type
     """
     if ignore_class is not None and isinstance(obj, ignore_class):
         return []
     if isinstance(obj, cls):
         return [(tuple(), obj)]
-    results = []
-    try:
-        from autofit.mapper.prior_model.annotation import AnnotationPriorModel
-
-        if isinstance(obj, dict):
-            d = obj
-        else:
-            d = obj.__dict__
-
-        for key, value in d.items():
-            if key.startswith("_"):
-                continue
-            for item in path_instances_of_class(
-                    value,
-                    cls,
-                    ignore_class=ignore_class
-            ):
-                if isinstance(value, AnnotationPriorModel):
-                    path = (key,)
-                else:
-                    path = (key, *item[0])
-                results.append((path, item[1]))
-        return results
-    except (AttributeError, TypeError):
+
+    items = _public_items(obj)
+    if items is None:
         return []
 
+    from autofit.mapper.prior_model.annotation import AnnotationPriorModel
+
+    results = []
+
+    # Each entry is the id of an object being searched, an iterator over its items,
+    # its path and whether its path is fixed. Instances found within an annotation
+    # take the path of the annotation.
+    active = {id(obj)}
+    stack = [(id(obj), items, tuple(), False)]
+
+    while stack:
+        obj_id, items, path, is_fixed = stack[-1]
+        try:
+            key, value = next(items)
+        except StopIteration:
+            stack.pop()
+            active.discard(obj_id)
+            continue
+
+        if ignore_class is not None and isinstance(value, ignore_class):
+            continue
+
+        value_path = path if is_fixed else (*path, key)
+
+        if isinstance(value, cls):
+            results.append((value_path, value))
+            continue
+        if id(value) in active:
+            continue
+
+        value_items = _public_items(value)
+        if value_items is None:
+            continue
+
+        active.add(id(value))
+        stack.append((
+            id(value),
+            value_items,
+            value_path,
+            is_fixed or isinstance(value, AnnotationPriorModel)
+        ))
+
+    return results
+
 
 class ModelInstance(AbstractModel):
     """
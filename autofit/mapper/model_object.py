@@ -1,4 +1,65 @@
 import itertools
+import weakref
+
+
+class Structure:
+    def __init__(self, owner=None):
+        """
+        Structural information cached on one object in a model, such as a compiled
+        plan, and the models whose cached information depends on that object.
+
+        Parameters
+        ----------
+        owner
+            The object on which the information is cached
+        """
+        self.owner = None if owner is None else weakref.ref(owner)
+        self.cache = dict()
+        self.dependents = dict()
+        self.registered = False
+
+    def belongs_to(self, obj) -> bool:
+        return self.owner is not None and self.owner() is obj
+
+    def clear(self):
+        self.cache = dict()
+        self.registered = False
+
+    def __reduce__(self):
+        # Copies of an object start without any cached structure
+        return Structure, ()
+
+
+def structure_of(obj) -> Structure:
+    """
+    The structural information cached on an object, created if the object has none.
+    """
+    structure = obj.__dict__.get("_structure_cache")
+    if structure is None or not structure.belongs_to(obj):
+        structure = Structure(obj)
+        obj.__dict__["_structure_cache"] = structure
+    return structure
+
+
+def structure_changed(obj):
+    """
+    Record that an object in a model has changed, discarding any structural
+    information cached on it or on models which contain it.
+
+    Objects which no model has cached information about, such as a newly
+    created prior, are unaffected.
+    """
+    structure = obj.__dict__.get("_structure_cache")
+    if structure is None or not structure.belongs_to(obj):
+        return
+    dependents, structure.dependents = structure.dependents, dict()
+    structure.clear()
+    for reference in dependents.values():
+        dependent = reference()
+        if dependent is not None:
+            dependent_structure = dependent.__dict__.get("_structure_cache")
+            if dependent_structure is not None and dependent_structure.belongs_to(dependent):
+                dependent_structure.clear()
 
 
 class ModelObject:
@@ -7,6 +68,13 @@ class ModelObject:
     def __init__(self):
         self.id = next(self._ids)
 
+    def structure_changed(self):
+        """
+        Record that the structure of this object has changed, invalidating any
+        structural information cached on models which contain it.
+        """
+        structure_changed(self)
+
     @property
     def component_number(self):
         return self.id
@@ -12,6 +12,7 @@ from autoconf import conf
 from autofit import exc
 from autofit.mapper.prior.arithmetic import ArithmeticMixin
 from autofit.mapper.prior.deferred import DeferredArgument
+from autofit.mapper.model_object import ModelObject, structure_changed
 from autofit.mapper.prior_model.attribute_pair import (
     cast_collection,
     PriorNameValue,
@@ -76,6 +77,10 @@ class TuplePrior:
     A prior comprising one or more priors in a tuple
     """
 
+    def __setattr__(self, key, value):
+        structure_changed(self)
+        super().__setattr__(key, value)
+
     @property
     @cast_collection(PriorNameValue)
     def prior_tuples(self):
@@ -176,6 +181,10 @@ class Prior(Variable, ABC, ArithmeticMixin):
                 "The upper limit of a prior must be greater than its lower limit"
             )
 
+    def __setattr__(self, key, value):
+        self.structure_changed()
+        super().__setattr__(key, value)
+
     def assert_within_limits(self, value):
         if not (self.lower_limit <= value <= self.upper_limit):
             raise exc.PriorLimitException(
@@ -205,11 +214,12 @@ class Prior(Variable, ABC, ArithmeticMixin):
         Parameters
         ----------
         unit
-            A hypercube value between 0 and 1.
+            A hypercube value between 0 and 1, or an array of such values which
+            are mapped element-wise.
 
         Returns
         -------
-        A physical value.
+        A physical value, or an array of physical values.
         """
 
     def instance_for_arguments(self, arguments):
@@ -310,8 +320,8 @@ class GaussianPrior(Prior):
 
         Parameters
         ----------
-        unit: Float
-            A unit hypercube value between 0 and 1
+        unit: Float or np.ndarray
+            A unit hypercube value between 0 and 1, or an array of such values
         Returns
         -------
         value: Float
@@ -363,8 +373,8 @@ class UniformPrior(Prior):
 
         Parameters
         ----------
-        unit: Float
-            A unit hypercube value between 0 and 1
+        unit: Float or np.ndarray
+            A unit hypercube value between 0 and 1, or an array of such values
         Returns
         -------
         value: Float
@@ -417,8 +427,8 @@ class LogUniformPrior(UniformPrior):
 
         Parameters
         ----------
-        unit: Float
-            A unit hypercube value between 0 and 1
+        unit: Float or np.ndarray
+            A unit hypercube value between 0 and 1, or an array of such values
         Returns
         -------
         value: Float
@@ -1,5 +1,6 @@
 import copy
 import inspect
+import weakref
 from functools import wraps
 from numbers import Number
 from random import random
@@ -11,6 +12,7 @@ from autoconf import conf
 from autofit import exc
 from autofit.mapper import model
 from autofit.mapper.model import AbstractModel
+from autofit.mapper.model_object import ModelObject, structure_of
 from autofit.mapper.prior.deferred import DeferredArgument
 from autofit.mapper.prior.prior import GaussianPrior
 from autofit.mapper.prior.prior import TuplePrior, Prior, WidthModifier, Limits
@@ -22,35 +24,96 @@ from autofit.text import formatter as frm
 from autofit.text.formatter import TextFormatter
 
 
+def assert_assertions(obj, arguments):
+    """
+    Raise a FitException if any assertion attached to an object fails for the
+    given arguments.
+
+    Parameters
+    ----------
+    obj
+        A prior model with a list of assertions
+    arguments: {Prior: float}
+        Dictionary mapping priors to physical values
+    """
+    # noinspection PyProtectedMember
+    failed_assertions = [
+        assertion
+        for assertion
+        in obj._assertions
+        if assertion is False or assertion is not True and not assertion.instance_for_arguments(
+            arguments
+        )
+    ]
+    number_of_failed_assertions = len(failed_assertions)
+    if number_of_failed_assertions > 0:
+        name_string = "\n".join([
+            assertion.name
+            for assertion
+            in failed_assertions
+            if hasattr(assertion, "name") and assertion.name is not None
+        ])
+        raise exc.FitException(
+            f"{number_of_failed_assertions} assertions failed!\n{name_string}"
+        )
+
+
 def check_assertions(func):
     @wraps(func)
     def wrapper(s, arguments):
-        # noinspection PyProtectedMember
-        failed_assertions = [
-            assertion
-            for assertion
-            in s._assertions
-            if assertion is False or assertion is not True and not assertion.instance_for_arguments(
-                arguments
-            )
-        ]
-        number_of_failed_assertions = len(failed_assertions)
-        if number_of_failed_assertions > 0:
-            name_string = "\n".join([
-                assertion.name
-                for assertion
-                in failed_assertions
-                if hasattr(assertion, "name") and assertion.name is not None
-            ])
-            raise exc.FitException(
-                f"{number_of_failed_assertions} assertions failed!\n{name_string}"
-            )
-
+        assert_assertions(s, arguments)
         return func(s, arguments)
 
     return wrapper
 
 
+def _structural_objects(obj, seen=None):
+    """
+    Every model, prior and tuple prior in the structure of a model, including the model itself.
+    """
+    seen = seen if seen is not None else set()
+    if id(obj) in seen:
+        return
+    seen.add(id(obj))
+
+    if isinstance(obj, (list, tuple)):
+        for item in obj:
+            yield from _structural_objects(item, seen)
+    elif isinstance(obj, dict):
+        for value in obj.values():
+            yield from _structural_objects(value, seen)
+    elif isinstance(obj, (ModelObject, TuplePrior)):
+        yield obj
+        for key, value in obj.__dict__.items():
+            if key != "_structure_cache":
+                yield from _structural_objects(value, seen)
+
+
+def structure_cache(func):
+    """
+    Cache the result of a method that depends only on the structure of a model.
+
+    Results are stored on the model and discarded as soon as the model, or any
+    model or prior it contains, is changed.
+    """
+
+    @wraps(func)
+    def wrapper(self, *args):
+        structure = structure_of(self)
+        if not structure.registered:
+            reference = weakref.ref(self)
+            for obj in _structural_objects(self):
+                structure_of(obj).dependents[id(self)] = reference
+            structure.registered = True
+        cache = structure.cache
+        key = (func.__qualname__, *args)
+        if key not in cache:
+            cache[key] = func(self, *args)
+        return cache[key]
+
+    return wrapper
+
+
 class AbstractPriorModel(AbstractModel):
     """
     Abstract model that maps a set of priors to a particular class. Must be
@@ -63,6 +126,32 @@ class AbstractPriorModel(AbstractModel):
         super().__init__()
         self._assertions = list()
 
+    def __setattr__(self, key, value):
+        self.structure_changed()
+        super().__setattr__(key, value)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_structure_cache", None)
+        return state
+
+    @structure_cache
+    def compile(self):
+        """
+        Compile a plan for creating instances of this model from vectors of
+        physical values.
+
+        The plan is cached and compiled again if the model is changed.
+
+        Returns
+        -------
+        compiled_model: CompiledModel
+            An object which creates instances without traversing the model
+        """
+        from autofit.mapper.prior_model.compiled import CompiledModel
+
+        return CompiledModel(self)
+
     def add_assertion(self, assertion, name=None):
         """
         Assert that some relationship holds between physical values associated with
@@ -82,11 +171,49 @@ class AbstractPriorModel(AbstractModel):
         except AttributeError:
             pass
         self._assertions.append(assertion)
+        self.structure_changed()
 
     @property
     def name(self):
         return self.__class__.__name__
 
+    def path_instance_tuples_for_class(
+            self,
+            cls,
+            ignore_class=None
+    ):
+        """
+        Tuples containing the path tuple and instance for every instance of the class
+        in the model tree.
+
+        Results are cached for each class until the model is changed.
+
+        Parameters
+        ----------
+        ignore_class
+            Children of instances of this class are ignored
+        cls
+            The type to find instances of
+
+        Returns
+        -------
+        path_instance_tuples: [((str,), object)]
+            Tuples containing the path to and instance of objects of the given type.
+        """
+        return list(
+            self._path_instance_tuples_for_class(
+                cls,
+                ignore_class
+            )
+        )
+
+    @structure_cache
+    def _path_instance_tuples_for_class(self, cls, ignore_class):
+        return super().path_instance_tuples_for_class(
+            cls,
+            ignore_class=ignore_class
+        )
+
     # noinspection PyUnusedLocal
     @staticmethod
     def from_object(t, *args, **kwargs):
@@ -181,20 +308,13 @@ class AbstractPriorModel(AbstractModel):
         exc.FitException
             If any assertion attached to this object returns False.
         """
-        arguments = dict(
-            map(
-                lambda prior_tuple, unit: (
-                    prior_tuple.prior,
-                    prior_tuple.prior.value_for(unit),
-                ),
-                self.prior_tuples_ordered_by_id,
-                unit_vector,
-            )
+        return self.instance_from_vector(
+            self.vector_from_unit_vector(unit_vector),
+            assert_priors_in_limits=assert_priors_in_limits
         )
 
-        return self.instance_for_arguments(arguments, assert_priors_in_limits=assert_priors_in_limits)
-
     @property
+    @structure_cache
     @cast_collection(PriorNameValue)
     def unique_prior_tuples(self):
         """
@@ -209,6 +329,7 @@ class AbstractPriorModel(AbstractModel):
         }.values()
 
     @property
+    @structure_cache
     def unique_promise_tuples(self):
         from autofit.mapper.prior.promise import AbstractPromise
 
@@ -218,6 +339,7 @@ class AbstractPriorModel(AbstractModel):
         }.values()
 
     @property
+    @structure_cache
     @cast_collection(PriorNameValue)
     def prior_tuples_ordered_by_id(self):
         """
@@ -249,6 +371,30 @@ class AbstractPriorModel(AbstractModel):
             )
         )
 
+    def vectors_from_unit_vectors(self, unit_vectors):
+        """
+        Map many unit hypercube vectors to physical values at once.
+
+        Each prior maps its whole column of unit values in a single array operation.
+
+        Parameters
+        ----------
+        unit_vectors: np.ndarray
+            An array of shape (total_points, prior_count) of unit hypercube values
+
+        Returns
+        -------
+        vectors: np.ndarray
+            An array of the same shape of physical values output by priors
+        """
+        unit_vectors = np.asarray(unit_vectors, dtype="float")
+        vectors = np.empty(unit_vectors.shape)
+
+        for index, prior_tuple in enumerate(self.prior_tuples_ordered_by_id):
+            vectors[:, index] = prior_tuple.prior.value_for(unit_vectors[:, index])
+
+        return vectors
+
     def random_unit_vector_within_limits(self, lower_limit=0.0, upper_limit=1.0):
         """ Generate a random vector of unit values by drawing uniform random values between 0 and 1.
         Returns
@@ -307,7 +453,8 @@ class AbstractPriorModel(AbstractModel):
     def instance_from_vector(
             self,
             vector,
-            assert_priors_in_limits=True
+            assert_priors_in_limits=True,
+            view=False
     ):
         """
         Returns a ModelInstance, which has an attribute and class instance corresponding
@@ -320,22 +467,21 @@ class AbstractPriorModel(AbstractModel):
             A vector of physical parameter values that is mapped to an instance.
         assert_priors_in_limits
             If `True` it is checked that the physical values of priors are within set limits
+        view
+            If `True` a lightweight view of the vector is returned instead of constructing
+            the classes of the model (see `CompiledModel.instance_from_vector`)
         Returns
         -------
         model_instance : autofit.mapper.model.ModelInstance
             An object containing reconstructed model_mapper instances
         """
-        arguments = dict(
-            map(
-                lambda prior_tuple, physical_unit: (prior_tuple.prior, physical_unit),
-                self.prior_tuples_ordered_by_id,
-                vector,
-            )
-        )
-
-        return self.instance_for_arguments(
-            arguments,
-            assert_priors_in_limits=assert_priors_in_limits
+        return self.compile().instance_from_vector(
+            vector,
+            assert_priors_in_limits=(
+                    assert_priors_in_limits
+                    and not conf.instance["general"]["model"]["ignore_prior_limits"]
+            ),
+            view=view
         )
 
     def mapper_from_partial_prior_arguments(self, arguments):
@@ -367,18 +513,40 @@ class AbstractPriorModel(AbstractModel):
         model_mapper: ModelMapper
             A new model mapper with updated priors.
         """
-        mapper = copy.deepcopy(self)
+        # As for gaussian_prior_model_for_arguments, the assertions of models
+        # nested in this one are not carried over. Those of this model are.
+        memo = dict()
+        mapper = _clone(self, arguments, memo, keep_assertions=False)
+        mapper._assertions = _clone(self._assertions, arguments, memo, keep_assertions=False)
+        return mapper
+
+    def clone(self, arguments=None, keep_assertions=True):
+        """
+        Create a copy of this model in a single pass, optionally replacing priors.
 
-        for prior_model_tuple in self.prior_model_tuples:
-            setattr(
-                mapper,
-                prior_model_tuple.name,
-                prior_model_tuple.prior_model.gaussian_prior_model_for_arguments(
-                    arguments
-                ),
-            )
+        Prior models, tuple priors, priors and the lists and dictionaries that hold
+        them are copied once each, and other attributes such as constant values are
+        deep copied. Objects which appear more than once in this model appear more
+        than once in the copy, so priors shared between components remain shared.
 
-        return mapper
+        Parameters
+        ----------
+        arguments: {Prior: Prior}
+            A dictionary mapping priors to the priors that replace them. Priors which
+            are not in the dictionary are copied.
+        keep_assertions
+            If False the copy of this model, and of every model in it, has no assertions.
+
+        Returns
+        -------
+        A new model
+        """
+        return _clone(
+            self,
+            arguments or dict(),
+            dict(),
+            keep_assertions=keep_assertions
+        )
 
     def mapper_from_gaussian_tuples(
             self,
@@ -424,6 +592,10 @@ class AbstractPriorModel(AbstractModel):
         prior_class_dict = self.prior_class_dict
         arguments = {}
 
+        # Configuration is read once for each class and attribute name
+        width_modifiers = {}
+        config_limits = {}
+
         for i, prior_tuple in enumerate(prior_tuples):
             prior = prior_tuple.prior
             cls = prior_class_dict[prior]
@@ -435,7 +607,10 @@ class AbstractPriorModel(AbstractModel):
             if name.isdigit():
                 name = self.path_for_prior(prior_tuple.prior)[-2]
 
-            width_modifier = WidthModifier.for_class_and_attribute_name(cls, name)
+            key = (cls, name)
+            if key not in width_modifiers:
+                width_modifiers[key] = WidthModifier.for_class_and_attribute_name(cls, name)
+            width_modifier = width_modifiers[key]
 
             if a is not None and r is not None:
                 raise exc.PriorException(
@@ -451,12 +626,16 @@ class AbstractPriorModel(AbstractModel):
             if no_limits:
                 limits = (float("-inf"), float("inf"))
             else:
-                try:
-                    limits = Limits.for_class_and_attributes_name(
-                        cls,
-                        name
-                    )
-                except exc.PriorException:
+                if key not in config_limits:
+                    try:
+                        config_limits[key] = Limits.for_class_and_attributes_name(
+                            cls,
+                            name
+                        )
+                    except exc.PriorException:
+                        config_limits[key] = None
+                limits = config_limits[key]
+                if limits is None:
                     limits = prior.limits
 
             if use_errors and not use_widths:
@@ -513,6 +692,34 @@ class AbstractPriorModel(AbstractModel):
             )
         )
 
+    def log_priors_from_vectors(
+            self,
+            vectors,
+    ):
+        """
+        Compute the log priors of every parameter of many vectors at once, using the Prior of every parameter.
+
+        Each prior computes the log prior of its whole column of values in a single array operation, so whole chains
+        can be converted without a Python loop over samples.
+
+        Parameters
+        ----------
+        vectors : np.ndarray
+            An array of shape (total_samples, prior_count) of physical parameter values.
+
+        Returns
+        -------
+        log_priors : np.ndarray
+            An array of the same shape of the log prior value of every parameter of every vector.
+        """
+        vectors = np.asarray(vectors, dtype="float").reshape(-1, self.prior_count)
+        log_priors = np.empty(vectors.shape)
+
+        for index, prior_tuple in enumerate(self.prior_tuples_ordered_by_id):
+            log_priors[:, index] = prior_tuple.prior.log_prior_from_value(value=vectors[:, index])
+
+        return log_priors
+
     def random_instance(self):
         """
         Returns a random instance of the model.
@@ -704,10 +911,12 @@ class AbstractPriorModel(AbstractModel):
         )
 
     @property
+    @structure_cache
     def prior_count(self):
         return len(self.unique_prior_tuples)
 
     @property
+    @structure_cache
     def promise_count(self):
         return len(self.unique_promise_tuples)
 
@@ -724,6 +933,7 @@ class AbstractPriorModel(AbstractModel):
         return [prior_tuple.prior for prior_tuple in self.prior_tuples]
 
     @property
+    @structure_cache
     def _prior_id_map(self):
         return {
             prior.id: prior
@@ -750,7 +960,7 @@ class AbstractPriorModel(AbstractModel):
         return self.id
 
     def __add__(self, other):
-        result = copy.deepcopy(self)
+        result = self.clone()
 
         for key, value in other.__dict__.items():
             if not hasattr(result, key) or isinstance(value, Prior):
@@ -776,7 +986,7 @@ class AbstractPriorModel(AbstractModel):
         instance
             The best fit from the previous phase
         """
-        mapper = copy.deepcopy(self)
+        mapper = self.clone()
         transfer_classes(instance, mapper, excluded_classes)
         return mapper
 
@@ -850,13 +1060,17 @@ class AbstractPriorModel(AbstractModel):
         for *corner.py* visualization.
         The parameter names are determined from the class instance names of the
         model_mapper. Latex tags are properties of each model class."""
-        return [
+        return list(self._model_component_and_parameter_names())
+
+    @structure_cache
+    def _model_component_and_parameter_names(self):
+        return tuple(
             self.name_for_prior(
                 prior
             )
             for _, prior
             in self.prior_tuples_ordered_by_id
-        ]
+        )
 
     @property
     def parameter_names(self) -> [str]:
@@ -914,6 +1128,56 @@ class AbstractPriorModel(AbstractModel):
         return subscripts
 
 
+def _clone(obj, arguments, memo, keep_assertions=True):
+    """
+    Copy the structure of a model, replacing priors found in arguments.
+
+    Parameters
+    ----------
+    obj
+        Some object in a model
+    arguments
+        A dictionary mapping priors to replacement priors
+    memo
+        A dictionary mapping the ids of objects already copied to their copies. It
+        is also used as the memo of copy.deepcopy.
+    keep_assertions
+        If False models are copied without their assertions
+
+    Returns
+    -------
+    A copy of obj
+    """
+    try:
+        return memo[id(obj)]
+    except KeyError:
+        pass
+
+    if isinstance(obj, Prior):
+        new = arguments[obj] if obj in arguments else copy.copy(obj)
+    elif isinstance(obj, (AbstractPriorModel, TuplePrior)):
+        # The state of a prior model excludes any cached structure
+        new = copy.copy(obj)
+        memo[id(obj)] = new
+        for key, value in list(new.__dict__.items()):
+            if key == "_assertions" and not keep_assertions:
+                new.__dict__[key] = list()
+            else:
+                new.__dict__[key] = _clone(value, arguments, memo, keep_assertions)
+    elif isinstance(obj, list):
+        new = [_clone(item, arguments, memo, keep_assertions) for item in obj]
+    elif isinstance(obj, dict):
+        new = {
+            key: _clone(value, arguments, memo, keep_assertions)
+            for key, value in obj.items()
+        }
+    else:
+        return copy.deepcopy(obj, memo)
+
+    memo[id(obj)] = new
+    return new
+
+
 def transfer_classes(instance, mapper, model_classes=None):
     """
     Recursively overwrite priors in the mapper with instance values from the
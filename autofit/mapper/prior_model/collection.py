@@ -125,6 +125,7 @@ class CollectionPriorModel(AbstractPriorModel):
         for key, value in self.__dict__.copy().items():
             if value == item:
                 del self.__dict__[key]
+        self.structure_changed()
 
     @check_assertions
     def _instance_for_arguments(self, arguments):
@@ -145,6 +146,8 @@ class CollectionPriorModel(AbstractPriorModel):
             )
         result = ModelInstance()
         for key, value in self.__dict__.items():
+            if key == "_structure_cache":
+                continue
             if isinstance(value, AbstractPriorModel):
                 value = value.instance_for_arguments(arguments)
             if isinstance(value, Prior):
@@ -164,15 +167,7 @@ class CollectionPriorModel(AbstractPriorModel):
         prior_models: [PriorModel]
             A new list of prior models with gaussian priors
         """
-        return CollectionPriorModel({
-            key: value.gaussian_prior_model_for_arguments(arguments)
-            if isinstance(value, AbstractPriorModel)
-            else value
-            for key, value in self.__dict__.items()
-            if key not in ("component_number", "item_number", "id") and not key.startswith(
-                "_"
-            )
-        })
+        return self.clone(arguments, keep_assertions=False)
 
     @property
     def prior_class_dict(self):
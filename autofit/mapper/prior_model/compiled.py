@@ -0,0 +1,646 @@
+import inspect
+from numbers import Number
+
+import numpy as np
+
+from autofit import exc
+from autofit.mapper.model import ModelInstance
+from autofit.mapper.prior.assertion import (
+    CompoundAssertion,
+    GreaterThanLessThanAssertion,
+    GreaterThanLessThanEqualAssertion,
+)
+from autofit.mapper.prior.compound import (
+    AbsolutePrior,
+    MultiplePrior,
+    NegativePrior,
+    SumPrior,
+)
+from autofit.mapper.prior.deferred import DeferredInstance
+from autofit.mapper.prior.prior import Prior, TuplePrior
+from autofit.mapper.prior.promise import Promise
+from autofit.mapper.prior_model.abstract import AbstractPriorModel, assert_assertions
+from autofit.mapper.prior_model.collection import CollectionPriorModel
+from autofit.mapper.prior_model.prior_model import PriorModel
+from autofit.mapper.prior_model.view import collection_view_class, view_class
+
+
+def _constant(value):
+    return lambda vector, arguments: value
+
+
+def _component(index):
+    return lambda vector, arguments: vector[index]
+
+
+def _unit_component(prior, index):
+    return lambda vector, arguments: prior.value_for(vector[index])
+
+
+# Only operations which give identical results for floats and arrays of floats
+# are evaluated with NumPy. Others, such as division, may raise for floats.
+_binary_operations = {
+    SumPrior: np.add,
+    MultiplePrior: np.multiply,
+}
+_unary_operations = {
+    NegativePrior: np.negative,
+    AbsolutePrior: np.abs,
+}
+_comparisons = {
+    GreaterThanLessThanAssertion: True,
+    GreaterThanLessThanEqualAssertion: False,
+}
+
+
+class CompiledAssertions:
+    def __init__(self, models, priors):
+        """
+        The assertions attached to a model compiled into a single predicate which is
+        evaluated for a whole batch of parameter vectors at once.
+
+        Comparisons between priors and constants are stored as arrays of column
+        indices so that all of them are evaluated with one NumPy comparison. Other
+        comparisons are evaluated column by column with NumPy and any assertion that
+        cannot be expressed with arrays is evaluated for each vector in turn.
+
+        Parameters
+        ----------
+        models
+            Every model in the tree which has assertions attached, in the order
+            they are checked when an instance is created
+        priors
+            The priors of the model ordered by id, matching the columns of vectors
+        """
+        self.models = models
+        self.priors = priors
+
+        self._indices = {
+            prior: index
+            for index, prior
+            in enumerate(priors)
+        }
+        self._always_fails = False
+        self._constants = list()
+        self._lower_indices = list()
+        self._greater_indices = list()
+        self._strict = list()
+        self._predicates = list()
+
+        for model in models:
+            # noinspection PyProtectedMember
+            for assertion in model._assertions:
+                self._add(assertion)
+
+        self._lower_indices = np.array(self._lower_indices, dtype="int")
+        self._greater_indices = np.array(self._greater_indices, dtype="int")
+        self._strict = np.array(self._strict, dtype="bool")
+        self._constants = np.array(self._constants, dtype="float")
+
+    def _add(self, assertion):
+        if assertion is True:
+            return
+        if assertion is False:
+            self._always_fails = True
+            return
+        if isinstance(assertion, CompoundAssertion):
+            self._add(assertion.assertion_1)
+            self._add(assertion.assertion_2)
+            return
+
+        strict = _comparisons.get(type(assertion))
+        if strict is not None:
+            lower = self._column(assertion.left)
+            greater = self._column(assertion.right)
+            if lower is not None and greater is not None:
+                self._lower_indices.append(lower)
+                self._greater_indices.append(greater)
+                self._strict.append(strict)
+                return
+
+            lower = self._array_function(assertion.left)
+            greater = self._array_function(assertion.right)
+            if lower is not None and greater is not None:
+                comparison = np.less if strict else np.less_equal
+                self._predicates.append(
+                    lambda vectors: comparison(lower(vectors), greater(vectors))
+                )
+                return
+
+        self._predicates.append(
+            self._vector_predicate(assertion)
+        )
+
+    def _column(self, obj):
+        """
+        The index of the column holding the value of a prior or constant in the
+        array of vectors extended with constants, or None.
+        """
+        if isinstance(obj, Prior):
+            return self._indices.get(obj)
+        if isinstance(obj, Number):
+            self._constants.append(obj)
+            return len(self.priors) + len(self._constants) - 1
+        return None
+
+    def _array_function(self, obj):
+        """
+        A function computing the value of obj for every vector in a 2D array, or
+        None if obj cannot be computed with array operations.
+        """
+        if isinstance(obj, Prior):
+            index = self._indices.get(obj)
+            if index is None:
+                return None
+            return lambda vectors: vectors[:, index]
+        if isinstance(obj, Number):
+            return lambda vectors: obj
+
+        operation = _binary_operations.get(type(obj))
+        if operation is not None:
+            left = self._array_function(obj.left)
+            right = self._array_function(obj.right)
+            if left is None or right is None:
+                return None
+            return lambda vectors: operation(left(vectors), right(vectors))
+
+        operation = _unary_operations.get(type(obj))
+        if operation is not None:
+            prior = self._array_function(obj.prior)
+            if prior is None:
+                return None
+            return lambda vectors: operation(prior(vectors))
+
+        return None
+
+    def _vector_predicate(self, assertion):
+        def predicate(vectors):
+            return np.array([
+                bool(assertion.instance_for_arguments(
+                    dict(zip(self.priors, vector))
+                ))
+                for vector in vectors
+            ], dtype="bool")
+
+        return predicate
+
+    def hold(self, vectors):
+        """
+        Evaluate every assertion for a batch of parameter vectors.
+
+        Parameters
+        ----------
+        vectors
+            A 2D array of physical values with one row per vector and one column per
+            prior ordered by id.
+
+        Returns
+        -------
+        A boolean array which is True for vectors satisfying every assertion
+        """
+        vectors = np.asarray(vectors, dtype="float")
+        total_vectors = vectors.shape[0]
+
+        holds = np.full(total_vectors, not self._always_fails)
+
+        if len(self._lower_indices) > 0:
+            values = np.concatenate(
+                (
+                    vectors,
+                    np.broadcast_to(
+                        self._constants,
+                        (total_vectors, len(self._constants))
+                    )
+                ),
+                axis=1
+            )
+            lower = values[:, self._lower_indices]
+            greater = values[:, self._greater_indices]
+            holds &= np.where(
+                self._strict,
+                lower < greater,
+                lower <= greater
+            ).all(axis=1)
+
+        for predicate in self._predicates:
+            holds &= predicate(vectors)
+
+        return holds
+
+    def assert_hold(self, vector):
+        """
+        Raise a FitException if any assertion fails for a vector.
+
+        The compiled predicate is evaluated first. The assertions of each model are
+        only evaluated individually if it fails so that the exception names the
+        failed assertions.
+        """
+        try:
+            holds = self.hold([vector])[0]
+        except (TypeError, ValueError):
+            holds = False
+
+        if not holds:
+            arguments = dict(zip(self.priors, vector))
+            for model in self.models:
+                assert_assertions(model, arguments)
+
+
+class CompiledModel:
+    def __init__(self, model):
+        """
+        A plan for creating instances of a model from a vector of physical values.
+
+        The order of priors, the constructor arguments of every class and the way
+        models are nested are resolved once when the plan is compiled. Creating an
+        instance then only requires the vector to be indexed rather than the model
+        tree to be traversed.
+
+        The plan is only valid for as long as the model is not changed. Use
+        `AbstractPriorModel.compile` which recompiles the plan as required.
+
+        Parameters
+        ----------
+        model
+            The model for which instances are created
+        """
+        self.model = model
+        self.priors = [
+            prior_tuple.prior
+            for prior_tuple
+            in model.prior_tuples_ordered_by_id
+        ]
+        self.promise_count = model.promise_count
+
+        self.lower_limits = np.array([prior.lower_limit for prior in self.priors])
+        self.upper_limits = np.array([prior.upper_limit for prior in self.priors])
+
+        self._indices = {
+            prior: index
+            for index, prior
+            in enumerate(self.priors)
+        }
+        self._requires_arguments = False
+        self._asserted_models = list()
+        self.assertions = None
+        self._factory = self._factory_for(model)
+        self.assertions = CompiledAssertions(
+            self._asserted_models,
+            self.priors
+        )
+
+        self._view_factory = None
+
+    @property
+    def prior_count(self):
+        return len(self.priors)
+
+    def instance_from_vector(
+            self,
+            vector,
+            assert_priors_in_limits=True,
+            view=False
+    ):
+        """
+        Create an instance of the model from a vector of physical values ordered
+        by prior id.
+
+        Parameters
+        ----------
+        vector: [float]
+            A vector of physical parameter values that is mapped to an instance.
+        assert_priors_in_limits
+            If `True` it is checked that the physical values of priors are within set limits.
+            Unlike `AbstractPriorModel.instance_from_vector` configuration is not checked
+            so the caller is responsible for resolving ignore_prior_limits.
+        view
+            If `True` a view of the vector is returned. The classes of the model are not
+            constructed. Instead every object in the view subclasses the corresponding
+            class and reads its attributes directly from the vector. Attributes which a
+            constructor computes from its arguments are therefore not available, and
+            the view must not be used once the vector has been changed.
+
+        Returns
+        -------
+        An instance of the model
+        """
+        if self.promise_count > 0:
+            raise exc.PriorException(
+                "All promises must be populated prior to instantiation"
+            )
+        self.assert_valid(vector, assert_priors_in_limits=assert_priors_in_limits)
+
+        arguments = None
+        if self._requires_arguments:
+            arguments = dict(zip(self.priors, vector))
+
+        if view:
+            if self._view_factory is None:
+                self._view_factory = self._view_factory_for(self.model)
+            return self._view_factory(vector, arguments)
+
+        return self._factory(vector, arguments)
+
+    def assertions_hold(self, vectors):
+        """
+        Evaluate the assertions of the model for a batch of parameter vectors
+        without creating any instances.
+
+        Parameters
+        ----------
+        vectors
+            A 2D array of physical values with one row per vector and one column per
+            prior ordered by id.
+
+        Returns
+        -------
+        A boolean array which is True for vectors satisfying every assertion
+        """
+        return self.assertions.hold(vectors)
+
+    def assert_valid(self, vector, assert_priors_in_limits=True):
+        """
+        Check a vector lies within the limits of its priors and satisfies every assertion
+        of the model, as is checked before an instance is created.
+
+        Raises
+        ------
+        exc.FitException
+            If a value lies outside the limits of its prior or an assertion fails
+        """
+        if assert_priors_in_limits:
+            self.assert_within_limits(vector)
+        if len(self._asserted_models) > 0:
+            self.assertions.assert_hold(vector)
+
+    def assert_within_limits(self, vector):
+        """
+        Check every value in a vector lies within the limits of its prior with a single
+        array comparison.
+
+        Raises
+        ------
+        exc.PriorLimitException
+            If any value lies outside the limits of its prior
+        """
+        try:
+            values = np.asarray(vector, dtype="float")
+        except (TypeError, ValueError):
+            values = None
+
+        if values is None or values.shape != self.lower_limits.shape:
+            for prior, value in zip(self.priors, vector):
+                if isinstance(value, Number):
+                    prior.assert_within_limits(value)
+            return
+
+        outside = ~((self.lower_limits <= values) & (values <= self.upper_limits))
+        if outside.any():
+            index = int(np.argmax(outside))
+            self.priors[index].assert_within_limits(vector[index])
+
+    def _factory_for(self, obj):
+        """
+        Create a function which takes a vector and an optional dictionary mapping
+        priors to values and returns the value obj takes in an instance.
+        """
+
+        if isinstance(obj, Prior):
+            return _component(self._indices[obj])
+        if not isinstance(obj, AbstractPriorModel):
+            return _constant(obj)
+
+        # noinspection PyProtectedMember
+        instance_for_arguments = type(obj)._instance_for_arguments
+        if instance_for_arguments is PriorModel._instance_for_arguments:
+            return self._prior_model_factory(obj)
+        if instance_for_arguments is CollectionPriorModel._instance_for_arguments:
+            return self._collection_factory(obj)
+        return self._fallback_factory(obj)
+
+    def _fallback_factory(self, obj):
+        """
+        Models which are not plain prior models or collections, such as compound
+        priors, are created from a dictionary of arguments in the usual way. Prior
+        limits have already been checked for the whole vector.
+        """
+        self._requires_arguments = True
+
+        if type(obj).instance_for_arguments is not AbstractPriorModel.instance_for_arguments:
+            return lambda vector, arguments: obj.instance_for_arguments(arguments)
+        return lambda vector, arguments: obj.instance_for_arguments(
+            arguments,
+            assert_priors_in_limits=False
+        )
+
+    def _register_assertions(self, obj):
+        """
+        Record obj if it has assertions so they can be compiled together.
+        """
+        # noinspection PyProtectedMember
+        if self.assertions is None and len(obj._assertions) > 0:
+            self._asserted_models.append(obj)
+
+    def _tuple_prior_factory(self, tuple_prior: TuplePrior):
+        factories = [
+            self._factory_for(value)
+            for _, value
+            in sorted(
+                tuple_prior.prior_tuples + tuple_prior.instance_tuples,
+                key=lambda tup: tup[0],
+            )
+        ]
+
+        def factory(vector, arguments):
+            return tuple(
+                f(vector, arguments)
+                for f in factories
+            )
+
+        return factory
+
+    def _prior_model_factory(self, prior_model):
+        self._register_assertions(prior_model)
+        argument_names = prior_model.constructor_argument_names
+
+        factories = dict()
+        for key, value in prior_model.__dict__.items():
+            if key in argument_names:
+                factories[key] = _constant(value)
+        for name, tuple_prior in prior_model.tuple_prior_tuples:
+            factories[name] = self._tuple_prior_factory(tuple_prior)
+        for name, child in prior_model.direct_prior_model_tuples:
+            factories[name] = self._factory_for(child)
+        for name, prior in prior_model.direct_prior_tuples:
+            factories[name] = self._factory_for(prior)
+
+        attribute_factories = [
+            (
+                key,
+                self._factory_for(value)
+                if isinstance(value, PriorModel)
+                else _constant(value)
+            )
+            for key, value in prior_model.__dict__.items()
+            if key != "_structure_cache"
+               and not isinstance(value, Prior)
+               and not isinstance(value, Promise)
+        ]
+
+        cls = prior_model.cls
+        is_deferred_arguments = prior_model.is_deferred_arguments
+        is_class = inspect.isclass(cls)
+        if not is_class:
+            # noinspection PyProtectedMember
+            result_class = inspect._findclass(cls)
+
+        def factory(vector, arguments):
+            constructor_arguments = {
+                name: f(vector, arguments)
+                for name, f in factories.items()
+            }
+
+            if is_deferred_arguments:
+                return DeferredInstance(cls, constructor_arguments)
+
+            if is_class:
+                result = cls(**constructor_arguments)
+            else:
+                result = object.__new__(result_class)
+                cls(result, **constructor_arguments)
+
+            for key, f in attribute_factories:
+                if not hasattr(result, key):
+                    try:
+                        setattr(result, key, f(vector, arguments))
+                    except AttributeError:
+                        pass
+
+            return result
+
+        return factory
+
+    def _collection_factory(self, collection):
+        self._register_assertions(collection)
+
+        item_factories = list()
+        for key, value in collection.__dict__.items():
+            if key == "_structure_cache":
+                continue
+            if isinstance(value, Prior):
+                # Collections interpret the argument for a direct prior as a unit value
+                item_factory = _unit_component(
+                    value,
+                    self._indices[value]
+                )
+            elif isinstance(value, AbstractPriorModel):
+                item_factory = self._factory_for(value)
+            else:
+                item_factory = _constant(value)
+            item_factories.append((key, item_factory))
+
+        def factory(vector, arguments):
+            result = ModelInstance()
+            for key, f in item_factories:
+                setattr(result, key, f(vector, arguments))
+            return result
+
+        return factory
+
+    def _view_factory_for(self, obj):
+        """
+        Create a function which takes a vector and an optional dictionary mapping
+        priors to values and returns a view of the vector for obj.
+
+        Objects which cannot be viewed are created as usual.
+        """
+        if isinstance(obj, Prior):
+            return _component(self._indices[obj])
+        if not isinstance(obj, AbstractPriorModel):
+            return _constant(obj)
+
+        # noinspection PyProtectedMember
+        instance_for_arguments = type(obj)._instance_for_arguments
+        if instance_for_arguments is PriorModel._instance_for_arguments:
+            return self._prior_model_view_factory(obj)
+        if instance_for_arguments is CollectionPriorModel._instance_for_arguments:
+            return self._collection_view_factory(obj)
+        return self._fallback_factory(obj)
+
+    def _prior_model_view_factory(self, prior_model):
+        cls = prior_model.cls
+        if prior_model.is_deferred_arguments or not inspect.isclass(cls):
+            return self._prior_model_factory(prior_model)
+
+        argument_names = prior_model.constructor_argument_names
+
+        getters = dict()
+        children = dict()
+        constants = dict()
+        for key, value in prior_model.__dict__.items():
+            if key in argument_names:
+                constants[key] = value
+        for name, tuple_prior in prior_model.tuple_prior_tuples:
+            children[name] = self._tuple_prior_factory(tuple_prior)
+        for name, child in prior_model.direct_prior_model_tuples:
+            children[name] = self._view_factory_for(child)
+        for name, prior in prior_model.direct_prior_tuples:
+            getters[name] = self._view_factory_for(prior)
+
+        # Arguments which are not part of the model take their default values
+        arg_spec = inspect.getfullargspec(cls)
+        for key, value in zip(
+                reversed(arg_spec.args),
+                reversed(arg_spec.defaults or ())
+        ):
+            if key not in getters and key not in children:
+                constants.setdefault(key, value)
+
+        for key, value in prior_model.__dict__.items():
+            if key == "_structure_cache" \
+                    or key in getters \
+                    or key in children \
+                    or key in constants \
+                    or isinstance(value, (Prior, Promise)) \
+                    or hasattr(cls, key):
+                continue
+            if isinstance(value, PriorModel):
+                children[key] = self._view_factory_for(value)
+            else:
+                constants[key] = value
+
+        try:
+            return view_class(
+                cls,
+                getters,
+                constants,
+                children
+            )
+        except TypeError:
+            return self._prior_model_factory(prior_model)
+
+    def _collection_view_factory(self, collection):
+        keys = list()
+        getters = dict()
+        children = dict()
+        constants = dict()
+        for key, value in collection.__dict__.items():
+            if key == "_structure_cache":
+                continue
+            keys.append(key)
+            if isinstance(value, Prior):
+                getters[key] = _unit_component(
+                    value,
+                    self._indices[value]
+                )
+            elif isinstance(value, AbstractPriorModel):
+                children[key] = self._view_factory_for(value)
+            else:
+                constants[key] = value
+
+        return collection_view_class(
+            keys,
+            getters,
+            constants,
+            children
+        )
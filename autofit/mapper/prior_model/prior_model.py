@@ -1,4 +1,3 @@
-import copy
 import inspect
 import logging
 
@@ -269,7 +268,8 @@ class PriorModel(AbstractPriorModel):
 
         for key, value in self.__dict__.items():
             if (
-                    not hasattr(result, key)
+                    key != "_structure_cache"
+                    and not hasattr(result, key)
                     and not isinstance(value, Prior)
                     and not isinstance(value, Promise)
             ):
@@ -299,27 +299,4 @@ class PriorModel(AbstractPriorModel):
         new_model: ModelMapper
             A new model mapper populated with Gaussian priors
         """
-        new_model = copy.deepcopy(self)
-        new_model._assertions = list()
-
-        model_arguments = {t.name: arguments[t.prior] for t in self.direct_prior_tuples}
-
-        for tuple_prior_tuple in self.tuple_prior_tuples:
-            setattr(
-                new_model,
-                tuple_prior_tuple.name,
-                tuple_prior_tuple.prior.gaussian_tuple_prior_for_arguments(arguments),
-            )
-        for prior_tuple in self.direct_prior_tuples:
-            setattr(new_model, prior_tuple.name, model_arguments[prior_tuple.name])
-        for instance_tuple in self.instance_tuples:
-            setattr(new_model, instance_tuple.name, instance_tuple.instance)
-
-        for name, prior_model in self.direct_prior_model_tuples:
-            setattr(
-                new_model,
-                name,
-                prior_model.gaussian_prior_model_for_arguments(arguments),
-            )
-
-        return new_model
+        return self.clone(arguments, keep_assertions=False)
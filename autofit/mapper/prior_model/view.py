@@ -0,0 +1,144 @@
+from autofit.mapper.model import ModelInstance
+
+
+def _view_init(self, vector, arguments):
+    self._vector = vector
+    self._arguments = arguments
+    self._children = {
+        key: factory(vector, arguments)
+        for key, factory in self._child_factories
+    }
+
+
+def _getter(factory):
+    return property(
+        lambda self: factory(self._vector, self._arguments)
+    )
+
+
+def _child(key):
+    return property(
+        lambda self: self._children[key]
+    )
+
+
+def view_class(base, getters, constants, children=None, name=None):
+    """
+    Create a class whose instances are views of a parameter vector.
+
+    The class subclasses base so that methods and isinstance checks work as they would
+    for a normal instance. However, the constructor of base is never called. Instead
+    attributes are properties which read directly from the vector the view was created
+    for. Children, such as views of nested models and tuples, are created once with the
+    view and the same object is returned every time they are accessed.
+
+    Parameters
+    ----------
+    base
+        The class for which views are created
+    getters
+        A dictionary mapping attribute names to functions which take a vector and an
+        optional dictionary of arguments and return the value of the attribute
+    constants
+        A dictionary mapping attribute names to values which are the same for every view
+    children
+        A dictionary mapping attribute names to functions like getters whose values are
+        computed once when a view is created
+    name
+        The name of the class
+
+    Returns
+    -------
+    A class which is constructed with a vector and an optional dictionary of arguments
+
+    The names of every attribute are given by the class attribute _view_keys, which
+    functions that traverse instances use in place of __dict__.
+
+    Raises
+    ------
+    TypeError
+        If base cannot be subclassed in this way
+    """
+    children = children or dict()
+    namespace = {
+        "__init__": _view_init,
+        "_child_factories": tuple(children.items()),
+        "_view_keys": tuple(
+            key
+            for key in (*getters, *constants, *children)
+            if not key.startswith("_")
+        ),
+        **constants,
+        **{
+            key: _getter(getter)
+            for key, getter in getters.items()
+        },
+        **{
+            key: _child(key)
+            for key in children
+        }
+    }
+    return type(
+        name or f"{base.__name__}View",
+        (base,),
+        namespace
+    )
+
+
+class CollectionView(ModelInstance):
+    """
+    A ModelInstance which is a view of a parameter vector.
+
+    @DynamicAttrs
+    """
+
+    _view_keys = ()
+
+    def __getitem__(self, item):
+        if isinstance(item, str):
+            return getattr(self, item)
+        return super().__getitem__(item)
+
+    def __eq__(self, other):
+        return self.dict == other.dict
+
+    @property
+    def dict(self):
+        return {
+            key: getattr(self, key)
+            for key in self._view_keys
+        }
+
+
+def collection_view_class(keys, getters, constants, children=None):
+    """
+    Create a class whose instances are views of a parameter vector that behave like
+    the ModelInstance created for a collection.
+
+    Parameters
+    ----------
+    keys
+        The names of every item in the collection, in order
+    getters
+        A dictionary mapping names to functions which compute the value of an item
+    constants
+        A dictionary mapping names to items which are the same for every view
+    children
+        A dictionary mapping names to functions which compute items once per view
+    """
+    keys = tuple(
+        key
+        for key in keys
+        if key not in ("id", "component_number", "item_number")
+        and not key.startswith("_")
+    )
+    return view_class(
+        CollectionView,
+        getters,
+        {
+            **constants,
+            "_view_keys": keys
+        },
+        children=children,
+        name="CollectionView"
+    )
@@ -6,24 +6,38 @@ import os
 import pickle
 import shutil
 from abc import ABC, abstractmethod
-from time import sleep
-from typing import Dict
+from functools import partial, reduce
+from typing import Dict, Optional
 
 import numpy as np
 
 from autoconf import conf
 from autofit import exc
 from autofit.mapper import model_mapper as mm
+from autofit.non_linear.background import BackgroundUpdater
 from autofit.non_linear.initializer import Initializer
+from autofit.non_linear.likelihood_cache import LikelihoodCache
 from autofit.non_linear.log import logger
 from autofit.non_linear.paths import Paths, convert_paths
+from autofit.non_linear.pool import WorkerPool, shared_object
 from autofit.non_linear import samples as samps
 from autofit.non_linear.timer import Timer
 from autofit.text import formatter
 from autofit.text import text_util
 
 
+def _take_from_likelihood_cache(key):
+    likelihood_cache = shared_object(key).likelihood_cache
+    return (likelihood_cache.take_pending(), *likelihood_cache.take_counts())
+
+
 class NonLinearSearch(ABC):
+
+    # If True, the samples of this search only ever grow by new samples being added after the existing ones, so
+    # each update appends the new samples given by samples_via_sampler_since to the samples files instead of
+    # rewriting every sample.
+    appends_samples = False
+
     @convert_paths
     def __init__(
             self,
@@ -63,6 +77,7 @@ class NonLinearSearch(ABC):
         self.timer = Timer(paths=paths)
 
         self.force_pickle_overwrite = conf.instance["general"]["output"]["force_pickle_overwrite"]
+        self.samples_to_csv = conf.instance["general"]["output"]["samples_to_csv"]
 
         self.log_file = conf.instance["general"]["output"]["log_file"].replace(
             " ", ""
@@ -92,6 +107,7 @@ class NonLinearSearch(ABC):
         self.remove_state_files_at_end = self._config(
             "updates", "remove_state_files_at_end",
         )
+        self.async_updates = self._config("updates", "async_updates")
 
         self.iterations = 0
         self.should_log = IntervalCounter(self.log_every_update)
@@ -131,6 +147,111 @@ class NonLinearSearch(ABC):
             self.log_likelihood_cap = log_likelihood_cap
             self.pool_ids = pool_ids
 
+            # Resolved once so that configuration is not read for every sample.
+            self.assert_priors_in_limits = not conf.instance["general"]["model"]["ignore_prior_limits"]
+            self.view_instances = getattr(analysis, "view_instances", False)
+
+            self.likelihood_cache = self.likelihood_cache_from_analysis(analysis=analysis)
+
+            self.shared_key = None
+
+        def likelihood_cache_from_analysis(self, analysis):
+            """
+            Create the cache of log likelihoods requested by the analysis, loading any log likelihoods persisted by a
+            previous run of the search. Returns None if the analysis does not request a cache.
+            """
+            size = getattr(analysis, "likelihood_cache_size", 0)
+            if size <= 0:
+                return None
+
+            filename = None
+            if getattr(analysis, "persist_likelihood_cache", False) and self.paths is not None:
+                filename = self.paths.likelihood_cache_file
+
+            likelihood_cache = LikelihoodCache(
+                size=size,
+                decimals=getattr(analysis, "likelihood_cache_decimals", None),
+                filename=filename
+            )
+            likelihood_cache.load(prior_count=self.model.prior_count)
+            return likelihood_cache
+
+        def cached_log_likelihood(self, parameters) -> Optional[float]:
+            """
+            The log likelihood of a parameter vector held by the likelihood cache, or None if it is not cached.
+
+            If the cache rounds vectors before lookup, the vector is first checked against the limits of its priors and
+            the assertions of the model. A vector which would be rejected is therefore never given the log likelihood of
+            a nearby vector which was accepted.
+
+            Raises
+            ------
+            exc.FitException
+                If the cache rounds vectors and the vector would be rejected
+            """
+            if self.likelihood_cache is None:
+                return None
+            if self.likelihood_cache.decimals is not None:
+                self.model.compile().assert_valid(
+                    parameters,
+                    assert_priors_in_limits=self.assert_priors_in_limits
+                )
+            return self.likelihood_cache.get(parameters)
+
+        def flush_likelihood_cache(self, pool: Optional[WorkerPool] = None):
+            """
+            Append the log likelihoods computed since the last flush to the file of the likelihood cache, if it is
+            persisted.
+
+            The log likelihoods, hits and misses of the workers of a pool this fitness function was shared with are
+            collected from them. Only this process writes to the file, and the hits and misses of the likelihood cache
+            of this process count every lookup of the search.
+            """
+            if self.likelihood_cache is None:
+                return
+
+            rows = list()
+            if pool is not None and self.shared_key is not None:
+                for worker_rows, hits, misses in pool.broadcast(_take_from_likelihood_cache, self.shared_key):
+                    rows.extend(worker_rows)
+                    self.likelihood_cache.hits += hits
+                    self.likelihood_cache.misses += misses
+            self.likelihood_cache.flush(rows=rows)
+
+        def share(self, pool: WorkerPool):
+            """
+            Send this fitness function, including the analysis and its data, to every worker of a pool once.
+
+            Once shared, the fitness function is pickled as a key which workers use to look up their copy, so that
+            tasks sent to the pool no longer carry the analysis. Arrays named in the analysis's `shared_arrays` are
+            placed in shared memory rather than copied to every worker.
+            """
+            self.shared_key = None
+            self.shared_key = pool.share(
+                self,
+                arrays=[
+                    reduce(getattr, name.split("."), self.analysis)
+                    for name in getattr(self.analysis, "shared_arrays", ())
+                ]
+            )
+
+        def release(self, pool: WorkerPool):
+            """
+            Remove this fitness function, and the shared memory holding its arrays, from the workers of the pool it
+            was shared with. Log likelihoods the workers computed for a persisted likelihood cache are written first.
+            """
+            if self.shared_key is not None:
+                try:
+                    self.flush_likelihood_cache(pool=pool)
+                finally:
+                    pool.release(self.shared_key)
+                    self.shared_key = None
+
+        def __reduce_ex__(self, protocol):
+            if self.shared_key is not None:
+                return shared_object, (self.shared_key,)
+            return super().__reduce_ex__(protocol)
+
         def fit_instance(self, instance):
 
             log_likelihood = self.analysis.log_likelihood_function(instance=instance)
@@ -149,9 +270,24 @@ class NonLinearSearch(ABC):
 
             return log_likelihood
 
+        def instance_from_parameters(self, parameters):
+            return self.model.compile().instance_from_vector(
+                vector=parameters,
+                assert_priors_in_limits=self.assert_priors_in_limits,
+                view=self.view_instances
+            )
+
         def log_likelihood_from_parameters(self, parameters):
-            instance = self.model.instance_from_vector(vector=parameters)
+            log_likelihood = self.cached_log_likelihood(parameters)
+            if log_likelihood is not None:
+                return log_likelihood
+
+            instance = self.instance_from_parameters(parameters=parameters)
             log_likelihood = self.fit_instance(instance)
+
+            if self.likelihood_cache is not None:
+                self.likelihood_cache.add(parameters, log_likelihood)
+
             return log_likelihood
 
         def log_posterior_from_parameters(self, parameters):
@@ -159,6 +295,86 @@ class NonLinearSearch(ABC):
             log_priors = self.model.log_priors_from_vector(vector=parameters)
             return log_likelihood + sum(log_priors)
 
+        @property
+        def has_log_likelihood_batch(self) -> bool:
+            """
+            Whether the analysis implements `log_likelihood_batch`, such that many points can be evaluated in one call.
+            """
+            log_likelihood_batch = getattr(type(self.analysis), "log_likelihood_batch", None)
+            return log_likelihood_batch is not None and log_likelihood_batch is not Analysis.log_likelihood_batch
+
+        def fit_instances(self, instances, parameters):
+
+            log_likelihoods = np.asarray(
+                self.analysis.log_likelihood_batch(instances=instances, parameters=parameters),
+                dtype="float"
+            )
+
+            if self.log_likelihood_cap is not None:
+                log_likelihoods = np.minimum(log_likelihoods, self.log_likelihood_cap)
+
+            if len(log_likelihoods) > 0 and not np.all(np.isnan(log_likelihoods)):
+
+                max_log_likelihood = np.nanmax(log_likelihoods)
+
+                if max_log_likelihood > self.max_log_likelihood:
+
+                    if self.pool_ids is None or mp.current_process().pid == min(self.pool_ids):
+                        self.max_log_likelihood = max_log_likelihood
+
+            return log_likelihoods
+
+        def log_likelihoods_from_parameters_batch(self, parameters):
+            """
+            Compute the log likelihood of every point in an array of parameters with a single call to the analysis's
+            `log_likelihood_batch`.
+
+            Points for which no instance can be created (e.g. because an assertion fails or a prior limit is exceeded)
+            are not passed to the analysis and are given a log likelihood of NaN, as are any points the analysis
+            returns NaN for. Searches resample these points.
+
+            Parameters
+            ----------
+            parameters : np.ndarray
+                An array of shape (total_points, prior_count) of physical parameter values.
+
+            Returns
+            -------
+            An array of the log likelihood of every point.
+            """
+            parameters = np.asarray(parameters, dtype="float")
+            log_likelihoods = np.full(len(parameters), np.nan)
+
+            instances = []
+            indexes = []
+
+            for index, vector in enumerate(parameters):
+                try:
+                    log_likelihood = self.cached_log_likelihood(vector)
+                    if log_likelihood is not None:
+                        log_likelihoods[index] = log_likelihood
+                        continue
+                    instances.append(self.instance_from_parameters(parameters=vector))
+                    indexes.append(index)
+                except exc.FitException:
+                    pass
+
+            if len(indexes) > 0:
+                log_likelihoods[indexes] = self.fit_instances(
+                    instances=instances, parameters=parameters[indexes]
+                )
+
+                if self.likelihood_cache is not None:
+                    for index in indexes:
+                        self.likelihood_cache.add(parameters[index], log_likelihoods[index])
+
+            return log_likelihoods
+
+        def log_posteriors_from_parameters_batch(self, parameters):
+            log_likelihoods = self.log_likelihoods_from_parameters_batch(parameters=parameters)
+            log_priors = self.model.log_priors_from_vectors(vectors=parameters)
+            return log_likelihoods + np.sum(log_priors, axis=1)
+
         def figure_of_merit_from_parameters(self, parameters):
             """The figure of merit is the value that the `NonLinearSearch` uses to sample parameter space. This varies
             between different `NonLinearSearch`s, for example:
@@ -258,17 +474,21 @@ class NonLinearSearch(ABC):
             samples = self.perform_update(
                 model=model, analysis=analysis, during_analysis=False
             )
+            self._fitness_function = None
 
             analysis.save_results_for_aggregator(paths=self.paths, samples=samples)
 
         else:
 
             logger.info(f"{self.paths.name} already completed, skipping non-linear search.")
-            samples = self.samples_via_csv_json_from_model(model=model)
 
             if self.force_pickle_overwrite:
+                samples = self.samples_via_csv_json_from_model(model=model)
                 self.save_samples(samples=samples)
+                self.save_samples_summary(samples=samples)
                 analysis.save_results_for_aggregator(paths=self.paths, samples=samples)
+            else:
+                samples = self.lazy_samples_from_model(model=model)
 
         self.paths.zip_remove()
         return Result(samples=samples, previous_model=model, search=self)
@@ -335,6 +555,13 @@ class NonLinearSearch(ABC):
         These task are performed every n updates, set by the relevent *task_every_update* variable, for example
         *visualize_every_update*
 
+        The samples are always computed immediately. If *async_updates* is True, the samples files of updates during
+        the analysis are written on a background thread while the non-linear search continues. Only the most recent of
+        any writes waiting for the background thread is performed. Visualization and the model results are always
+        output on the calling thread, because pyplot is not thread safe and creating instances uses the caches of the
+        model, which the search also uses. The final update waits for the background thread and is performed
+        immediately.
+
         Parameters
         ----------
         model : ModelMapper
@@ -351,22 +578,160 @@ class NonLinearSearch(ABC):
         logger.info(f"{self.iterations} Iterations: Performing update (Visualization, outputting samples, etc.).")
 
         self.timer.update()
+        self.flush_likelihood_cache()
 
         samples = self.samples_via_sampler_from_model(model=model)
-        samples.write_table(filename=self.paths.samples_file)
+
+        # The samples taken since those already written are read from the sampler here rather than on the background
+        # thread, which must not use the sampler while it continues
+        new_samples_start = None
+        new_samples = None
+        if self.appends_samples:
+            new_samples_start = getattr(self, "_samples_offset", None) or 0
+            new_samples = self.samples_via_sampler_since(model=model, start=new_samples_start)
+
+        visualize = self.should_visualize() or not during_analysis
+        output_model_results = self.should_output_model_results() or not during_analysis
+
+        if during_analysis and self.async_updates:
+            self.updater.submit(
+                self.output_samples,
+                samples=samples,
+                during_analysis=during_analysis,
+                new_samples=new_samples,
+                new_samples_start=new_samples_start,
+            )
+            self.output_results(
+                samples=samples,
+                analysis=analysis,
+                during_analysis=during_analysis,
+                visualize=visualize,
+                output_model_results=output_model_results,
+            )
+        else:
+            self.wait_for_updates()
+            self.output_update(
+                samples=samples,
+                analysis=analysis,
+                during_analysis=during_analysis,
+                visualize=visualize,
+                output_model_results=output_model_results,
+                new_samples=new_samples,
+                new_samples_start=new_samples_start,
+            )
+
+        return samples
+
+    def flush_likelihood_cache(self):
+        """
+        Collect the hits and misses of the likelihood cache of the fitness function of the search in progress, and
+        write the log likelihoods computed since the last update if the cache is persisted.
+        """
+        fitness_function = getattr(self, "_fitness_function", None)
+        if fitness_function is None or fitness_function.likelihood_cache is None:
+            return
+
+        pool = None
+        if fitness_function.shared_key is not None:
+            pool, _ = self.make_pool()
+        fitness_function.flush_likelihood_cache(pool=pool)
+
+        logger.info(f"Likelihood cache: {fitness_function.likelihood_cache}")
+
+    @property
+    def updater(self) -> BackgroundUpdater:
+        """
+        Performs the output of updates on a background thread when *async_updates* is True.
+        """
+        if getattr(self, "_updater", None) is None:
+            self._updater = BackgroundUpdater(name=f"{self.paths.name} update")
+        return self._updater
+
+    def wait_for_updates(self):
+        """
+        Block until every update being performed on the background thread is complete.
+        """
+        if getattr(self, "_updater", None) is not None:
+            self._updater.wait()
+
+    def output_update(
+            self,
+            samples,
+            analysis,
+            during_analysis,
+            visualize,
+            output_model_results,
+            new_samples=None,
+            new_samples_start=None,
+    ):
+        """
+        Output the samples of an update and visualize and output the results of its maximum log likelihood model.
+
+        Parameters
+        ----------
+        samples : OptimizerSamples
+            The samples of the non-linear search at the update.
+        analysis : Analysis
+            The analysis used to visualize the maximum log likelihood model.
+        during_analysis : bool
+            If the update is during a non-linear search.
+        visualize : bool
+            Whether the maximum log likelihood model is visualized.
+        output_model_results : bool
+            Whether the model.results and search summary files are output.
+        new_samples : SampleArrays
+            The samples taken by the sampler after its first new_samples_start samples, see write_samples.
+        new_samples_start : int
+            The index of the first of the new samples.
+        """
+        self.output_samples(
+            samples=samples,
+            during_analysis=during_analysis,
+            new_samples=new_samples,
+            new_samples_start=new_samples_start,
+        )
+        self.output_results(
+            samples=samples,
+            analysis=analysis,
+            during_analysis=during_analysis,
+            visualize=visualize,
+            output_model_results=output_model_results,
+        )
+
+    def output_samples(self, samples, during_analysis, new_samples=None, new_samples_start=None):
+        """
+        Write the samples files of an update. This may be performed on a background thread, so it must not use the
+        sampler or create instances of the model.
+        """
+        self.write_samples(
+            samples=samples,
+            new_samples=new_samples,
+            new_samples_start=new_samples_start
+        )
         samples.info_to_json(filename=self.paths.info_file)
 
-        self.save_samples(samples=samples)
+        # During the search the samples are only written to the samples files, from which the aggregator reads the
+        # samples of a search which did not complete. Everything computed from all of the samples is written once the
+        # search is complete.
+        if not during_analysis:
+            self.save_samples_summary(samples=samples)
+            self.write_equal_weight_samples(samples=samples)
+            self.save_samples(samples=samples)
 
+    def output_results(self, samples, analysis, during_analysis, visualize, output_model_results):
+        """
+        Visualize and output the results of the maximum log likelihood model of an update. This is always performed on
+        the thread which performs the update, as `Analysis.visualize` need not be thread safe.
+        """
         try:
             instance = samples.max_log_likelihood_instance
         except exc.FitException:
-            return samples
+            return
 
-        if self.should_visualize() or not during_analysis:
+        if visualize:
             analysis.visualize(paths=self.paths, instance=instance, during_analysis=during_analysis)
 
-        if self.should_output_model_results() or not during_analysis:
+        if output_model_results:
 
             text_util.results_to_file(
                 samples=samples,
@@ -382,8 +747,6 @@ class NonLinearSearch(ABC):
             except FileNotFoundError:
                 pass
 
-        return samples
-
     def setup_log_file(self):
 
         if conf.instance["general"]["output"]["log_to_file"]:
@@ -451,6 +814,137 @@ class NonLinearSearch(ABC):
         with open(self.paths.make_model_pickle_path(), "w+b") as f:
             f.write(pickle.dumps(model))
 
+    def samples_via_sampler_since(self, model, start: int) -> Optional[samps.SampleArrays]:
+        """
+        The samples taken by the sampler after its first start samples, built from the state of the sampler without
+        building the earlier samples again.
+
+        Searches which set appends_samples override this. None is returned if the new samples are not available,
+        in which case every sample is written again.
+
+        Parameters
+        ----------
+        model
+            The model which generates instances for different points in parameter space.
+        start
+            The number of samples taken by the sampler which are not included.
+        """
+        return None
+
+    def write_samples(self, samples, new_samples=None, new_samples_start=None):
+        """
+        Write the samples to the binary samples file and, if samples_to_csv is set in the general config, export
+        them as a CSV table.
+
+        If the search appends samples (see appends_samples) the number of samples in the files is kept between
+        updates, and only the new samples taken by the sampler since then are appended to the files, so the cost of
+        an update does not grow with the length of the run. When the files were written by a previous process,
+        their last sample is compared to the samples once to check that they can be appended to.
+
+        Parameters
+        ----------
+        samples
+            Every sample taken by the search, which are written in full if the files are not appended to.
+        new_samples
+            The samples taken by the sampler after its first new_samples_start samples, as given by
+            samples_via_sampler_since.
+        new_samples_start
+            The index of the first of the new samples.
+        """
+        offset = getattr(self, "_samples_offset", None)
+        if offset is None and self.appends_samples and new_samples is not None:
+            offset = self._samples_written(samples=samples)
+
+        if new_samples is None or offset is None or not (
+                new_samples_start <= offset <= new_samples_start + len(new_samples)
+        ):
+            samples.write_binary(filename=self.paths.samples_binary_file)
+            if self.samples_to_csv:
+                samples.write_table(filename=self.paths.samples_file)
+            self._samples_offset = len(samples.samples) if self.appends_samples else None
+            return
+
+        appended = new_samples[offset - new_samples_start:]
+        appended.append_binary(filename=self.paths.samples_binary_file)
+        if self.samples_to_csv:
+            if path.exists(self.paths.samples_file):
+                samps.OptimizerSamples(
+                    model=samples.model,
+                    samples=appended
+                ).append_table(filename=self.paths.samples_file, start=0)
+            else:
+                samples.write_table(filename=self.paths.samples_file)
+        self._samples_offset = new_samples_start + len(new_samples)
+
+    def write_equal_weight_samples(self, samples):
+        """
+        Thin samples of a posterior to one equally weighted sample per effective sample, which are written to a
+        separate binary file so that they can be used without loading every sample.
+
+        This resamples every sample, so it is done once the search is complete rather than at every update.
+        """
+        if not isinstance(samples, samps.PDFSamples):
+            return
+        try:
+            thinned = samples.thin()
+        except ValueError:
+            # None of the samples have weight yet
+            return
+        thinned.samples.write_binary(filename=self.paths.samples_equal_weights_file)
+
+    def _samples_written(self, samples) -> Optional[int]:
+        """
+        The number of samples already in the binary samples file, or None if the file must be rewritten.
+
+        The file is rewritten unless the search appends samples and the last sample in the file is the sample at the
+        same index of the new samples.
+        """
+        if not self.appends_samples:
+            return None
+
+        try:
+            written = samps.load_from_binary(filename=self.paths.samples_binary_file)
+        except FileNotFoundError:
+            return None
+
+        total = len(written)
+        if written.paths != samples.samples.paths or total > len(samples.samples):
+            return None
+        if total > 0 and not np.array_equal(
+                written[total - 1:]._table(),
+                samples.samples[total - 1:total]._table(),
+                equal_nan=True
+        ):
+            return None
+        return total
+
+    def load_samples_table(self) -> samps.SampleArrays:
+        """
+        Load the samples written by write_samples, memory mapping the binary samples file. If there is no binary
+        file, as for results output by earlier versions, the CSV table is loaded instead.
+        """
+        try:
+            return samps.load_from_binary(filename=self.paths.samples_binary_file)
+        except FileNotFoundError:
+            return samps.load_from_table(filename=self.paths.samples_file)
+
+    def lazy_samples_from_model(self, model):
+        """
+        Samples of a completed search which give the values in the summary of the samples without loading them,
+        and are loaded by samples_via_csv_json_from_model when anything else is needed.
+
+        The samples are loaded straight away if no summary was written.
+        """
+        load = partial(self.samples_via_csv_json_from_model, model=model)
+        try:
+            return samps.LazySamples.from_json(
+                model=model,
+                filename=self.paths.samples_summary_file,
+                load=load
+            )
+        except FileNotFoundError:
+            return load()
+
     def save_samples(self, samples):
         """
         Save the final-result samples associated with the phase as a pickle
@@ -458,6 +952,16 @@ class NonLinearSearch(ABC):
         with open(self.paths.make_samples_pickle_path(), "w+b") as f:
             f.write(pickle.dumps(samples))
 
+    def save_samples_summary(self, samples):
+        """
+        Save a summary of the samples, including the Gaussian priors used for prior passing, which results and the
+        aggregator use without loading every sample.
+        """
+        samples.summary_to_json(
+            filename=self.paths.samples_summary_file,
+            sigma=self.prior_passer.sigma
+        )
+
     def save_metadata(self):
         """
         Save metadata associated with the phase, such as the name of the pipeline, the
@@ -501,13 +1005,13 @@ class NonLinearSearch(ABC):
         raise NotImplementedError()
 
     def make_pool(self):
-        """Make the pool instance used to parallelize a `NonLinearSearch` alongside a set of unique ids for every
+        """Get the pool instance used to parallelize a `NonLinearSearch` alongside a set of unique ids for every
         process in the pool. If the specified number of cores is 1, a pool instance is not made and None is returned.
 
-        The pool cannot be set as an attribute of the class itself because this prevents pickling, thus it is generated
-        via this function before calling the non-linear search.
+        The pool is shared by every search with the same number of cores, such that processes are started once and
+        reused by every search and phase of a pipeline.
 
-        The pool instance is also set up with a list of unique pool ids, which are used during model-fitting to
+        The pool instance also provides a list of unique pool ids, which are used during model-fitting to
         identify a 'master core' (the one whose id value is lowest) which handles model result output, visualization,
         etc."""
 
@@ -517,21 +1021,21 @@ class NonLinearSearch(ABC):
 
         else:
 
-            manager = mp.Manager()
-            idQueue = manager.Queue()
+            pool = WorkerPool.for_cores(self.number_of_cores)
 
-            [idQueue.put(i) for i in range(self.number_of_cores)]
-
-            pool = mp.Pool(
-                processes=self.number_of_cores, initializer=init, initargs=(idQueue,)
-            )
-            ids = pool.map(f, range(self.number_of_cores))
-
-            return pool, [id[1] for id in ids]
+            return pool, pool.ids
 
     def __eq__(self, other):
         return isinstance(other, NonLinearSearch) and self.__dict__ == other.__dict__
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_updater", None)
+        state.pop("_fitness_function", None)
+        # The number of samples written is checked against the samples files when a search is resumed
+        state.pop("_samples_offset", None)
+        return state
+
     def __setstate__(self, state):
         self.__dict__.update(state)
         self.paths.restore()
@@ -539,9 +1043,55 @@ class NonLinearSearch(ABC):
 
 class Analysis(ABC):
 
+    # If True, the instances passed to the log likelihood function are lightweight views which read their attributes
+    # directly from the parameter vector rather than newly constructed objects. This avoids creating objects for every
+    # sample but means attributes computed in the constructors of model classes are not available, and instances must
+    # not be kept beyond the call. The instances used for results and visualization are always constructed as usual.
+    view_instances = False
+
+    # The names of attributes holding large NumPy arrays, such as the data, which are placed in shared memory when the
+    # analysis is sent to the processes of a parallel search. Every process then reads the same memory rather than
+    # receiving its own copy. Names may be dotted paths (e.g. "dataset.image"). In the processes the arrays are
+    # read-only.
+    shared_arrays = ()
+
+    # The number of log likelihoods cached by the parameter vector they were computed for, such that evaluating the
+    # same point again (e.g. a rejected Emcee move or a repeated initializer draw) does not call the log likelihood
+    # function. A size of 0 disables the cache. If likelihood_cache_decimals is set, vectors are rounded to that many
+    # decimal places before lookup. If persist_likelihood_cache is True, the log likelihoods computed are also written to
+    # the samples folder at every update and loaded when the search is resumed, which is worthwhile for very expensive
+    # likelihoods. NaN log likelihoods are never cached.
+    # Only use the cache if the log likelihood function depends on nothing but the parameters.
+    likelihood_cache_size = 0
+    likelihood_cache_decimals = None
+    persist_likelihood_cache = False
+
     def log_likelihood_function(self, instance):
         raise NotImplementedError()
 
+    def log_likelihood_batch(self, instances, parameters):
+        """
+        Optional method computing the log likelihoods of many points in parameter space with a single call, for example
+        using a NumPy-vectorized likelihood.
+
+        If an analysis implements this method, searches which propose whole batches of points (the particles of
+        *PySwarms* and the walkers of *Emcee*) call it instead of calling `log_likelihood_function` once per point.
+        Otherwise `log_likelihood_function` is used.
+
+        Parameters
+        ----------
+        instances : [ModelInstance]
+            An instance of the model for every point.
+        parameters : np.ndarray
+            An array of shape (total_points, prior_count) containing the physical values of every point, ordered in
+            the same way as the model's priors are ordered by id.
+
+        Returns
+        -------
+        An array of the log likelihood of every point. Points which should be resampled may be given a value of NaN.
+        """
+        raise NotImplementedError()
+
     def visualize(self, paths : Paths, instance, during_analysis):
         pass
 
@@ -579,7 +1129,7 @@ class Result:
 
     @property
     def log_likelihood(self):
-        return max(self.samples.log_likelihoods)
+        return self.samples.max_log_likelihood
 
     @property
     def instance(self):
@@ -754,15 +1304,3 @@ class PriorPasser:
         use_errors = config("prior_passer", "use_errors")
         use_widths = config("prior_passer", "use_widths")
         return PriorPasser(sigma=sigma, use_errors=use_errors, use_widths=use_widths)
-
-
-def init(queue):
-    global idx
-    idx = queue.get()
-
-
-def f(x):
-    global idx
-    process = mp.current_process()
-    sleep(1)
-    return idx, process.pid, x * x
@@ -0,0 +1,92 @@
+import threading
+from functools import partial
+from typing import Callable, Optional
+
+from autofit.non_linear.log import logger
+
+
+class BackgroundUpdater:
+    def __init__(self, name: str = "update"):
+        """
+        Performs tasks, such as outputting the results of a `NonLinearSearch` update, on a background thread.
+
+        At most one task is performed and one task is pending at any time. If a task is submitted while another is
+        pending, the pending task is discarded in favour of the new one, such that a slow task (e.g. visualization)
+        never causes a backlog of stale updates.
+
+        An exception raised by a task is raised again in the submitting thread by the next call to `submit` or
+        `wait`.
+
+        Parameters
+        ----------
+        name
+            The name of the thread, used in logging.
+        """
+        self.name = name
+
+        self._condition = threading.Condition()
+        self._pending: Optional[Callable] = None
+        self._running = False
+        self._exception = None
+        self._thread = None
+
+    def submit(self, function: Callable, *args, **kwargs):
+        """
+        Submit a task to be performed on the background thread, replacing any task which has not yet started.
+        """
+        with self._condition:
+            self._raise()
+
+            if self._pending is not None:
+                logger.info(f"Skipping a pending {self.name} which was superseded before it started")
+
+            self._pending = partial(function, *args, **kwargs)
+
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name=self.name,
+                    daemon=True
+                )
+                self._thread.start()
+
+            self._condition.notify_all()
+
+    def wait(self):
+        """
+        Block until every submitted task has been performed.
+        """
+        with self._condition:
+            while self._pending is not None or self._running:
+                self._condition.wait()
+            self._raise()
+
+    @property
+    def is_idle(self) -> bool:
+        with self._condition:
+            return self._pending is None and not self._running
+
+    def _raise(self):
+        if self._exception is not None:
+            exception, self._exception = self._exception, None
+            raise exception
+
+    def _run(self):
+        while True:
+            with self._condition:
+                if self._pending is None:
+                    self._thread = None
+                    return
+                task, self._pending = self._pending, None
+                self._running = True
+
+            try:
+                task()
+            except Exception as e:
+                logger.exception(e)
+                with self._condition:
+                    self._exception = e
+            finally:
+                with self._condition:
+                    self._running = False
+                    self._condition.notify_all()
@@ -9,7 +9,7 @@ from autofit import exc
 from autofit.mapper import model_mapper as mm
 from autofit.mapper.prior import prior as p
 from autofit.non_linear.abstract_search import Result
-from autofit.non_linear.parallel import AbstractJob, Process, AbstractJobResult
+from autofit.non_linear.parallel import AbstractJob, AbstractJobResult, run_jobs
 from autofit.non_linear.paths import Paths
 
 
@@ -336,7 +336,7 @@ class GridSearch:
                 )
             )
 
-        for result in Process.run_jobs(
+        for result in run_jobs(
                 jobs,
                 self.number_of_cores
         ):
@@ -6,7 +6,7 @@ from typing import List, Generator, Callable, Type, Union, Tuple
 
 from autofit import AbstractPriorModel, ModelInstance, Paths, Result, Analysis, NonLinearSearch
 from autofit.non_linear.grid.grid_search import make_lists
-from autofit.non_linear.parallel import AbstractJob, Process, AbstractJobResult
+from autofit.non_linear.parallel import AbstractJob, AbstractJobResult, run_jobs
 
 
 class JobResult(AbstractJobResult):
@@ -182,7 +182,7 @@ class Sensitivity:
         a list of results.
         """
         results = list()
-        for result in Process.run_jobs(
+        for result in run_jobs(
                 self._make_jobs(),
                 number_of_cores=self.number_of_cores
         ):
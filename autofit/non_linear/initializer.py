@@ -4,6 +4,8 @@ from autofit import exc
 from autofit.non_linear.log import logger
 
 import configparser
+from itertools import compress
+
 import numpy as np
 
 class Initializer:
@@ -69,32 +71,59 @@ class Initializer:
         initial_parameters = []
         initial_figures_of_merit = []
 
-        point_index = 0
-
-        while point_index < total_points:
+        while len(initial_parameters) < total_points:
 
-            unit_parameters = model.random_unit_vector_within_limits(
-                lower_limit=self.lower_limit, upper_limit=self.upper_limit
+            unit_parameters_batch, parameters_batch = self.samples_from_model(
+                total_points=total_points - len(initial_parameters), model=model
             )
-            parameters = model.vector_from_unit_vector(unit_vector=unit_parameters)
 
-            try:
-                figure_of_merit = fitness_function.figure_of_merit_from_parameters(
-                    parameters=parameters
-                )
+            # Points which fail the model's assertions are rejected for the whole batch before any instance is created.
+            assertions_hold = model.compile().assertions_hold(parameters_batch)
+
+            for unit_parameters, parameters in zip(
+                    compress(unit_parameters_batch, assertions_hold), compress(parameters_batch, assertions_hold)
+            ):
 
-                if np.isnan(figure_of_merit):
-                    raise exc.FitException
+                try:
+                    figure_of_merit = fitness_function.figure_of_merit_from_parameters(
+                        parameters=parameters
+                    )
 
-                initial_unit_parameters.append(unit_parameters)
-                initial_parameters.append(parameters)
-                initial_figures_of_merit.append(figure_of_merit)
-                point_index += 1
-            except exc.FitException:
-                pass
+                    if np.isnan(figure_of_merit):
+                        raise exc.FitException
+
+                    initial_unit_parameters.append(unit_parameters)
+                    initial_parameters.append(parameters)
+                    initial_figures_of_merit.append(figure_of_merit)
+                except exc.FitException:
+                    pass
 
         return initial_unit_parameters, initial_parameters, initial_figures_of_merit
 
+    def samples_from_model(self, total_points, model):
+        """
+        Draw a batch of unit values from a uniform distribution between the lower_limit and upper_limit values and map
+        them to physical values via the model priors in one array operation.
+
+        Parameters
+        ----------
+        total_points : int
+            The number of points in non-linear paramemter space which are drawn.
+        model : ModelMapper
+            An object that represents possible instances of some model with a given dimensionality which is the number
+            of free dimensions of the model.
+
+        Returns
+        -------
+        A list of unit parameter vectors and a list of the corresponding physical parameter vectors.
+        """
+        unit_parameters = np.random.uniform(
+            low=self.lower_limit, high=self.upper_limit, size=(total_points, model.prior_count)
+        )
+        parameters = model.vectors_from_unit_vectors(unit_vectors=unit_parameters)
+
+        return unit_parameters.tolist(), parameters.tolist()
+
     def initial_samples_in_test_mode(self, total_points, model):
         """
         Generate the initial points of the non-linear search in test mode. Like normal, test model draws points, by
@@ -114,22 +143,10 @@ class Initializer:
             of free dimensions of the model.
         """
 
-        initial_unit_parameters = []
-        initial_parameters = []
-        initial_figures_of_merit = []
-
-        point_index = 0
-
-        while point_index < total_points:
-
-            unit_parameters = model.random_unit_vector_within_limits(
-                lower_limit=self.lower_limit, upper_limit=self.upper_limit
-            )
-            parameters = model.vector_from_unit_vector(unit_vector=unit_parameters)
-            initial_unit_parameters.append(unit_parameters)
-            initial_parameters.append(parameters)
-            initial_figures_of_merit.append(-1.0e99)
-            point_index += 1
+        initial_unit_parameters, initial_parameters = self.samples_from_model(
+            total_points=total_points, model=model
+        )
+        initial_figures_of_merit = [-1.0e99] * total_points
 
         return initial_unit_parameters, initial_parameters, initial_figures_of_merit
 
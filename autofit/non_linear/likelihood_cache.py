@@ -0,0 +1,158 @@
+import os
+from collections import OrderedDict
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from autofit.non_linear.log import logger
+
+
+class LikelihoodCache:
+    def __init__(
+            self,
+            size: int,
+            decimals: Optional[int] = None,
+            filename: Optional[str] = None,
+    ):
+        """
+        A bounded least recently used cache of log likelihoods, keyed by the parameter vector they were computed for.
+
+        Parameters
+        ----------
+        size
+            The maximum number of log likelihoods held. When full, the least recently used is discarded.
+        decimals
+            If given, vectors are rounded to this many decimal places before lookup, such that vectors which differ
+            only by numerical noise share a log likelihood.
+        filename
+            If given, every log likelihood added is appended to this file by `flush`, from which they can be loaded
+            with `load` such that the cache persists when a search is resumed. Each row of the file holds the parameter
+            vector followed by its log likelihood as little endian 64 bit floats.
+        """
+        self.size = size
+        self.decimals = decimals
+        self.filename = filename
+
+        self.hits = 0
+        self.misses = 0
+
+        self._log_likelihoods = OrderedDict()
+        self._pending = list()
+
+    def key(self, parameters) -> bytes:
+        parameters = np.asarray(parameters, dtype="float")
+        if self.decimals is not None:
+            parameters = np.round(parameters, self.decimals)
+        return parameters.tobytes()
+
+    def get(self, parameters) -> Optional[float]:
+        """
+        The cached log likelihood of a parameter vector, or None if it has not been cached.
+        """
+        key = self.key(parameters)
+        try:
+            log_likelihood = self._log_likelihoods[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._log_likelihoods.move_to_end(key)
+        self.hits += 1
+        return log_likelihood
+
+    def add(self, parameters, log_likelihood: float):
+        """
+        Cache the log likelihood of a parameter vector. A NaN log likelihood is not cached.
+        """
+        if np.isnan(log_likelihood):
+            return
+
+        self._add(self.key(parameters), log_likelihood)
+
+        if self.filename is not None:
+            self._pending.append(
+                np.append(np.asarray(parameters, dtype="<f8"), log_likelihood).astype("<f8")
+            )
+
+    def take_pending(self) -> List[np.ndarray]:
+        """
+        Remove and return the rows added since the file was last written, such that another process can write them
+        with `flush`.
+        """
+        pending, self._pending = self._pending, list()
+        return pending
+
+    def take_counts(self) -> Tuple[int, int]:
+        """
+        Remove and return the hits and misses counted since they were last taken, such that another process can add
+        them to its own counts.
+        """
+        counts = (self.hits, self.misses)
+        self.hits = self.misses = 0
+        return counts
+
+    def flush(self, rows: Iterable[np.ndarray] = ()):
+        """
+        Append the rows added since the last flush to the file, along with rows taken from the caches of other
+        processes.
+
+        Only one process should flush to a file, such that rows are never appended to it concurrently.
+        """
+        rows = self.take_pending() + list(rows)
+        if self.filename is None or len(rows) == 0:
+            return
+        with open(self.filename, "ab") as f:
+            for row in rows:
+                f.write(row.tobytes())
+
+    def _add(self, key, log_likelihood):
+        self._log_likelihoods[key] = log_likelihood
+        self._log_likelihoods.move_to_end(key)
+        if len(self._log_likelihoods) > self.size:
+            self._log_likelihoods.popitem(last=False)
+
+    def load(self, prior_count: int):
+        """
+        Load the log likelihoods persisted in the cache's file, keeping the most recent `size`.
+
+        Files which do not hold rows of prior_count + 1 values, for example because the model has changed, are
+        ignored. Files holding more than twice `size` rows are rewritten with only the rows kept.
+        """
+        if self.filename is None or not os.path.exists(self.filename):
+            return
+
+        rows = np.fromfile(self.filename, dtype="<f8")
+        width = prior_count + 1
+
+        if len(rows) % width != 0:
+            logger.warning(f"Ignoring the likelihood cache {self.filename}, which does not match the model")
+            return
+
+        rows = rows.reshape(-1, width)
+        if len(rows) > 2 * self.size:
+            rows = rows[-self.size:]
+            rows.astype("<f8").tofile(self.filename)
+
+        for row in rows[-self.size:]:
+            if not np.isnan(row[-1]):
+                self._add(self.key(row[:-1]), float(row[-1]))
+
+        logger.info(f"Loaded {len(self)} log likelihoods from {self.filename}")
+
+    def __getstate__(self):
+        # A copy sent to another process counts its own hits and misses and buffers its own rows, which this process
+        # collects with take_counts and take_pending.
+        state = self.__dict__.copy()
+        state["hits"] = state["misses"] = 0
+        state["_pending"] = list()
+        return state
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+    def __len__(self):
+        return len(self._log_likelihoods)
+
+    def __str__(self):
+        return f"{len(self)} cached log likelihoods, {self.hits} hits, {self.misses} misses"
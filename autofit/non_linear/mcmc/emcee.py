@@ -8,15 +8,17 @@ import numpy as np
 from autofit import exc
 from autofit.mapper.model_mapper import ModelMapper
 from autofit.mapper.prior_model.abstract import AbstractPriorModel
-from autofit.non_linear import samples as samp
 from autofit.non_linear.log import logger
 from autofit.non_linear.mcmc.abstract_mcmc import AbstractMCMC
 from autofit.non_linear.paths import convert_paths
-from autofit.non_linear.samples import MCMCSamples, Sample
+from autofit.non_linear.samples import MCMCSamples, Sample, samples_cache
 
 
 class Emcee(AbstractMCMC):
 
+    # The flattened chain of the backend grows by whole steps of the walkers
+    appends_samples = True
+
     @convert_paths
     def __init__(
             self,
@@ -134,6 +136,14 @@ class Emcee(AbstractMCMC):
 
     class Fitness(AbstractMCMC.Fitness):
         def __call__(self, parameters):
+
+            if np.ndim(parameters) == 2:
+
+                figures_of_merit = self.log_posteriors_from_parameters_batch(parameters=parameters)
+                figures_of_merit[np.isnan(figures_of_merit)] = self.resample_figure_of_merit
+
+                return figures_of_merit
+
             try:
                 return self.figure_of_merit_from_parameters(parameters=parameters)
             except exc.FitException:
@@ -172,79 +182,88 @@ class Emcee(AbstractMCMC):
         fitness_function = self.fitness_function_from_model_and_analysis(
             model=model, analysis=analysis, pool_ids=pool_ids
         )
-
-        emcee_sampler = emcee.EnsembleSampler(
-            nwalkers=self.nwalkers,
-            ndim=model.prior_count,
-            log_prob_fn=fitness_function.__call__,
-            backend=emcee.backends.HDFBackend(
-                filename=self.paths.samples_path + "/emcee.hdf"
-            ),
-            pool=pool,
-        )
+        self._fitness_function = fitness_function
 
         try:
+            if pool is not None:
+                fitness_function.share(pool)
+
+            emcee_sampler = emcee.EnsembleSampler(
+                nwalkers=self.nwalkers,
+                ndim=model.prior_count,
+                log_prob_fn=fitness_function.__call__,
+                backend=emcee.backends.HDFBackend(
+                    filename=self.paths.samples_path + "/emcee.hdf"
+                ),
+                pool=pool,
+                vectorize=fitness_function.has_log_likelihood_batch,
+            )
 
-            emcee_state = emcee_sampler.get_last_sample()
-            samples = self.samples_via_sampler_from_model(model=model)
+            try:
 
-            total_iterations = emcee_sampler.iteration
+                emcee_state = emcee_sampler.get_last_sample()
+                samples = self.samples_via_sampler_from_model(model=model)
 
-            if samples.converged:
-                iterations_remaining = 0
-            else:
-                iterations_remaining = self.nsteps - total_iterations
+                total_iterations = emcee_sampler.iteration
 
-                logger.info("Existing Emcee samples found, resuming non-linear search.")
+                if samples.converged:
+                    iterations_remaining = 0
+                else:
+                    iterations_remaining = self.nsteps - total_iterations
 
-        except AttributeError:
+                    logger.info("Existing Emcee samples found, resuming non-linear search.")
 
-            initial_unit_parameters, initial_parameters, initial_log_posteriors = self.initializer.initial_samples_from_model(
-                total_points=emcee_sampler.nwalkers,
-                model=model,
-                fitness_function=fitness_function,
-            )
+            except AttributeError:
 
-            emcee_state = np.zeros(shape=(emcee_sampler.nwalkers, model.prior_count))
+                initial_unit_parameters, initial_parameters, initial_log_posteriors = self.initializer.initial_samples_from_model(
+                    total_points=emcee_sampler.nwalkers,
+                    model=model,
+                    fitness_function=fitness_function,
+                )
 
-            logger.info("No Emcee samples found, beginning new non-linear search.")
+                emcee_state = np.zeros(shape=(emcee_sampler.nwalkers, model.prior_count))
 
-            for index, parameters in enumerate(initial_parameters):
+                logger.info("No Emcee samples found, beginning new non-linear search.")
 
-                emcee_state[index, :] = np.asarray(parameters)
+                for index, parameters in enumerate(initial_parameters):
 
-            total_iterations = 0
-            iterations_remaining = self.nsteps
+                    emcee_state[index, :] = np.asarray(parameters)
 
-        while iterations_remaining > 0:
+                total_iterations = 0
+                iterations_remaining = self.nsteps
 
-            if self.iterations_per_update > iterations_remaining:
-                iterations = iterations_remaining
-            else:
-                iterations = self.iterations_per_update
-
-            for sample in emcee_sampler.sample(
-                    initial_state=emcee_state,
-                    iterations=iterations,
-                    progress=True,
-                    skip_initial_state_check=True,
-                    store=True,
-            ):
+            while iterations_remaining > 0:
 
-                pass
+                if self.iterations_per_update > iterations_remaining:
+                    iterations = iterations_remaining
+                else:
+                    iterations = self.iterations_per_update
 
-            emcee_state = emcee_sampler.get_last_sample()
+                for sample in emcee_sampler.sample(
+                        initial_state=emcee_state,
+                        iterations=iterations,
+                        progress=True,
+                        skip_initial_state_check=True,
+                        store=True,
+                ):
 
-            total_iterations += iterations
-            iterations_remaining = self.nsteps - total_iterations
+                    pass
 
-            samples = self.perform_update(
-                model=model, analysis=analysis, during_analysis=True
-            )
+                emcee_state = emcee_sampler.get_last_sample()
 
-            if emcee_sampler.iteration % self.auto_correlation_check_size:
-                if samples.converged and self.auto_correlation_check_for_convergence:
-                    iterations_remaining = 0
+                total_iterations += iterations
+                iterations_remaining = self.nsteps - total_iterations
+
+                samples = self.perform_update(
+                    model=model, analysis=analysis, during_analysis=True
+                )
+
+                if emcee_sampler.iteration % self.auto_correlation_check_size:
+                    if samples.converged and self.auto_correlation_check_for_convergence:
+                        iterations_remaining = 0
+        finally:
+            if pool is not None:
+                fitness_function.release(pool)
 
         logger.info("Emcee sampling complete.")
 
@@ -306,50 +325,81 @@ class Emcee(AbstractMCMC):
             etc.
         """
 
-        parameters = self.backend.get_chain(flat=True).tolist()
-        log_priors = [
-            sum(model.log_priors_from_vector(vector=vector)) for vector in parameters
-        ]
-        log_likelihoods = self.backend.get_log_prob(flat=True).tolist()
-        weights = len(log_likelihoods) * [1.0]
-        auto_correlation_time = self.backend.get_autocorr_time(tol=0)
-        total_walkers = len(self.backend.get_chain()[0, :, 0])
-        total_steps = len(self.backend.get_log_prob())
+        chain = self.chain
+        chain.update()
+
+        log_likelihoods = chain.log_probs
+
+        previous_iteration = chain.iteration - self.auto_correlation_check_size
+        # The estimate for the chain excluding its last check size steps is made first so that both estimates
+        # extend the same incremental sums
+        previous_auto_correlation_times = (
+            chain.auto_correlation_times(iteration=previous_iteration)
+            if previous_iteration > 0 else None
+        )
 
         return EmceeSamples(
             model=model,
             samples=Sample.from_lists(
                 model=model,
-                parameters=parameters,
+                parameters=chain.parameters,
                 log_likelihoods=log_likelihoods,
-                log_priors=log_priors,
-                weights=weights
+                log_priors=chain.log_priors(model=model),
+                weights=np.ones(len(log_likelihoods))
             ),
-            total_walkers=total_walkers,
-            total_steps=total_steps,
-            auto_correlation_times=auto_correlation_time,
+            total_walkers=chain.total_walkers,
+            total_steps=chain.iteration,
+            auto_correlation_times=chain.auto_correlation_times(),
             auto_correlation_check_size=self.auto_correlation_check_size,
             auto_correlation_required_length=self.auto_correlation_required_length,
             auto_correlation_change_threshold=self.auto_correlation_change_threshold,
             backend=self.backend,
             time=self.timer.time,
+            previous_auto_correlation_times=previous_auto_correlation_times,
+        )
+
+    def samples_via_sampler_since(self, model, start: int):
+        """
+        The samples after the first start samples of the chain, as read from the backend by the last call to
+        samples_via_sampler_from_model. Only the log priors of samples which have not been seen before are computed.
+        """
+        chain = self.chain
+        if chain.chain is None:
+            return None
+
+        log_likelihoods = chain.log_probs[start:]
+
+        return Sample.from_lists(
+            model=model,
+            parameters=chain.parameters[start:],
+            log_likelihoods=log_likelihoods,
+            log_priors=chain.log_priors(model=model)[start:],
+            weights=np.ones(len(log_likelihoods))
         )
 
     def samples_via_csv_json_from_model(self, model):
 
         # TODO : Better design to remove repetition.
 
-        samples = samp.load_from_table(
-            filename=self.paths.samples_file
-        )
+        samples = self.load_samples_table()
 
         with open(self.paths.info_file) as infile:
             samples_info = json.load(infile)
 
+        auto_correlation_times = samples_info["auto_correlation_times"]
+        if auto_correlation_times is None:
+            auto_correlation_times = self._auto_correlation_times_from_table(
+                parameters=samples.parameters_for_paths(model.model_component_and_parameter_names),
+                total_walkers=samples_info["total_walkers"],
+            )
+
         return EmceeSamples(
             model=model,
             samples=samples,
-            auto_correlation_times=self.backend.get_autocorr_time(tol=0),
+            auto_correlation_times=(
+                None if auto_correlation_times is None
+                else np.asarray(auto_correlation_times)
+            ),
             auto_correlation_check_size=samples_info["auto_correlation_check_size"],
             auto_correlation_required_length=samples_info[
                 "auto_correlation_required_length"
@@ -360,9 +410,39 @@ class Emcee(AbstractMCMC):
             total_walkers=samples_info["total_walkers"],
             total_steps=samples_info["total_steps"],
             time=samples_info["time"],
-            backend=self.backend
         )
 
+    @staticmethod
+    def _auto_correlation_times_from_table(parameters: np.ndarray, total_walkers: int):
+        """
+        Estimate the auto correlation times of samples loaded from a table, for searches which did not output their
+        auto correlation times to info.json.
+
+        The rows of the table are the flattened chain, with one row per walker for every step. If the rows do not form
+        whole steps, or there are too few steps for an estimate, None is returned and the samples are treated as
+        unconverged.
+        """
+        total_steps, remainder = divmod(len(parameters), total_walkers)
+        if remainder != 0 or total_steps < 2:
+            logger.warning(
+                f"Auto correlation times cannot be estimated from {len(parameters)} samples of {total_walkers} walkers"
+            )
+            return None
+        return emcee.autocorr.integrated_time(
+            parameters.reshape(total_steps, total_walkers, -1),
+            tol=0
+        )
+
+    @property
+    def chain(self) -> "EmceeChain":
+        """
+        The chain of the *Emcee* hdf5 backend, which is kept between updates so that only new steps are read.
+        """
+        filename = self.paths.samples_path + "/emcee.hdf"
+        if getattr(self, "_chain", None) is None or self._chain.filename != filename:
+            self._chain = EmceeChain(filename=filename)
+        return self._chain
+
     @property
     def backend(self) -> emcee.backends.HDFBackend:
         """The *Emcee* hdf5 backend, which provides access to all samples, likelihoods, etc. of the non-linear search.
@@ -391,9 +471,10 @@ class EmceeSamples(MCMCSamples):
             auto_correlation_change_threshold: float,
             total_walkers: int,
             total_steps: int,
-            backend: emcee.backends.HDFBackend,
+            backend: emcee.backends.HDFBackend = None,
             unconverged_sample_size: int = 100,
             time: float = None,
+            previous_auto_correlation_times: np.ndarray = None,
     ):
         """
         Attributes
@@ -403,6 +484,9 @@ class EmceeSamples(MCMCSamples):
         total_steps : int
             The total number of steps taken by each walker of this MCMC `NonLinearSearch` (the total samples is equal
             to the total steps * total walkers).
+        previous_auto_correlation_times
+            The auto correlation times of the chain without its last auto_correlation_check_size steps, which are
+            computed from the samples if not given.
         """
 
         super().__init__(
@@ -419,18 +503,288 @@ class EmceeSamples(MCMCSamples):
         )
 
         self.backend = backend
+        self._previous_auto_correlation_times = previous_auto_correlation_times
+
+    @property
+    def _indices_after_burn_in(self) -> np.ndarray:
+        """
+        The indices of the samples kept after burn-in, as selected by emcee's get_chain(discard, thin, flat=True).
+
+        Raises
+        ------
+        ValueError
+            If the auto correlation times are too short or undefined to estimate the burn-in
+        """
+        if self.auto_correlation_times is None:
+            raise ValueError("The auto correlation times have not been estimated")
+        max_time = np.max(np.asarray(self.auto_correlation_times, dtype="float"))
+        if not np.isfinite(max_time):
+            raise ValueError(f"The auto correlation times are not finite (maximum {max_time})")
+
+        discard = int(3.0 * max_time)
+        thin = int(max_time / 2.0)
+        steps = np.arange(len(self.samples) // self.total_walkers)[discard + thin - 1::thin]
+        return (steps[:, None] * self.total_walkers + np.arange(self.total_walkers)).ravel()
 
     @property
     def samples_after_burn_in(self) -> [list]:
         """The emcee samples with the initial burn-in samples removed.
 
         The burn-in period is estimated using the auto-correlation times of the parameters."""
-        discard = int(3.0 * np.max(self.auto_correlation_times))
-        thin = int(np.max(self.auto_correlation_times) / 2.0)
-        return self.backend.get_chain(discard=discard, thin=thin, flat=True)
+        return self._parameters[self._indices_after_burn_in]
 
     @property
+    def _posterior_weights(self) -> np.ndarray:
+        """
+        Weights which are 1 for the samples kept after burn-in (see samples_after_burn_in) and 0 otherwise, or the
+        weights of every sample if the burn-in cannot yet be estimated.
+        """
+        try:
+            indices = self._indices_after_burn_in
+        except ValueError:
+            return self.samples.weights
+
+        weights = np.zeros(len(self.samples))
+        weights[indices] = 1.0
+        return weights
+
+    @property
+    @samples_cache
     def previous_auto_correlation_times(self) -> [float]:
+        if self._previous_auto_correlation_times is not None:
+            return self._previous_auto_correlation_times
         return emcee.autocorr.integrated_time(
-            x=self.backend.get_chain()[: -self.auto_correlation_check_size, :, :], tol=0
+            x=self._parameters.reshape(-1, self.total_walkers, self.model.prior_count)[
+              : -self.auto_correlation_check_size, :, :
+              ],
+            tol=0
+        )
+
+
+class EmceeChain:
+
+    # The number of lags of the auto correlation function summed before more are needed to find its window
+    initial_max_lag = 512
+
+    def __init__(self, filename: str, name: str = "mcmc"):
+        """
+        The chain of an *Emcee* hdf5 backend, which is read incrementally.
+
+        Steps which have been read are kept in memory, so each update only reads the steps taken since the previous
+        update from the backend.
+
+        Auto correlation times are also estimated incrementally. For every walker and parameter, sums of products of
+        the chain with itself at lags up to a maximum lag are kept and extended with the products of new steps. These
+        give the same estimate as emcee.autocorr.integrated_time with tol=0 for the whole chain, as long as the
+        window of the estimate is within the maximum lag. If it is not the maximum lag is doubled and the sums are
+        computed again.
+
+        Parameters
+        ----------
+        filename
+            The path of the hdf5 file of the backend
+        name
+            The name of the group of the chain in the hdf5 file
+        """
+        self.filename = filename
+        self.name = name
+        self._reset()
+
+    def __getstate__(self):
+        return {"filename": self.filename, "name": self.name}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._reset()
+
+    def _reset(self):
+        self.chain = None
+        self.log_prob = None
+        self._log_priors = np.zeros(0)
+        self._log_priors_model = None
+        self._lag_sums = None
+        self._totals = None
+        self._summed_steps = 0
+        self._auto_correlation_times = dict()
+
+    @property
+    def iteration(self) -> int:
+        """The number of steps read from the backend."""
+        return 0 if self.chain is None else len(self.chain)
+
+    @property
+    def total_walkers(self) -> int:
+        return self.chain.shape[1]
+
+    @property
+    def parameters(self) -> np.ndarray:
+        """The parameters of every step of every walker, flattened as by get_chain(flat=True)."""
+        return self.chain.reshape(-1, self.chain.shape[2])
+
+    @property
+    def log_probs(self) -> np.ndarray:
+        """The log probability of every step of every walker, flattened as by get_log_prob(flat=True)."""
+        return self.log_prob.reshape(-1)
+
+    def update(self):
+        """
+        Read the steps taken since the last update from the backend.
+
+        If the backend has been reset, for example because a new search was started, the whole chain is read.
+
+        Raises
+        ------
+        FileNotFoundError
+            If there is no backend file
+        AttributeError
+            If no steps have been stored in the backend, as raised by the backend
+        """
+        if not os.path.isfile(self.filename):
+            raise FileNotFoundError(
+                f"The file emcee.hdf does not exist at the path {os.path.dirname(self.filename)}"
+            )
+
+        backend = emcee.backends.HDFBackend(
+            filename=self.filename, name=self.name, read_only=True
+        )
+        with backend.open() as f:
+            group = f[self.name]
+            iteration = group.attrs["iteration"]
+
+            if iteration <= 0:
+                raise AttributeError(
+                    "you must run the sampler with 'store == True' before accessing the results"
+                )
+
+            start = self.iteration
+            if start > 0 and (
+                    iteration < start
+                    or not np.array_equal(group["log_prob"][start - 1], self.log_prob[-1], equal_nan=True)
+            ):
+                self._reset()
+                start = 0
+
+            if iteration == start:
+                return
+
+            chain = group["chain"][start:iteration]
+            log_prob = group["log_prob"][start:iteration]
+
+        if start == 0:
+            self.chain = chain
+            self.log_prob = log_prob
+        else:
+            self.chain = np.concatenate((self.chain, chain))
+            self.log_prob = np.concatenate((self.log_prob, log_prob))
+
+    def log_priors(self, model) -> np.ndarray:
+        """
+        The log prior of every sample of the flattened chain, which is only computed for samples added since
+        the previous call for the same model.
+        """
+        parameters = self.parameters
+        if model is not self._log_priors_model:
+            self._log_priors = np.zeros(0)
+            self._log_priors_model = model
+
+        start = len(self._log_priors)
+        if start < len(parameters):
+            self._log_priors = np.concatenate((
+                self._log_priors,
+                np.sum(model.log_priors_from_vectors(vectors=parameters[start:]), axis=1)
+            ))
+        return self._log_priors[:len(parameters)]
+
+    def auto_correlation_times(self, iteration: int = None) -> np.ndarray:
+        """
+        The integrated auto correlation time of every parameter estimated from the first steps of the chain, as by
+        emcee.autocorr.integrated_time with tol=0.
+
+        Estimates are kept, and estimates for a number of steps at least as large as that of every previous estimate
+        extend the sums used for that estimate rather than using the whole chain.
+
+        Parameters
+        ----------
+        iteration
+            The number of steps used, which is every step read if None
+        """
+        if iteration is None:
+            iteration = self.iteration
+
+        if iteration not in self._auto_correlation_times:
+            if iteration < self._summed_steps:
+                times = emcee.autocorr.integrated_time(self.chain[:iteration], tol=0)
+            else:
+                times = self._incremental_auto_correlation_times(iteration)
+            self._auto_correlation_times[iteration] = times
+
+        return self._auto_correlation_times[iteration]
+
+    def _add_lag_sums(self, start: int, stop: int):
+        """
+        Add the products of steps start to stop of the chain with the steps up to the maximum lag before them to
+        the lag sums. The chain is offset by its first step to limit the loss of precision in the sums.
+        """
+        max_lag = len(self._lag_sums) - 1
+        first = max(start - max_lag, 0)
+
+        steps = self.chain[first:stop] - self.chain[0]
+        new_steps = steps.copy()
+        new_steps[:start - first] = 0.0
+
+        size = emcee.autocorr.next_pow_two(len(steps) + max_lag + 1)
+        correlation = np.fft.irfft(
+            np.conj(np.fft.rfft(steps, n=size, axis=0)) * np.fft.rfft(new_steps, n=size, axis=0),
+            n=size,
+            axis=0
         )
+
+        lags = min(max_lag + 1, len(steps))
+        self._lag_sums[:lags] += correlation[:lags]
+        self._totals += new_steps.sum(axis=0)
+        self._summed_steps = stop
+
+    def _incremental_auto_correlation_times(self, iteration: int) -> np.ndarray:
+        if self._lag_sums is None:
+            self._lag_sums = np.zeros((min(self.initial_max_lag, iteration - 1) + 1,) + self.chain.shape[1:])
+            self._totals = np.zeros(self.chain.shape[1:])
+
+        while True:
+            if self._summed_steps < iteration:
+                self._add_lag_sums(start=self._summed_steps, stop=iteration)
+
+            max_lag = len(self._lag_sums) - 1
+            first_steps = self.chain[:max_lag] - self.chain[0]
+            last_steps = self.chain[iteration - max_lag:iteration] - self.chain[0]
+
+            # Sums over the steps which lag k steps behind and ahead of other steps
+            head_sums = self._totals - np.concatenate((
+                np.zeros((1,) + self._totals.shape), np.cumsum(last_steps[::-1], axis=0)
+            ))
+            tail_sums = self._totals - np.concatenate((
+                np.zeros((1,) + self._totals.shape), np.cumsum(first_steps, axis=0)
+            ))
+
+            lags = np.arange(max_lag + 1)[:, None, None]
+            mean = self._totals / iteration
+            auto_covariance = (
+                    self._lag_sums
+                    - mean * (head_sums + tail_sums)
+                    + (iteration - lags) * mean ** 2
+            )
+            taus = 2.0 * np.cumsum(
+                np.mean(auto_covariance / auto_covariance[0], axis=1), axis=0
+            ) - 1.0
+
+            within_window = np.arange(max_lag + 1)[:, None] < 5.0 * taus
+            windows = np.argmin(within_window, axis=0)
+            outside_window = ~within_window[windows, np.arange(taus.shape[1])]
+
+            if np.all(outside_window) or max_lag >= iteration - 1:
+                return taus[windows, np.arange(taus.shape[1])]
+
+            # The window of some parameter is beyond the maximum lag
+            max_lag = min(max(2 * max_lag, self.initial_max_lag), iteration - 1)
+            self._lag_sums = np.zeros((max_lag + 1,) + self.chain.shape[1:])
+            self._totals = np.zeros(self.chain.shape[1:])
+            self._summed_steps = 0
@@ -213,9 +213,7 @@ class AbstractNest(NonLinearSearch):
 
     def samples_via_csv_json_from_model(self, model):
 
-        samples = samp.load_from_table(
-            filename=self.paths.samples_file
-        )
+        samples = self.load_samples_table()
 
         with open(self.paths.info_file) as infile:
             samples_info = json.load(infile)
@@ -282,84 +282,92 @@ class AbstractDynesty(AbstractNest):
         fitness_function = self.fitness_function_from_model_and_analysis(
             model=model, analysis=analysis, pool_ids=pool_ids, log_likelihood_cap=log_likelihood_cap,
         )
+        self._fitness_function = fitness_function
 
-        if os.path.exists("{}/{}.pickle".format(self.paths.samples_path, "dynesty")):
+        try:
+            if pool is not None:
+                fitness_function.share(pool)
 
-            sampler = self.load_sampler
-            sampler.loglikelihood = fitness_function
-            logger.info("Existing Dynesty samples found, resuming non-linear search.")
+            if os.path.exists("{}/{}.pickle".format(self.paths.samples_path, "dynesty")):
 
-        else:
+                sampler = self.load_sampler
+                sampler.loglikelihood = fitness_function
+                logger.info("Existing Dynesty samples found, resuming non-linear search.")
 
-            sampler = self.sampler_fom_model_and_fitness(
-                model=model, fitness_function=fitness_function
-            )
+            else:
 
-            logger.info("No Dynesty samples found, beginning new non-linear search. ")
+                sampler = self.sampler_fom_model_and_fitness(
+                    model=model, fitness_function=fitness_function
+                )
 
-        # These hacks are necessary to be able to pickle the sampler.
+                logger.info("No Dynesty samples found, beginning new non-linear search. ")
 
-        sampler.rstate = np.random
-        sampler.pool = pool
+            # These hacks are necessary to be able to pickle the sampler.
 
-        if self.number_of_cores == 1:
-            sampler.M = map
-        else:
-            sampler.M = pool.map
+            sampler.rstate = np.random
+            sampler.pool = pool
 
-        finished = False
+            if self.number_of_cores == 1:
+                sampler.M = map
+            else:
+                sampler.M = pool.map
 
-        while not finished:
+            finished = False
 
-            try:
-                total_iterations = np.sum(sampler.results.ncall)
-            except AttributeError:
-                total_iterations = 0
+            while not finished:
 
-            if not self.no_limit:
-                iterations = self.maxcall - total_iterations
-            else:
-                iterations = self.iterations_per_update
+                try:
+                    total_iterations = np.sum(sampler.results.ncall)
+                except AttributeError:
+                    total_iterations = 0
 
-            if iterations > 0:
+                if not self.no_limit:
+                    iterations = self.maxcall - total_iterations
+                else:
+                    iterations = self.iterations_per_update
 
-                for i in range(10):
+                if iterations > 0:
 
-                    try:
-                        sampler.run_nested(
-                            maxcall=iterations,
-                            dlogz=self.evidence_tolerance,
-                            logl_max=self.logl_max,
-                            n_effective=self.n_effective,
-                            print_progress=not self.silence,
-                        )
+                    for i in range(10):
 
-                        if i == 9:
-                            raise ValueError("Dynesty crashed due to repeated bounding errors")
+                        try:
+                            sampler.run_nested(
+                                maxcall=iterations,
+                                dlogz=self.evidence_tolerance,
+                                logl_max=self.logl_max,
+                                n_effective=self.n_effective,
+                                print_progress=not self.silence,
+                            )
 
-                        break
+                            if i == 9:
+                                raise ValueError("Dynesty crashed due to repeated bounding errors")
 
-                    except (ValueError, np.linalg.LinAlgError):
+                            break
 
-                        continue
+                        except (ValueError, np.linalg.LinAlgError):
 
-            sampler_pickle = sampler
-            sampler_pickle.loglikelihood = None
+                            continue
 
-            with open(f"{self.paths.samples_path}/dynesty.pickle", "wb") as f:
-                pickle.dump(sampler_pickle, f)
+                sampler_pickle = sampler
+                sampler_pickle.loglikelihood = None
 
-            sampler_pickle.loglikelihood = fitness_function
+                with open(f"{self.paths.samples_path}/dynesty.pickle", "wb") as f:
+                    pickle.dump(sampler_pickle, f)
 
-            self.perform_update(model=model, analysis=analysis, during_analysis=True)
+                sampler_pickle.loglikelihood = fitness_function
 
-            iterations_after_run = np.sum(sampler.results.ncall)
+                self.perform_update(model=model, analysis=analysis, during_analysis=True)
 
-            if (
-                    total_iterations == iterations_after_run
-                    or total_iterations == self.maxcall
-            ):
-                finished = True
+                iterations_after_run = np.sum(sampler.results.ncall)
+
+                if (
+                        total_iterations == iterations_after_run
+                        or total_iterations == self.maxcall
+                ):
+                    finished = True
+        finally:
+            if pool is not None:
+                fitness_function.release(pool)
 
     def copy_with_name_extension(self, extension, path_prefix=None, remove_phase_tag=False):
         """Copy this instance of the dynesty `NonLinearSearch` with all associated attributes.
@@ -414,16 +422,14 @@ class AbstractDynesty(AbstractNest):
             Manages all paths, e.g. where the search outputs are stored, the samples, etc.
         """
         sampler = self.load_sampler
-        parameters = sampler.results.samples.tolist()
-        log_priors = [
-            sum(model.log_priors_from_vector(vector=vector)) for vector in parameters
-        ]
-        log_likelihoods = list(sampler.results.logl)
+        parameters = sampler.results.samples
+        log_priors = np.sum(
+            model.log_priors_from_vectors(vectors=parameters), axis=1
+        )
+        log_likelihoods = np.asarray(sampler.results.logl)
 
         try:
-            weights = list(
-                np.exp(np.asarray(sampler.results.logwt) - sampler.results.logz[-1])
-            )
+            weights = np.exp(np.asarray(sampler.results.logwt) - sampler.results.logz[-1])
         except:
             weights = sampler.results["weights"]
 
@@ -1021,64 +1027,74 @@ class DynestyDynamic(AbstractDynesty):
         fitness_function = self.fitness_function_from_model_and_analysis(
             model=model, analysis=analysis, pool_ids=pool_ids
         )
+        self._fitness_function = fitness_function
 
-        sampler = self.sampler_fom_model_and_fitness(
-            model=model, fitness_function=fitness_function
-        )
+        try:
+            if pool is not None:
+                fitness_function.share(pool)
 
-        logger.info(
-            "No DynestyDynamic samples found, beginning new non-linear search. "
-        )
+            sampler = self.sampler_fom_model_and_fitness(
+                model=model, fitness_function=fitness_function
+            )
 
-        # These hacks are necessary to be able to pickle the sampler.
+            logger.info(
+                "No DynestyDynamic samples found, beginning new non-linear search. "
+            )
 
-        sampler.rstate = np.random
-        sampler.pool = pool
+            # These hacks are necessary to be able to pickle the sampler.
 
-        if self.number_of_cores == 1:
-            sampler.M = map
-        else:
-            sampler.M = pool.map
+            sampler.rstate = np.random
+            sampler.pool = pool
 
-        finished = False
+            if self.number_of_cores == 1:
+                sampler.M = map
+            else:
+                sampler.M = pool.map
 
-        while not finished:
+            finished = False
 
-            try:
-                total_iterations = np.sum(sampler.results.ncall)
-            except AttributeError:
-                total_iterations = 0
+            while not finished:
 
-            if not self.no_limit:
-                iterations = self.maxcall - total_iterations
-            else:
-                iterations = self.iterations_per_update
+                try:
+                    total_iterations = np.sum(sampler.results.ncall)
+                except AttributeError:
+                    total_iterations = 0
 
-            if iterations > 0:
+                if not self.no_limit:
+                    iterations = self.maxcall - total_iterations
+                else:
+                    iterations = self.iterations_per_update
 
-                sampler.run_nested(
-                    nlive_init=self.n_live_points,
-                    maxcall=iterations,
-                    dlogz_init=self.evidence_tolerance,
-                    logl_max_init=self.logl_max,
-                    n_effective=self.n_effective,
-                    print_progress=not self.silence,
-                )
+                if iterations > 0:
+
+                    sampler.run_nested(
+                        nlive_init=self.n_live_points,
+                        maxcall=iterations,
+                        dlogz_init=self.evidence_tolerance,
+                        logl_max_init=self.logl_max,
+                        n_effective=self.n_effective,
+                        print_progress=not self.silence,
+                    )
 
-            iterations_after_run = np.sum(sampler.results.ncall)
+                iterations_after_run = np.sum(sampler.results.ncall)
 
-            if (
-                    total_iterations == iterations_after_run
-                    or total_iterations == self.maxcall
-            ):
-                finished = True
+                if (
+                        total_iterations == iterations_after_run
+                        or total_iterations == self.maxcall
+                ):
+                    finished = True
+        finally:
+            if pool is not None:
+                fitness_function.release(pool)
 
         during_analysis = False
 
         self.timer.update()
 
         samples = self.samples_via_sampler_from_model(model=model, sampler=sampler)
-        samples.write_table(filename=self.paths.samples_file)
+        self.write_samples(samples=samples)
+        self.write_equal_weight_samples(samples=samples)
+        self.save_samples_summary(samples=samples)
         self.save_samples(samples=samples)
 
         instance = samples.max_log_likelihood_instance
@@ -1117,9 +1133,9 @@ class DynestyDynamic(AbstractDynesty):
         """
 
         parameters = sampler.results.samples.tolist()
-        log_priors = [
-            sum(model.log_priors_from_vector(vector=vector)) for vector in parameters
-        ]
+        log_priors = np.sum(
+            model.log_priors_from_vectors(vectors=parameters), axis=1
+        ).tolist()
         log_likelihoods = list(sampler.results.logl)
 
         try:
@@ -1,3 +1,5 @@
+import numpy as np
+
 from autoconf import conf
 from autofit.mapper.prior_model.abstract import AbstractPriorModel
 from autofit.non_linear import abstract_search
@@ -269,6 +271,7 @@ class MultiNest(abstract_nest.AbstractNest):
         fitness_function = self.fitness_function_from_model_and_analysis(
             model=model, analysis=analysis
         )
+        self._fitness_function = fitness_function
 
         import pymultinest
 
@@ -379,21 +382,13 @@ class MultiNest(abstract_nest.AbstractNest):
             cube values to physical values via the priors.
         """
 
-        parameters = parameters_from_file_weighted_samples(
+        parameters, log_likelihoods, weights = weighted_samples_from_file(
             file_weighted_samples=self.paths.file_weighted_samples,
             prior_count=model.prior_count,
         )
 
-        log_priors = [
-            sum(model.log_priors_from_vector(vector=vector)) for vector in parameters
-        ]
-
-        log_likelihoods = log_likelihoods_from_file_weighted_samples(
-            file_weighted_samples=self.paths.file_weighted_samples
-        )
-
-        weights = weights_from_file_weighted_samples(
-            file_weighted_samples=self.paths.file_weighted_samples
+        log_priors = np.sum(
+            model.log_priors_from_vectors(vectors=parameters), axis=1
         )
 
         total_samples = total_samples_from_file_resume(
@@ -420,76 +415,53 @@ class MultiNest(abstract_nest.AbstractNest):
         )
 
 
+def weighted_samples_from_file(file_weighted_samples, prior_count) -> (np.ndarray, np.ndarray, np.ndarray):
+    """Open the file "multinest.txt" and extract the parameter values, log likelihood values and weights of every
+    accepted live point in a single pass.
+
+    Each line of the file holds the weight, -2 times the log likelihood and the parameters of a point, so the
+    whole file is converted to floats by numpy and reshaped into a row for each point, rather than reading each
+    value in Python.
+
+    Returns
+    -------
+    Arrays of the parameters of shape (total_samples, prior_count), the log likelihoods and the weights
+    """
+    with open(file_weighted_samples) as f:
+        columns = np.fromstring(f.read(), dtype=np.float64, sep=" ")
+
+    columns = columns.reshape(-1, prior_count + 2)
+
+    return columns[:, 2:], -0.5 * columns[:, 1], columns[:, 0]
+
+
 def parameters_from_file_weighted_samples(
         file_weighted_samples, prior_count
 ) -> [[float]]:
     """Open the file "multinest.txt" and extract the parameter values of every accepted live point as a list
     of lists."""
-    weighted_samples = open(file_weighted_samples)
-
-    total_samples = 0
-    for line in weighted_samples:
-        total_samples += 1
-
-    weighted_samples.seek(0)
-
-    parameters = []
+    parameters, _, _ = weighted_samples_from_file(
+        file_weighted_samples=file_weighted_samples, prior_count=prior_count
+    )
+    return parameters.tolist()
 
-    for line in range(total_samples):
-        vector = []
-        weighted_samples.read(56)
-        for param in range(prior_count):
-            vector.append(float(weighted_samples.read(28)))
-        weighted_samples.readline()
-        parameters.append(vector)
 
-    weighted_samples.close()
-
-    return parameters
+def _column_from_file_weighted_samples(file_weighted_samples, index) -> [float]:
+    with open(file_weighted_samples) as f:
+        prior_count = len(f.readline().split()) - 2
+    return weighted_samples_from_file(
+        file_weighted_samples=file_weighted_samples, prior_count=prior_count
+    )[index].tolist()
 
 
 def log_likelihoods_from_file_weighted_samples(file_weighted_samples) -> [float]:
     """Open the file "multinest.txt" and extract the log likelihood values of every accepted live point as a list."""
-    weighted_samples = open(file_weighted_samples)
-
-    total_samples = 0
-    for line in weighted_samples:
-        total_samples += 1
-
-    weighted_samples.seek(0)
-
-    log_likelihoods = []
-
-    for line in range(total_samples):
-        weighted_samples.read(28)
-        log_likelihoods.append(-0.5 * float(weighted_samples.read(28)))
-        weighted_samples.readline()
-
-    weighted_samples.close()
-
-    return log_likelihoods
+    return _column_from_file_weighted_samples(file_weighted_samples=file_weighted_samples, index=1)
 
 
 def weights_from_file_weighted_samples(file_weighted_samples) -> [float]:
     """Open the file "multinest.txt" and extract the weight values of every accepted live point as a list."""
-    weighted_samples = open(file_weighted_samples)
-
-    total_samples = 0
-    for line in weighted_samples:
-        total_samples += 1
-
-    weighted_samples.seek(0)
-
-    log_likelihoods = []
-
-    for line in range(total_samples):
-        weighted_samples.read(4)
-        log_likelihoods.append(float(weighted_samples.read(24)))
-        weighted_samples.readline()
-
-    weighted_samples.close()
-
-    return log_likelihoods
+    return _column_from_file_weighted_samples(file_weighted_samples=file_weighted_samples, index=2)
 
 
 def total_samples_from_file_resume(file_resume):
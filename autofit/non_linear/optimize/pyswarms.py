@@ -132,6 +132,13 @@ class AbstractPySwarms(AbstractOptimizer):
     class Fitness(AbstractOptimizer.Fitness):
         def __call__(self, parameters):
 
+            if self.has_log_likelihood_batch:
+
+                figures_of_merit = -2.0 * self.log_posteriors_from_parameters_batch(parameters=parameters)
+                figures_of_merit[np.isnan(figures_of_merit)] = -2.0 * self.resample_figure_of_merit
+
+                return figures_of_merit
+
             figures_of_merit = []
 
             for params_of_particle in parameters:
@@ -173,11 +180,11 @@ class AbstractPySwarms(AbstractOptimizer):
         A result object comprising the Samples object that inclues the maximum log likelihood instance and full
         chains used by the fit.
         """
-        pool, pool_ids = self.make_pool()
-
+        # Particles are evaluated in this process, so no pool of workers is started
         fitness_function = self.fitness_function_from_model_and_analysis(
-            model=model, analysis=analysis, pool_ids=pool_ids
+            model=model, analysis=analysis
         )
+        self._fitness_function = fitness_function
 
         if os.path.exists("{}/{}.pickle".format(self.paths.samples_path, "points")):
 
@@ -320,9 +327,9 @@ class AbstractPySwarms(AbstractOptimizer):
         parameters = [
             param.tolist() for parameters in self.load_points for param in parameters
         ]
-        log_priors = [
-            sum(model.log_priors_from_vector(vector=vector)) for vector in parameters
-        ]
+        log_priors = np.sum(
+            model.log_priors_from_vectors(vectors=parameters), axis=1
+        ).tolist()
         log_posteriors = self.load_log_posteriors
         log_likelihoods = [lp - prior for lp, prior in zip(log_posteriors, log_priors)]
         weights = len(log_likelihoods) * [1.0]
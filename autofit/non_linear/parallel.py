@@ -1,8 +1,8 @@
-import multiprocessing
+import warnings
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from itertools import count
-from time import sleep
-from typing import Iterable
+from typing import Iterable, Iterator
 
 from autofit.non_linear.log import logger
 
@@ -37,51 +37,100 @@ class AbstractJob(ABC):
         """
 
 
-class Process(multiprocessing.Process):
-    def __init__(self, name: str, job_queue: multiprocessing.Queue):
+class JobExecutor(ProcessPoolExecutor):
+    def __init__(self, number_of_cores: int):
         """
-        A parallel process that consumes Jobs through the job queue and outputs results through its own queue.
+        Executes jobs in parallel across n - 1 other cores.
+
+        This is a concurrent.futures executor. Worker processes block while waiting for work and are
+        shut down with sentinels when the executor is shut down. If a worker dies, the futures of the
+        jobs not yet completed fail with a BrokenProcessPool exception rather than waiting forever.
 
         Parameters
         ----------
-        name: str
-            The name of the process
-        job_queue: multiprocessing.Queue
-            The queue through which jobs are submitted
+        number_of_cores
+            The number of cores this computer has. Must be at least 2.
         """
-        super().__init__(name=name)
-        logger.info("created process {}".format(name))
+        if number_of_cores < 2:
+            raise AssertionError(
+                "The number of cores available must be at least 2 for parallel to run"
+            )
+        super().__init__(max_workers=number_of_cores - 1)
 
-        self.job_queue = job_queue
-        self.queue = multiprocessing.Queue()
-        self.count = 0
-        self.max_count = 250
+    def submit_job(self, job: AbstractJob):
+        """
+        Submit a job, returning a future for its result.
+        """
+        return self.submit(job.perform)
 
-    def run(self):
+    def run_jobs(
+            self,
+            jobs: Iterable[AbstractJob],
+            ordered: bool = False
+    ) -> Iterator[AbstractJobResult]:
         """
-        Run this process, completing each job in the job_queue and
-        passing the result to the queue.
+        Run a collection of jobs, yielding each result as it becomes available.
+
+        Parameters
+        ----------
+        jobs
+            Serializable concrete children of the AbstractJob class
+        ordered
+            If True results are yielded in the order the jobs were given. Otherwise they are yielded
+            in the order they complete.
+
+        Raises
+        ------
+        Exception
+            Any exception raised by a job. Jobs which have not started are cancelled.
         """
-        logger.info("starting process {}".format(self.name))
-        while True:
-            sleep(0.025)
-            if self.count >= self.max_count:
-                break
-            if self.job_queue.empty():
-                self.count += 1
-            else:
-                self.count = 0
-                job = self.job_queue.get()
-                self.queue.put(job.perform())
-        logger.info("terminating process {}".format(self.name))
-        self.job_queue.close()
+        futures = [self.submit_job(job) for job in jobs]
+        logger.info(f"submitted {len(futures)} jobs")
+
+        try:
+            for future in (futures if ordered else as_completed(futures)):
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def run_jobs(
+        jobs: Iterable[AbstractJob],
+        number_of_cores: int,
+        ordered: bool = False
+) -> Iterator[AbstractJobResult]:
+    """
+    Run the collection of jobs across n - 1 other cores.
+
+    Parameters
+    ----------
+    jobs
+        Serializable concrete children of the AbstractJob class
+    number_of_cores
+        The number of cores this computer has. Must be at least 2.
+    ordered
+        If True results are yielded in the order the jobs were given. Otherwise they are yielded
+        in the order they complete.
+    """
+    with JobExecutor(number_of_cores) as executor:
+        yield from executor.run_jobs(jobs, ordered=ordered)
+
+
+class Process:
+    """
+    Deprecated. Use `run_jobs` or `JobExecutor`.
+
+    Jobs were previously run by starting one of these processes per core, which polled a queue of jobs.
+    Only `run_jobs` is kept, such that existing callers continue to work.
+    """
 
     @classmethod
     def run_jobs(
             cls,
             jobs: Iterable[AbstractJob],
             number_of_cores: int
-    ):
+    ) -> Iterator[AbstractJobResult]:
         """
         Run the collection of jobs across n - 1 other cores.
 
@@ -92,36 +141,8 @@ class Process(multiprocessing.Process):
         number_of_cores
             The number of cores this computer has. Must be at least 2.
         """
-        if number_of_cores < 2:
-            raise AssertionError(
-                "The number of cores available must be at least 2 for parallel to run"
-            )
-
-        job_queue = multiprocessing.Queue()
-
-        processes = [
-            Process(str(number), job_queue)
-            for number in range(number_of_cores - 1)
-        ]
-
-        total = 0
-        for job in jobs:
-            job_queue.put(job)
-            total += 1
-
-        for process in processes:
-            process.start()
-
-        count = 0
-
-        while count < total:
-            for process in processes:
-                while not process.queue.empty():
-                    result = process.queue.get()
-                    count += 1
-                    yield result
-
-        job_queue.close()
-
-        for process in processes:
-            process.join(timeout=1.0)
+        warnings.warn(
+            "Process.run_jobs is deprecated; use autofit.non_linear.parallel.run_jobs instead",
+            DeprecationWarning
+        )
+        return run_jobs(jobs, number_of_cores)
@@ -175,6 +175,22 @@ class Paths:
     def samples_file(self) -> str:
         return path.join(self.samples_path, "samples.csv")
 
+    @property
+    def samples_binary_file(self) -> str:
+        return path.join(self.samples_path, "samples.bin")
+
+    @property
+    def samples_equal_weights_file(self) -> str:
+        return path.join(self.samples_path, "samples_equal_weights.bin")
+
+    @property
+    def samples_summary_file(self) -> str:
+        return path.join(self.samples_path, "summary.json")
+
+    @property
+    def likelihood_cache_file(self) -> str:
+        return path.join(self.samples_path, "likelihood_cache.bin")
+
     @property
     def info_file(self) -> str:
         return path.join(self.samples_path, "info.json")
@@ -0,0 +1,327 @@
+import atexit
+import io
+import multiprocessing as mp
+import os
+import pickle
+from itertools import count
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from autofit.non_linear.log import logger
+
+try:
+    from multiprocessing import resource_tracker, shared_memory
+except ImportError:  # Python < 3.8
+    resource_tracker = shared_memory = None
+
+# Objects shared with this process by a WorkerPool, keyed by the key they were shared with.
+_shared = dict()
+
+# Blocks of shared memory this process has attached to, keyed by name.
+_memory = dict()
+
+# The names of the blocks of shared memory each shared object uses, keyed by the key it was shared with.
+_memory_names = dict()
+
+# The barrier used to make sure every worker takes exactly one task of a broadcast.
+_barrier = None
+
+_keys = count()
+
+
+def _initialise(barrier):
+    global _barrier
+    _barrier = barrier
+
+
+def _synchronised(arguments):
+    """
+    Run a function in a worker and wait until every worker in the pool has done the same.
+
+    Because a worker cannot take another task until the barrier is passed, a broadcast of
+    one such task per worker is run exactly once by every worker. The barrier is passed even
+    if the function raises, such that the other workers are not left waiting, and the exception
+    is raised again by the broadcast.
+    """
+    function, args = arguments
+    try:
+        return function(*args)
+    finally:
+        _barrier.wait()
+
+
+def _pid():
+    return mp.current_process().pid
+
+
+class _Pickler(pickle.Pickler):
+    def __init__(self, file, descriptors):
+        """
+        Pickles arrays which have been placed in shared memory as descriptors of the memory.
+
+        Only instances of np.ndarray itself are replaced, since a subclass would be restored as a
+        plain array and lose its type and attributes.
+        """
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.descriptors = descriptors
+
+    def persistent_id(self, obj):
+        if type(obj) is np.ndarray:
+            return self.descriptors.get(id(obj))
+        return None
+
+
+class _Unpickler(pickle.Unpickler):
+    def __init__(self, file):
+        """
+        Unpickles arrays which were pickled as descriptors of shared memory as read-only views of the memory,
+        recording the name of every block of memory used.
+        """
+        super().__init__(file)
+        self.names = set()
+
+    def persistent_load(self, pid):
+        name, shape, dtype = pid
+        self.names.add(name)
+        memory = _memory.get(name)
+        if memory is None:
+            memory = shared_memory.SharedMemory(name=name)
+            _memory[name] = memory
+        array = np.ndarray(shape, dtype=dtype, buffer=memory.buf)
+        array.flags.writeable = False
+        return array
+
+
+def _register(key, payload):
+    unpickler = _Unpickler(io.BytesIO(payload))
+    _shared[key] = unpickler.load()
+    _memory_names[key] = unpickler.names
+
+
+def _release(key):
+    _shared.pop(key, None)
+
+    names = _memory_names.pop(key, set())
+    in_use = set().union(*_memory_names.values())
+
+    for name in names - in_use:
+        memory = _memory.pop(name, None)
+        if memory is None:
+            continue
+        try:
+            memory.close()
+        except BufferError:
+            # Views of the memory are still referenced somewhere. It is unmapped when they are collected.
+            pass
+
+
+def shared_object(key: int):
+    """
+    Retrieve an object that was shared with this process by a WorkerPool.
+
+    Parameters
+    ----------
+    key
+        The key returned when the object was shared
+
+    Returns
+    -------
+    The unpickled object, which is reused by every task the worker performs.
+    """
+    try:
+        return _shared[key]
+    except KeyError:
+        raise KeyError(
+            f"No object was shared with process {mp.current_process().pid} with key {key}. "
+            f"Objects can only be restored in the workers of the pool they were shared with."
+        )
+
+
+class WorkerPool:
+    _pools: Dict[int, "WorkerPool"] = dict()
+
+    def __init__(self, number_of_cores: int):
+        """
+        A pool of worker processes which persists between non-linear searches and phases.
+
+        The processes are started the first time the pool is used and kept until the pool is
+        closed, so that a pipeline of many phases pays the cost of spawning processes once.
+
+        Large objects which every task needs, such as the fitness function which holds the
+        analysis and its data, are shared with each worker once via `share`. Tasks then refer to
+        the shared object by a key rather than pickling it every time.
+
+        Parameters
+        ----------
+        number_of_cores
+            The number of worker processes in the pool.
+        """
+        if number_of_cores < 2:
+            raise ValueError(
+                f"A WorkerPool must have at least 2 processes ({number_of_cores} given)"
+            )
+        self.number_of_cores = number_of_cores
+        self._pool = None
+        self._ids = None
+        self._memory = dict()
+
+    @classmethod
+    def for_cores(cls, number_of_cores: int) -> "WorkerPool":
+        """
+        The pool shared by every search in this process that uses a given number of cores.
+        """
+        pool = cls._pools.get(number_of_cores)
+        if pool is None:
+            pool = cls(number_of_cores)
+            cls._pools[number_of_cores] = pool
+        return pool
+
+    @classmethod
+    def close_all(cls):
+        """
+        Close every pool created by `for_cores`.
+        """
+        for pool in cls._pools.values():
+            pool.close()
+        cls._pools = dict()
+
+    @property
+    def pool(self) -> mp.Pool:
+        """
+        The underlying multiprocessing pool, which is started when first accessed.
+        """
+        if self._pool is None:
+            logger.info(f"Starting a pool of {self.number_of_cores} processes")
+            if resource_tracker is not None and os.name == "posix":
+                # Workers must use the same tracker as this process, which is responsible for unlinking shared memory.
+                # Otherwise each worker starts its own, which reports the memory as leaked when the worker exits.
+                resource_tracker.ensure_running()
+            self._pool = mp.Pool(
+                processes=self.number_of_cores,
+                initializer=_initialise,
+                initargs=(mp.Barrier(self.number_of_cores),)
+            )
+            self._ids = None
+        return self._pool
+
+    def broadcast(self, function, *args) -> list:
+        """
+        Run a function exactly once in every worker, returning the result from each.
+
+        The function and its arguments must be picklable. An exception raised in any worker is
+        raised again here.
+        """
+        return self.pool.map(
+            _synchronised,
+            [(function, args)] * self.number_of_cores,
+            chunksize=1
+        )
+
+    @property
+    def ids(self) -> List[int]:
+        """
+        The process id of every worker in the pool. The worker with the lowest id is treated as the
+        'master core' which handles output during model-fitting.
+        """
+        if self._ids is None:
+            self._ids = self.broadcast(_pid)
+        return self._ids
+
+    def share(self, obj, arrays: Iterable[np.ndarray] = ()) -> int:
+        """
+        Send an object to every worker in the pool, where it is kept alongside any other shared
+        object until it is released with `release`.
+
+        Arrays which the object references may be placed in shared memory. They are copied into
+        shared memory once and every worker reads them in place as read-only arrays, rather than each
+        worker receiving its own copy.
+
+        Parameters
+        ----------
+        obj
+            A picklable object, such as a fitness function
+        arrays
+            Arrays referenced by the object which are placed in shared memory
+
+        Returns
+        -------
+        A key with which workers can retrieve the object using `shared_object`.
+        """
+        key = next(_keys)
+        memories = self._memory[key] = list()
+
+        arrays = list(arrays)
+        if len(arrays) > 0 and shared_memory is None:
+            logger.warning(
+                "Shared memory requires Python 3.8 or later; arrays are copied to every process instead"
+            )
+            arrays = []
+
+        descriptors = dict()
+        for array in arrays:
+            if not isinstance(array, np.ndarray) or array.dtype.hasobject:
+                raise ValueError(
+                    f"Only NumPy arrays of numbers can be placed in shared memory ({type(array)} given)"
+                )
+            if type(array) is not np.ndarray:
+                logger.warning(
+                    f"Arrays of type {type(array).__name__} cannot be placed in shared memory and are copied to every "
+                    f"process instead"
+                )
+                continue
+            memory = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            memories.append(memory)
+            np.ndarray(array.shape, dtype=array.dtype, buffer=memory.buf)[...] = array
+            descriptors[id(array)] = (memory.name, array.shape, array.dtype)
+
+        file = io.BytesIO()
+        _Pickler(file, descriptors).dump(obj)
+
+        try:
+            self.broadcast(_register, key, file.getvalue())
+        except Exception:
+            self.release(key)
+            raise
+        return key
+
+    def release(self, key: int):
+        """
+        Remove an object shared with `share` from every worker in the pool and free the shared memory
+        holding its arrays. Objects shared with other keys are unaffected. The memory is unlinked even if
+        the workers cannot be reached.
+
+        Parameters
+        ----------
+        key
+            The key returned when the object was shared
+        """
+        try:
+            if self._pool is not None:
+                self.broadcast(_release, key)
+        finally:
+            self._release_memory(key)
+
+    def _release_memory(self, key: int):
+        for memory in self._memory.pop(key, ()):
+            memory.close()
+            memory.unlink()
+
+    def map(self, function, iterable, chunksize: Optional[int] = None) -> list:
+        return self.pool.map(function, iterable, chunksize)
+
+    def close(self):
+        for key in list(self._memory):
+            self._release_memory(key)
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+            self._ids = None
+
+    def __reduce__(self):
+        # Processes cannot be pickled. A pool which has been unpickled starts new processes when used.
+        return WorkerPool, (self.number_of_cores,)
+
+
+atexit.register(WorkerPool.close_all)
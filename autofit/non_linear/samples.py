@@ -1,7 +1,11 @@
+import copy
 import csv
 import json
 import math
-from typing import List
+import os
+from collections.abc import Sequence
+from functools import wraps
+from typing import Callable, List
 
 import numpy as np
 
@@ -10,6 +14,55 @@ from autofit.mapper.model import ModelInstance
 from autofit.mapper.model_mapper import ModelMapper
 from autofit.tools import util
 
+_value_headers = ("log_likelihood", "log_prior", "log_posterior", "weights")
+
+
+def samples_cache(func):
+    """
+    Cache the result of a method or property of samples that is computed from the samples.
+
+    Results are kept until the samples are set or appended to, or clear_cache is called. Lists are copied
+    when they are returned and arrays are returned as read-only views, so that callers cannot change the
+    cached value.
+
+    Results are keyed by the qualified name of the method, so an override which calls the method it
+    overrides does not share its cached result.
+
+    Parameters
+    ----------
+    func
+        A method of OptimizerSamples or a subclass taking hashable arguments
+
+    Returns
+    -------
+    The method with its results cached
+    """
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        key = (func.__qualname__, args, tuple(sorted(kwargs.items())))
+        cache = self.__dict__.setdefault("_cache", dict())
+        try:
+            result = cache[key]
+        except KeyError:
+            result = cache[key] = _read_only(func(self, *args, **kwargs))
+        except TypeError:
+            return func(self, *args, **kwargs)
+
+        if isinstance(result, list):
+            return list(result)
+        return result
+
+    return wrapper
+
+
+def _read_only(result):
+    if isinstance(result, np.ndarray):
+        result = result.view()
+        result.flags.writeable = False
+    return result
+
+
 class Sample:
     def __init__(
             self,
@@ -104,10 +157,12 @@ class Sample:
             log_likelihoods: List[float],
             log_priors: List[float],
             weights: List[float]
-    ) -> List["Sample"]:
+    ) -> "SampleArrays":
         """
-        Convenience method to create a list of samples
-        from lists of contained values
+        Convenience method to create samples from lists of contained values.
+
+        The values are stored column-wise and individual Sample objects are only created
+        when they are accessed.
 
         Parameters
         ----------
@@ -119,37 +174,15 @@ class Sample:
 
         Returns
         -------
-        A list of samples
-        """
-        samples = list()
-
-        # Another speed up.
-        model_component_and_parameter_names = model.model_component_and_parameter_names
-
-        for params, log_likelihood, log_prior, weight in zip(
-                parameters,
-                log_likelihoods,
-                log_priors,
-                weights
-        ):
-            arg_dict = {
-                t: param
-                for t, param
-                in zip(
-                    model_component_and_parameter_names,
-                    params
-                )
-            }
-
-            samples.append(
-                cls(
-                    log_likelihood=log_likelihood,
-                    log_prior=log_prior,
-                    weights=weight,
-                    **arg_dict
-                )
-            )
-        return samples
+        The samples, which behave as a list of Sample
+        """
+        return SampleArrays.from_lists(
+            paths=model.model_component_and_parameter_names,
+            parameters=parameters,
+            log_likelihoods=log_likelihoods,
+            log_priors=log_priors,
+            weights=weights
+        )
 
     def instance_for_model(self, model: AbstractPriorModel):
         """
@@ -176,7 +209,376 @@ class Sample:
             )
 
 
-def load_from_table(filename: str) -> List[Sample]:
+class SampleArrays(Sequence):
+    def __init__(
+            self,
+            paths: List[str],
+            parameters: np.ndarray,
+            log_likelihoods: np.ndarray,
+            log_priors: np.ndarray,
+            weights: np.ndarray
+    ):
+        """
+        The samples taken during a search, stored column-wise.
+
+        The parameters of every sample are held in one float64 array with a row for each
+        sample and a column for each path, alongside 1D arrays of the log likelihoods, log
+        priors and weights. This behaves as a sequence of Sample, but each Sample is only
+        created when it is accessed.
+
+        Arrays are not copied if they already have the right type, so samples can be views
+        of a memory mapped file. Samples selected by a mask or indices share the parameters
+        of the samples they were selected from, and only copy the selected rows when their
+        parameters are used.
+
+        Parameters
+        ----------
+        paths
+            The model path of each column of parameters
+        parameters
+            An array of shape (total_samples, len(paths))
+        log_likelihoods
+            The log likelihood of each sample
+        log_priors
+            The log prior of each sample
+        weights
+            The weight of each sample
+        """
+        self.paths = list(paths)
+        self.log_likelihoods = np.asarray(log_likelihoods, dtype=np.float64)
+        self.log_priors = np.asarray(log_priors, dtype=np.float64)
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self._parameters = np.asarray(parameters, dtype=np.float64).reshape(
+            len(self.log_likelihoods),
+            len(self.paths)
+        )
+        self._rows = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_parameters"] = self.parameters
+        state["_rows"] = None
+        return state
+
+    @property
+    def parameters(self) -> np.ndarray:
+        """
+        An array of shape (total_samples, len(paths)) of the parameters of every sample
+        """
+        if self._rows is not None:
+            self._parameters = self._parameters[self._rows]
+            self._rows = None
+        return self._parameters
+
+    def parameter_column(self, path: str) -> np.ndarray:
+        """
+        The value of one parameter for every sample. For selected samples only that
+        parameter is copied.
+
+        Raises
+        ------
+        KeyError
+            If there is no column for the path
+        """
+        index, = self._column_indices([path])
+        if self._rows is None:
+            return self._parameters[:, index]
+        return self._parameters[self._rows, index]
+
+    @classmethod
+    def from_lists(
+            cls,
+            paths: List[str],
+            parameters: List[List[float]],
+            log_likelihoods: List[float],
+            log_priors: List[float],
+            weights: List[float]
+    ) -> "SampleArrays":
+        """
+        Create samples from lists or arrays of values.
+
+        As with zip, values beyond the length of the shortest list are ignored, as are
+        paths beyond the number of parameters in each row.
+        """
+        length = min(
+            len(parameters),
+            len(log_likelihoods),
+            len(log_priors),
+            len(weights)
+        )
+        parameters = np.asarray(parameters[:length], dtype=np.float64)
+        if parameters.ndim == 2:
+            paths = list(paths)[:parameters.shape[1]]
+        return cls(
+            paths=paths,
+            parameters=parameters,
+            log_likelihoods=log_likelihoods[:length],
+            log_priors=log_priors[:length],
+            weights=weights[:length]
+        )
+
+    @classmethod
+    def from_samples(cls, samples: List[Sample]) -> "SampleArrays":
+        """
+        Create samples from a list of Sample objects, which must all have the same paths.
+        """
+        samples = list(samples)
+        paths = list(samples[0].kwargs) if samples else []
+        return cls(
+            paths=paths,
+            parameters=[
+                [sample.kwargs[path] for path in paths]
+                for sample in samples
+            ],
+            log_likelihoods=[sample.log_likelihood for sample in samples],
+            log_priors=[sample.log_prior for sample in samples],
+            weights=[sample.weights for sample in samples]
+        )
+
+    @property
+    def log_posteriors(self) -> np.ndarray:
+        return self.log_likelihoods + self.log_priors
+
+    def parameters_for_paths(self, paths: List[str]) -> np.ndarray:
+        """
+        The parameters of every sample with columns in the order of paths.
+
+        If paths are missing they are converted for backwards compatibility before
+        looking them up again.
+
+        Raises
+        ------
+        KeyError
+            If there is no column for one of the paths
+        """
+        paths = list(paths)
+        if paths == self.paths:
+            return self.parameters
+        return self.parameters[:, self._column_indices(paths)]
+
+    def _column_indices(self, paths: List[str]) -> List[int]:
+        columns = {
+            path: index
+            for index, path
+            in enumerate(self.paths)
+        }
+        try:
+            return [columns[path] for path in paths]
+        except KeyError:
+            paths = util.convert_paths_for_backwards_compatibility(paths=paths, kwargs=columns)
+            return [columns[path] for path in paths]
+
+    def __len__(self):
+        return len(self.log_likelihoods)
+
+    def __getitem__(self, item):
+        """
+        An integer gives the Sample at that index. Anything else that can index a numpy
+        array, such as a slice, boolean mask or array of indices, gives SampleArrays of the
+        selected samples.
+        """
+        if isinstance(item, (int, np.integer)):
+            row = item if self._rows is None else self._rows[item]
+            return Sample(
+                log_likelihood=float(self.log_likelihoods[item]),
+                log_prior=float(self.log_priors[item]),
+                weights=float(self.weights[item]),
+                **dict(zip(self.paths, self._parameters[row].tolist()))
+            )
+
+        selected = SampleArrays.__new__(SampleArrays)
+        selected.paths = self.paths
+        selected.log_likelihoods = self.log_likelihoods[item]
+        selected.log_priors = self.log_priors[item]
+        selected.weights = self.weights[item]
+
+        if isinstance(item, slice) and self._rows is None:
+            selected._parameters = self._parameters[item]
+            selected._rows = None
+        else:
+            selected._parameters = self._parameters
+            selected._rows = (
+                np.arange(len(self)) if self._rows is None else self._rows
+            )[item]
+        return selected
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def concatenate(self, samples) -> "SampleArrays":
+        """
+        Join samples after these samples
+
+        Parameters
+        ----------
+        samples
+            Samples with the same paths, either as SampleArrays or a list of Sample
+
+        Raises
+        ------
+        ValueError
+            If the samples have different paths
+        """
+        if not isinstance(samples, SampleArrays):
+            samples = SampleArrays.from_samples(samples)
+        if len(samples) == 0:
+            return self
+        if len(self) > 0 and samples.paths != self.paths:
+            raise ValueError(
+                f"Cannot join samples with paths {samples.paths} to samples with paths {self.paths}"
+            )
+        return SampleArrays(
+            paths=samples.paths,
+            parameters=np.concatenate((self.parameters.reshape(-1, len(samples.paths)), samples.parameters)),
+            log_likelihoods=np.concatenate((self.log_likelihoods, samples.log_likelihoods)),
+            log_priors=np.concatenate((self.log_priors, samples.log_priors)),
+            weights=np.concatenate((self.weights, samples.weights)),
+        )
+
+    def _table(self) -> np.ndarray:
+        """
+        The rows of a binary samples file: the parameters of each sample followed by its
+        log likelihood, log prior and weight.
+        """
+        return np.column_stack((
+            self.parameters,
+            self.log_likelihoods,
+            self.log_priors,
+            self.weights,
+        )).astype(_binary_dtype, copy=False)
+
+    def write_binary(self, filename: str):
+        """
+        Write the samples to a binary file.
+
+        Every sample is a row of little-endian float64 values, see _table. A JSON header
+        with the same name as the file records the paths of the parameter columns and
+        the number of rows. The header is written after the rows, so the rows it counts
+        are always complete.
+
+        The rows are written to a temporary file which then replaces any existing file,
+        so a file which has been memory mapped by load_from_binary is never truncated.
+
+        Parameters
+        ----------
+        filename
+            The path of the binary file
+        """
+        with open(f"{filename}.tmp", "wb") as f:
+            self._table().tofile(f)
+        os.replace(f"{filename}.tmp", filename)
+        _write_binary_header(filename, self.paths, len(self))
+
+    def append_binary(self, filename: str):
+        """
+        Append the samples to a binary file, creating it if it does not exist.
+
+        Rows already in the file are not rewritten so the cost depends only on the number
+        of samples appended. Rows written after the last header update, for example by an
+        interrupted write, are discarded first.
+
+        Parameters
+        ----------
+        filename
+            The path of the binary file
+
+        Raises
+        ------
+        ValueError
+            If the file has columns for different paths
+        """
+        try:
+            header = _read_binary_header(filename)
+        except FileNotFoundError:
+            return self.write_binary(filename)
+
+        if header["paths"] != self.paths:
+            raise ValueError(
+                f"Cannot append samples with paths {self.paths} to {filename} with paths {header['paths']}"
+            )
+
+        total_samples = header["total_samples"]
+        with open(filename, "r+b") as f:
+            f.truncate(total_samples * _row_size(self.paths))
+            f.seek(0, os.SEEK_END)
+            self._table().tofile(f)
+        _write_binary_header(filename, self.paths, total_samples + len(self))
+
+
+_binary_dtype = np.dtype("<f8")
+
+
+def _row_size(paths: List[str]) -> int:
+    return (len(paths) + 3) * _binary_dtype.itemsize
+
+
+def _header_filename(filename: str) -> str:
+    return f"{os.path.splitext(filename)[0]}.json"
+
+
+def _read_binary_header(filename: str) -> dict:
+    with open(_header_filename(filename)) as f:
+        return json.load(f)
+
+
+def _write_binary_header(filename: str, paths: List[str], total_samples: int):
+    header_filename = _header_filename(filename)
+    with open(f"{header_filename}.tmp", "w") as f:
+        json.dump(
+            {
+                "paths": paths,
+                "columns": paths + ["log_likelihood", "log_prior", "weights"],
+                "total_samples": total_samples,
+            },
+            f
+        )
+    os.replace(f"{header_filename}.tmp", header_filename)
+
+
+def load_from_binary(filename: str, mmap: bool = True) -> SampleArrays:
+    """
+    Load samples written by SampleArrays.write_binary.
+
+    Parameters
+    ----------
+    filename
+        The path of the binary file
+    mmap
+        If True the file is memory mapped, so values are only read from disk when they are used
+
+    Returns
+    -------
+    The samples counted by the header of the file
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file or its header does not exist
+    """
+    header = _read_binary_header(filename)
+    paths = header["paths"]
+    shape = (header["total_samples"], len(paths) + 3)
+
+    if shape[0] == 0:
+        values = np.empty(shape)
+    elif mmap:
+        values = np.memmap(filename, dtype=_binary_dtype, mode="r", shape=shape)
+    else:
+        values = np.fromfile(
+            filename, dtype=_binary_dtype, count=shape[0] * shape[1]
+        ).reshape(shape)
+
+    return SampleArrays(
+        paths=paths,
+        parameters=values[:, :len(paths)],
+        log_likelihoods=values[:, -3],
+        log_priors=values[:, -2],
+        weights=values[:, -1]
+    )
+
+
+def load_from_table(filename: str) -> SampleArrays:
     """
     Load samples from a table
 
@@ -187,28 +589,32 @@ def load_from_table(filename: str) -> List[Sample]:
 
     Returns
     -------
-    A list of samples, one for each row in the CSV
+    The samples, one for each row in the CSV
     """
-    samples = list()
-
     with open(filename, "r+", newline="") as f:
         reader = csv.reader(f)
         headers = next(reader)
-        for row in reader:
-            samples.append(
-                Sample(
-                    **{
-                        header: float(value)
-                        for header, value
-                        in zip(
-                            headers,
-                            row
-                        )
-                    }
-                )
-            )
+        values = np.array(
+            [list(map(float, row)) for row in reader],
+            dtype=np.float64
+        ).reshape(-1, len(headers))
 
-    return samples
+    paths = [
+        header
+        for header in headers
+        if header not in _value_headers
+    ]
+
+    def column(header):
+        return values[:, headers.index(header)]
+
+    return SampleArrays(
+        paths=paths,
+        parameters=values[:, [headers.index(path) for path in paths]],
+        log_likelihoods=column("log_likelihood"),
+        log_priors=column("log_prior"),
+        weights=column("weights")
+    )
 
 
 class OptimizerSamples:
@@ -226,31 +632,70 @@ class OptimizerSamples:
         ----------
         model : af.ModelMapper
             Maps input vectors of unit parameter values to physical values and model instances via priors.
+        samples
+            The samples of the search, either as SampleArrays or a list of Sample
         """
         self.model = model
         self.samples = samples
         self.time = time
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_cache", None)
+        return state
+
+    def __setstate__(self, state):
+        # Samples pickled before they were stored column-wise hold a list of Sample
+        if "samples" in state:
+            state["_samples"] = SampleArrays.from_samples(state.pop("samples"))
+        self.__dict__.update(state)
+
     @property
-    def parameters(self):
+    def samples(self) -> SampleArrays:
+        return self._samples
 
-        paths = self.model.model_component_and_parameter_names
+    @samples.setter
+    def samples(self, samples):
+        if not isinstance(samples, SampleArrays):
+            samples = SampleArrays.from_samples(samples)
+        self._samples = samples
+        self.clear_cache()
 
-        try:
-            return [
-                sample.parameters_for_model(
-                    self.model, paths
-                )
-                for sample in self.samples
-            ]
-        except KeyError:
-            paths = util.convert_paths_for_backwards_compatibility(paths=paths, kwargs=self.samples[0].kwargs)
-            return [
-                sample.parameters_for_model(
-                    self.model, paths
-                )
-                for sample in self.samples
-            ]
+    def append(self, samples):
+        """
+        Add samples after the existing samples, for example those taken since a search was last updated.
+
+        Parameters
+        ----------
+        samples
+            The new samples, which must have the same paths, either as SampleArrays or a list of Sample
+        """
+        self.samples = self.samples.concatenate(samples)
+
+    def clear_cache(self):
+        """
+        Remove all statistics cached from the samples. This is done automatically when samples are set or
+        appended, but must be called if the arrays of the samples are changed in place.
+        """
+        self.__dict__.pop("_cache", None)
+
+    @property
+    def _parameters(self) -> np.ndarray:
+        """
+        The parameters of every sample as an array of shape (total_samples, prior_count), with columns
+        ordered as the priors of the model.
+        """
+        return self._parameters_for_paths(
+            tuple(self.model.model_component_and_parameter_names)
+        )
+
+    @samples_cache
+    def _parameters_for_paths(self, paths) -> np.ndarray:
+        return self.samples.parameters_for_paths(paths)
+
+    @property
+    def parameters(self):
+        return self._parameters.tolist()
 
     @property
     def total_samples(self):
@@ -258,42 +703,23 @@ class OptimizerSamples:
 
     @property
     def weights(self):
-        return [
-            sample.weights
-            for sample
-            in self.samples
-        ]
+        return self.samples.weights.tolist()
 
     @property
     def log_likelihoods(self):
-        return [
-            sample.log_likelihood
-            for sample
-            in self.samples
-        ]
+        return self.samples.log_likelihoods.tolist()
 
     @property
     def log_posteriors(self):
-        return [
-            sample.log_posterior
-            for sample
-            in self.samples
-        ]
+        return self.samples.log_posteriors.tolist()
 
     @property
     def log_priors(self):
-        return [
-            sample.log_prior
-            for sample
-            in self.samples
-        ]
+        return self.samples.log_priors.tolist()
 
     @property
     def parameters_extract(self):
-        return [
-            [params[i] for params in self.parameters]
-            for i in range(self.model.prior_count)
-        ]
+        return self._parameters.T.tolist()
 
     @property
     def _headers(self) -> List[str]:
@@ -313,19 +739,17 @@ class OptimizerSamples:
         """
         Rows in the samples table
         """
-
-        log_likelihoods = self.log_likelihoods
-        log_priors = self.log_priors
-        log_posteriors = self.log_posteriors
-        weights = self.weights
-
-        for index, row in enumerate(self.parameters):
-            yield row + [
-                log_likelihoods[index],
-                log_priors[index],
-                log_posteriors[index],
-                weights[index],
-            ]
+        return self._rows_from(start=0)
+
+    def _rows_from(self, start: int) -> List[List[float]]:
+        samples = self.samples[start:]
+        yield from np.column_stack((
+            self._parameters[start:],
+            samples.log_likelihoods,
+            samples.log_priors,
+            samples.log_posteriors,
+            samples.weights,
+        )).tolist()
 
     def write_table(self, filename: str):
         """
@@ -340,8 +764,32 @@ class OptimizerSamples:
         with open(filename, "w+", newline="") as f:
             writer = csv.writer(f)
             writer.writerow(self._headers)
-            for row in self._rows:
-                writer.writerow(row)
+            writer.writerows(self._rows)
+
+    def append_table(self, filename: str, start: int):
+        """
+        Append samples to a table written by write_table
+
+        Parameters
+        ----------
+        filename
+            The table the samples are appended to
+        start
+            The index of the first sample to append, which is usually the number of samples already in the table
+        """
+        with open(filename, "a", newline="") as f:
+            csv.writer(f).writerows(self._rows_from(start=start))
+
+    def write_binary(self, filename: str):
+        """
+        Write the samples to a binary file which can be memory mapped when it is loaded
+
+        Parameters
+        ----------
+        filename
+            Where the samples are to be written
+        """
+        self.samples.write_binary(filename)
 
     def info_to_json(self, filename):
 
@@ -350,44 +798,82 @@ class OptimizerSamples:
         with open(filename, 'w') as outfile:
             json.dump(info, outfile)
 
+    def summary(self, sigma: float = None) -> dict:
+        """
+        Values computed from the samples which can be written alongside them, so that results can be used
+        without loading every sample (see LazySamples).
+
+        Parameters
+        ----------
+        sigma
+            If given, the Gaussian priors at this sigma used to pass priors to a subsequent phase are included
+        """
+        summary = {
+            "total_samples": int(self.total_samples),
+            "time": self.time,
+            "max_log_likelihood": self.max_log_likelihood,
+            "max_log_likelihood_vector": self.max_log_likelihood_vector,
+            "max_log_posterior_vector": self.max_log_posterior_vector,
+        }
+        if sigma is not None:
+            summary["gaussian_priors_at_sigma"] = [
+                [sigma, self.gaussian_priors_at_sigma(sigma=sigma)]
+            ]
+        return summary
+
+    def summary_to_json(self, filename: str, sigma: float = None):
+        """
+        Write the summary of the samples to a json file.
+        """
+        with open(filename, "w") as outfile:
+            json.dump(self.summary(sigma=sigma), outfile)
+
+    @property
+    @samples_cache
+    def max_log_likelihood_index(self) -> int:
+        """The index of the sample with the highest log likelihood, ignoring samples whose log likelihood is NaN."""
+        log_likelihoods = self.samples.log_likelihoods
+        return int(np.argmax(np.where(np.isnan(log_likelihoods), -np.inf, log_likelihoods)))
+
     @property
     def max_log_likelihood_sample(self) -> Sample:
-        """The index of the sample with the highest log likelihood."""
-        most_likely_sample = None
-        for sample in self.samples:
-            if most_likely_sample is None or sample.log_likelihood > most_likely_sample.log_likelihood:
-                most_likely_sample = sample
-        return most_likely_sample
+        """The sample with the highest log likelihood."""
+        return self.samples[self.max_log_likelihood_index]
 
     @property
+    def max_log_likelihood(self) -> float:
+        """The highest log likelihood of any sample."""
+        return float(self.samples.log_likelihoods[self.max_log_likelihood_index])
+
+    @property
+    @samples_cache
     def max_log_likelihood_vector(self) -> [float]:
         """ The parameters of the maximum log likelihood sample of the `NonLinearSearch` returned as a list of values."""
-        return self.max_log_likelihood_sample.parameters_for_model(
-            self.model
-        )
+        return self._parameters[self.max_log_likelihood_index].tolist()
 
     @property
     def max_log_likelihood_instance(self) -> ModelInstance:
         """  The parameters of the maximum log likelihood sample of the `NonLinearSearch` returned as a model instance."""
-        return self.max_log_likelihood_sample.instance_for_model(
-            self.model
-        )
+        return self.model.instance_from_vector(vector=self.max_log_likelihood_vector)
 
     @property
+    @samples_cache
     def max_log_posterior_index(self) -> int:
         """The index of the sample with the highest log posterior."""
-        return int(np.argmax(self.log_posteriors))
+        return int(np.argmax(self.samples.log_posteriors))
 
     @property
+    @samples_cache
     def max_log_posterior_vector(self) -> [float]:
         """ The parameters of the maximum log posterior sample of the `NonLinearSearch` returned as a list of values."""
-        return self.parameters[self.max_log_posterior_index]
+        return self._parameters[self.max_log_posterior_index].tolist()
 
     @property
     def max_log_posterior_instance(self) -> ModelInstance:
         """  The parameters of the maximum log posterior sample of the `NonLinearSearch` returned as a model instance."""
         return self.model.instance_from_vector(vector=self.max_log_posterior_vector)
 
+    @samples_cache
     def gaussian_priors_at_sigma(self, sigma) -> [list]:
         """`GaussianPrior`s of every parameter used to link its inferred values and errors to priors used to sample the
         same (or similar) parameters in a subsequent phase, where:
@@ -412,7 +898,63 @@ class OptimizerSamples:
         sample_index : int
             The sample index of the weighted sample to return.
         """
-        return self.model.instance_from_vector(vector=self.parameters[sample_index])
+        return self.model.instance_from_vector(vector=self._parameters[sample_index].tolist())
+
+    def where(self, mask) -> "OptimizerSamples":
+        """
+        The samples for which a mask is True, as a samples object of the same type with the same attributes.
+
+        Parameters of the selected samples are not copied until they are used, so selecting samples from a large
+        search is quick.
+
+        Parameters
+        ----------
+        mask
+            A boolean for every sample, for example from mask_within_ranges or a comparison of the arrays of samples
+        """
+        mask = np.asarray(mask, dtype=bool)
+        if mask.shape != (len(self.samples),):
+            raise ValueError(
+                f"A mask of shape {mask.shape} cannot select from {len(self.samples)} samples"
+            )
+        selected = copy.copy(self)
+        selected.samples = self.samples[mask]
+        return selected
+
+    def parameter_values(self, parameter) -> np.ndarray:
+        """
+        The value of one parameter for every sample.
+
+        Parameters
+        ----------
+        parameter
+            The index of the parameter in the model's vector or its path, as given by
+            model_component_and_parameter_names
+        """
+        paths = self.model.model_component_and_parameter_names
+        if not isinstance(parameter, str):
+            parameter = paths[parameter]
+        try:
+            return self.samples.parameter_column(parameter)
+        except KeyError:
+            return self._parameters[:, paths.index(parameter)]
+
+    def mask_within_ranges(self, ranges) -> np.ndarray:
+        """
+        A mask which is True for samples with every given parameter strictly inside its range.
+
+        Masks can be combined with & and | before being passed to where.
+
+        Parameters
+        ----------
+        ranges
+            A dictionary mapping parameters, as indices or paths (see parameter_values), to (lower, upper) ranges
+        """
+        mask = np.ones(len(self.samples), dtype=bool)
+        for parameter, (lower, upper) in ranges.items():
+            values = self.parameter_values(parameter)
+            mask &= (values > lower) & (values < upper)
+        return mask
 
 
 class PDFSamples(OptimizerSamples):
@@ -473,6 +1015,7 @@ class PDFSamples(OptimizerSamples):
         return self.total_samples
 
     @property
+    @samples_cache
     def pdf_converged(self) -> bool:
         """ To analyse and visualize samples the analysis must be sufficiently converged to produce smooth enough
         PDF for error estimate and PDF generation.
@@ -483,19 +1026,31 @@ class PDFSamples(OptimizerSamples):
 
         This does not necessarily imply the `NonLinearSearch` has converged overall, only that errors and visualization
         can be performed numerically.."""
-        if np.max(self.weights) > 0.99:
+        if np.max(self.samples.weights) > 0.99:
             return False
         return True
 
     @property
+    @samples_cache
+    def weighted_quantiles(self) -> "WeightedQuantiles":
+        """
+        The weighted quantiles of every parameter.
+
+        The parameters are sorted when this is first accessed and then reused for every quantile, so the medians and
+        values at any number of sigma share the work of sorting the samples.
+        """
+        return WeightedQuantiles(
+            values=self._parameters,
+            weights=self.samples.weights
+        )
+
+    @property
+    @samples_cache
     def median_pdf_vector(self) -> [float]:
         """ The median of the probability density function (PDF) of every parameter marginalized in 1D, returned
         as a list of values."""
         if self.pdf_converged:
-            return [
-                quantile(x=params, q=0.5, weights=self.weights)[0]
-                for params in self.parameters_extract
-            ]
+            return self.weighted_quantiles(0.5)[0].tolist()
         return self.max_log_likelihood_vector
 
     @property
@@ -504,6 +1059,7 @@ class PDFSamples(OptimizerSamples):
         as a model instance."""
         return self.model.instance_from_vector(vector=self.median_pdf_vector)
 
+    @samples_cache
     def vector_at_sigma(self, sigma) -> [(float, float)]:
         """ The value of every parameter marginalized in 1D at an input sigma value of its probability density function
         (PDF), returned as two lists of values corresponding to the lower and upper values parameter values.
@@ -526,30 +1082,21 @@ class PDFSamples(OptimizerSamples):
 
         if self.pdf_converged:
             limit = math.erf(0.5 * sigma * math.sqrt(2))
+            lowers, uppers = self.weighted_quantiles([1.0 - limit, limit]).tolist()
+            return list(zip(lowers, uppers))
 
-            lower_errors = [
-                quantile(x=params, q=1.0 - limit, weights=self.weights)[0]
-                for params in self.parameters_extract
-            ]
-
-            upper_errors = [
-                quantile(x=params, q=limit, weights=self.weights)[0]
-                for params in self.parameters_extract
-            ]
+        return self._unconverged_vector_at_sigma()
 
-            return [(lower, upper) for lower, upper in zip(lower_errors, upper_errors)]
-
-        parameters_min = list(
-            np.min(self.parameters[-self.unconverged_sample_size:], axis=0)
-        )
-        parameters_max = list(
-            np.max(self.parameters[-self.unconverged_sample_size:], axis=0)
-        )
-
-        return [
-            (parameters_min[index], parameters_max[index])
-            for index in range(len(parameters_min))
-        ]
+    def _unconverged_vector_at_sigma(self) -> [(float, float)]:
+        """
+        The range of every parameter over the most recent samples, used instead of the PDF when the samples have
+        not converged.
+        """
+        parameters = self._parameters[-self.unconverged_sample_size:]
+        return list(zip(
+            np.min(parameters, axis=0).tolist(),
+            np.max(parameters, axis=0).tolist()
+        ))
 
     def vector_at_upper_sigma(self, sigma) -> [float]:
         """The upper value of every parameter marginalized in 1D at an input sigma value of its probability density
@@ -627,6 +1174,7 @@ class PDFSamples(OptimizerSamples):
             assert_priors_in_limits=False,
         )
 
+    @samples_cache
     def error_vector_at_sigma(self, sigma) -> [(float, float)]:
         """The lower and upper error of every parameter marginalized in 1D at an input sigma value of its probability
         density function (PDF), returned as a list.
@@ -643,6 +1191,7 @@ class PDFSamples(OptimizerSamples):
         error_vector_upper = self.error_vector_at_upper_sigma(sigma=sigma)
         return [(lower, upper) for lower, upper in zip(error_vector_lower, error_vector_upper)]
 
+    @samples_cache
     def error_vector_at_upper_sigma(self, sigma) -> [float]:
         """The upper error of every parameter marginalized in 1D at an input sigma value of its probability density
         function (PDF), returned as a list.
@@ -656,14 +1205,9 @@ class PDFSamples(OptimizerSamples):
             PDF).
         """
         uppers = self.vector_at_upper_sigma(sigma=sigma)
-        return list(
-            map(
-                lambda upper, median_pdf: upper - median_pdf,
-                uppers,
-                self.median_pdf_vector,
-            )
-        )
+        return (np.array(uppers) - np.array(self.median_pdf_vector)).tolist()
 
+    @samples_cache
     def error_vector_at_lower_sigma(self, sigma) -> [float]:
         """The lower error of every parameter marginalized in 1D at an input sigma value of its probability density
         function (PDF), returned as a list.
@@ -677,14 +1221,9 @@ class PDFSamples(OptimizerSamples):
             PDF).
         """
         lowers = self.vector_at_lower_sigma(sigma=sigma)
-        return list(
-            map(
-                lambda lower, median_pdf: median_pdf - lower,
-                lowers,
-                self.median_pdf_vector,
-            )
-        )
+        return (np.array(self.median_pdf_vector) - np.array(lowers)).tolist()
 
+    @samples_cache
     def error_magnitude_vector_at_sigma(self, sigma) -> [float]:
         """ The magnitude of every error after marginalization in 1D at an input sigma value of the probability density
         function (PDF), returned as two lists of values corresponding to the lower and upper errors.
@@ -698,7 +1237,7 @@ class PDFSamples(OptimizerSamples):
             The sigma within which the PDF is used to estimate errors (e.g. sigma = 1.0 uses 0.6826 of the PDF)."""
         uppers = self.vector_at_upper_sigma(sigma=sigma)
         lowers = self.vector_at_lower_sigma(sigma=sigma)
-        return list(map(lambda upper, lower: upper - lower, uppers, lowers))
+        return (np.array(uppers) - np.array(lowers)).tolist()
 
     def error_instance_at_sigma(self, sigma) -> ModelInstance:
         """ The error of every parameter marginalized in 1D at an input sigma value of its probability density function
@@ -749,6 +1288,7 @@ class PDFSamples(OptimizerSamples):
             assert_priors_in_limits=False,
         )
 
+    @samples_cache
     def gaussian_priors_at_sigma(self, sigma) -> [list]:
         """`GaussianPrior`s of every parameter used to link its inferred values and errors to priors used to sample the
         same (or similar) parameters in a subsequent phase, where:
@@ -821,6 +1361,115 @@ class PDFSamples(OptimizerSamples):
             )
         )
 
+    def summary(self, sigma: float = None) -> dict:
+        summary = super().summary(sigma=sigma)
+        summary["median_pdf_vector"] = self.median_pdf_vector
+        return summary
+
+    @property
+    def _posterior_weights(self) -> np.ndarray:
+        """
+        The weight of every sample in the posterior, which searches that discard some samples (e.g. during burn-in)
+        set to zero for those samples.
+        """
+        return self.samples.weights
+
+    @property
+    @samples_cache
+    def effective_sample_size(self) -> float:
+        """
+        The effective number of samples of the posterior given the weights of the samples, (sum w)^2 / sum w^2.
+
+        This is the number of samples for equally weighted samples and approaches 1 if one sample holds most of the
+        weight.
+        """
+        weights = self._posterior_weights
+        total = np.sum(weights)
+        if total == 0:
+            return 0.0
+        return float(total ** 2 / np.sum(weights ** 2))
+
+    def resample_equal_weights(self, n: int, seed: int = None) -> "PDFSamples":
+        """
+        Draw n equally weighted samples of the posterior from these samples using systematic resampling.
+
+        Each sample is drawn a number of times proportional to its weight, so a small number of samples with equal
+        weights represents a posterior of many weighted samples. Systematic resampling places n evenly spaced points
+        with a single random offset on the cumulative weights, which gives less scatter than drawing every sample
+        independently.
+
+        Repeated calls with the same n and seed return the same samples until the samples change. Calls without a
+        seed draw new samples every time.
+
+        Parameters
+        ----------
+        n
+            The number of samples to draw
+        seed
+            A seed for the random offset
+
+        Returns
+        -------
+        PDFSamples of n samples which each have a weight 1 / n
+        """
+        if seed is None:
+            return self._resample_equal_weights(n, seed)
+        return self._seeded_resample_equal_weights(n, seed)
+
+    @samples_cache
+    def _seeded_resample_equal_weights(self, n: int, seed: int) -> "PDFSamples":
+        return self._resample_equal_weights(n, seed)
+
+    def _resample_equal_weights(self, n: int, seed: int = None) -> "PDFSamples":
+        if n < 1:
+            raise ValueError(f"Cannot draw {n} samples")
+
+        cumulative_weights = np.cumsum(self._posterior_weights)
+        if len(cumulative_weights) == 0 or cumulative_weights[-1] <= 0:
+            raise ValueError("Samples with no weight cannot be resampled")
+        cumulative_weights /= cumulative_weights[-1]
+
+        points = (np.random.default_rng(seed).random() + np.arange(n)) / n
+        indices = np.minimum(
+            np.searchsorted(cumulative_weights, points, side="right"),
+            len(cumulative_weights) - 1
+        )
+
+        selected = self.samples[indices]
+        return PDFSamples(
+            model=self.model,
+            samples=SampleArrays(
+                paths=selected.paths,
+                parameters=selected.parameters,
+                log_likelihoods=selected.log_likelihoods,
+                log_priors=selected.log_priors,
+                weights=np.full(n, 1.0 / n),
+            ),
+            unconverged_sample_size=self._unconverged_sample_size,
+            time=self.time,
+        )
+
+    def thin(self, target_ess: int = None, seed: int = None) -> "PDFSamples":
+        """
+        Thin the samples to equally weighted samples of the posterior, with one sample for every effective sample.
+
+        Parameters
+        ----------
+        target_ess
+            The number of samples wanted. Fewer samples are drawn if the effective sample size is smaller, because
+            drawing more would only repeat samples.
+        seed
+            A seed for the random offset of the resampling
+
+        Returns
+        -------
+        PDFSamples with equal weights
+        """
+        n = self.effective_sample_size
+        if target_ess is not None:
+            n = min(n, target_ess)
+        return self.resample_equal_weights(max(int(round(n)), 1), seed)
+
     def output_pdf_plots(self):
         """Output plots of the probability density functions of the non-linear seach.
 
@@ -935,7 +1584,10 @@ class MCMCSamples(PDFSamples):
     def info_to_json(self, filename):
 
         info = {
-            "auto_correlation_times": None,
+            "auto_correlation_times": (
+                None if self.auto_correlation_times is None
+                else np.asarray(self.auto_correlation_times).tolist()
+            ),
             "auto_correlation_check_size": self.auto_correlation_check_size,
             "auto_correlation_required_length": self.auto_correlation_required_length,
             "auto_correlation_change_threshold": self.auto_correlation_change_threshold,
@@ -947,7 +1599,13 @@ class MCMCSamples(PDFSamples):
         with open(filename, 'w') as outfile:
             json.dump(info, outfile)
 
+    def summary(self, sigma: float = None) -> dict:
+        summary = super().summary(sigma=sigma)
+        summary["log_evidence"] = self.log_evidence
+        return summary
+
     @property
+    @samples_cache
     def pdf_converged(self):
         """ To analyse and visualize samples using *corner.py*, the analysis must be sufficiently converged to produce
         smooth enough PDF for analysis. This property checks whether the non-linear search's samples are sufficiently
@@ -998,19 +1656,18 @@ class MCMCSamples(PDFSamples):
         return converged
 
     @property
+    @samples_cache
     def median_pdf_vector(self) -> [float]:
         """ The median of the probability density function (PDF) of every parameter marginalized in 1D, returned
         as a list of values.
 
         This is computed by binning all sampls after burn-in into a histogram and take its median (e.g. 50%) value. """
         if self.pdf_converged:
-            return [
-                float(np.percentile(self.samples_after_burn_in[:, i], [50]))
-                for i in range(self.model.prior_count)
-            ]
+            return np.percentile(self.samples_after_burn_in, 50, axis=0).tolist()
 
         return self.max_log_likelihood_vector
 
+    @samples_cache
     def vector_at_sigma(self, sigma) -> [float]:
         """ The value of every parameter marginalized in 1D at an input sigma value of its probability density function
         (PDF), returned as two lists of values corresponding to the lower and upper values parameter values.
@@ -1032,26 +1689,12 @@ class MCMCSamples(PDFSamples):
         limit = math.erf(0.5 * sigma * math.sqrt(2))
 
         if self.pdf_converged:
-            samples = self.samples_after_burn_in
+            lowers, uppers = np.percentile(
+                self.samples_after_burn_in, [100.0 * (1.0 - limit), 100.0 * limit], axis=0
+            ).tolist()
+            return list(zip(lowers, uppers))
 
-            return [
-                tuple(
-                    np.percentile(samples[:, i], [100.0 * (1.0 - limit), 100.0 * limit])
-                )
-                for i in range(self.model.prior_count)
-            ]
-
-        parameters_min = list(
-            np.min(self.parameters[-self.unconverged_sample_size:], axis=0)
-        )
-        parameters_max = list(
-            np.max(self.parameters[-self.unconverged_sample_size:], axis=0)
-        )
-
-        return [
-            (parameters_min[index], parameters_max[index])
-            for index in range(len(parameters_min))
-        ]
+        return self._unconverged_vector_at_sigma()
 
 
 class NestSamples(PDFSamples):
@@ -1110,11 +1753,16 @@ class NestSamples(PDFSamples):
         with open(filename, 'w') as outfile:
             json.dump(info, outfile)
 
+    def summary(self, sigma: float = None) -> dict:
+        summary = super().summary(sigma=sigma)
+        summary["log_evidence"] = self.log_evidence
+        return summary
+
     @property
     def total_accepted_samples(self) -> int:
         """The total number of accepted samples performed by the nested sampler.
         """
-        return len(self.log_likelihoods)
+        return len(self.samples)
 
     @property
     def acceptance_ratio(self) -> float:
@@ -1149,39 +1797,154 @@ class NestSamples(PDFSamples):
             to be kept.
         """
 
-        parameter_list = []
-        log_likelihoods = []
-        log_priors = []
-        weights = []
+        return self.where(
+            self.mask_within_ranges({parameter_index: parameter_range})
+        )
 
-        for sample in self.samples:
+class LazySamples:
+    def __init__(
+            self,
+            model: AbstractPriorModel,
+            summary: dict,
+            load: Callable[[], OptimizerSamples]
+    ):
+        """
+        The samples of a search, which are only loaded when they are needed.
 
-            parameters = sample.parameters_for_model(model=self.model)
+        Values in the summary of the samples (see OptimizerSamples.summary), such as the maximum log likelihood
+        vector, median PDF vector and log evidence, and the instances created from them are given without loading
+        the samples. Anything else is taken from the samples, which are loaded the first time they are needed.
 
-            if (parameters[parameter_index] > parameter_range[0]) and (parameters[parameter_index] < parameter_range[1]):
+        Parameters
+        ----------
+        model
+            The model of the search
+        summary
+            A dictionary of values computed from the samples
+        load
+            A function which loads the samples
+        """
+        self.model = model
+        self.summary = summary
+        self._load = load
+        self._loaded_samples = None
 
-                parameter_list.append(parameters)
-                log_likelihoods.append(sample.log_likelihood)
-                log_priors.append(sample.log_prior)
-                weights.append(sample.weights)
+    @classmethod
+    def from_json(cls, model: AbstractPriorModel, filename: str, load: Callable[[], OptimizerSamples]):
+        """
+        Create lazy samples from a summary written by OptimizerSamples.summary_to_json.
 
-        samples = Sample.from_lists(
-            model=self.model,
-            parameters=parameter_list,
-            log_likelihoods=log_likelihoods,
-            log_priors=log_priors,
-            weights=weights
-        )
+        Raises
+        ------
+        FileNotFoundError
+            If there is no summary file
+        """
+        with open(filename) as infile:
+            return cls(model=model, summary=json.load(infile), load=load)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_loaded_samples"] = None
+        return state
+
+    @property
+    def loaded_samples(self) -> OptimizerSamples:
+        """
+        The samples, which are loaded when this is first accessed.
+        """
+        if self._loaded_samples is None:
+            self._loaded_samples = self._load()
+        return self._loaded_samples
+
+    def __getattr__(self, item):
+        if item.startswith("_"):
+            raise AttributeError(item)
+        summary = self.__dict__.get("summary", {})
+        if item in summary:
+            return copy.copy(summary[item])
+        return getattr(self.loaded_samples, item)
+
+    def _instance_from(self, name: str) -> ModelInstance:
+        return self.model.instance_from_vector(vector=getattr(self, name))
+
+    @property
+    def max_log_likelihood_instance(self) -> ModelInstance:
+        return self._instance_from("max_log_likelihood_vector")
+
+    @property
+    def max_log_posterior_instance(self) -> ModelInstance:
+        return self._instance_from("max_log_posterior_vector")
+
+    @property
+    def median_pdf_instance(self) -> ModelInstance:
+        return self._instance_from("median_pdf_vector")
+
+    def gaussian_priors_at_sigma(self, sigma) -> [list]:
+        """
+        The Gaussian priors of every parameter at sigma, which are taken from the summary if it was written with
+        the same sigma.
+        """
+        for summary_sigma, gaussian_priors in self.summary.get("gaussian_priors_at_sigma", []):
+            if summary_sigma == sigma:
+                return list(map(tuple, gaussian_priors))
+        return self.loaded_samples.gaussian_priors_at_sigma(sigma=sigma)
+
+
+class WeightedQuantiles:
+    def __init__(self, values, weights):
+        """
+        Weighted quantiles of every column of an array of samples.
+
+        Every column is sorted once, in a single call, and the cumulative distribution of its weights is kept.
+        Any number of quantiles can then be computed for every column without sorting again. The quantiles are
+        the same as those given by quantile for each column on its own.
+
+        Parameters
+        ----------
+        values
+            An array of shape (total_samples, total_columns)
+        weights
+            The weight of each sample
+
+        Raises
+        ------
+        ValueError
+            If there is not one weight for each sample
+        """
+        values = np.asarray(values, dtype=np.float64)
+        weights = np.atleast_1d(weights)
+        if len(values) != len(weights):
+            raise ValueError("Dimension mismatch: len(weights) != len(x)")
+
+        order = np.argsort(values, axis=0)
+        self._sorted = np.take_along_axis(values, order, axis=0)
+
+        cdf = np.cumsum(weights[order], axis=0)[:-1]
+        cdf /= cdf[-1]
+        self._cdf = np.concatenate((np.zeros((1, values.shape[1])), cdf))
+
+    def __call__(self, q) -> np.ndarray:
+        """
+        Compute quantiles of every column.
+
+        Parameters
+        ----------
+        q
+            A quantile or list of quantiles, each in the range [0, 1]
+
+        Returns
+        -------
+        An array of shape (len(q), total_columns), each row of which is the value of every column at a quantile
+        """
+        q = np.atleast_1d(q)
+        if np.any(q < 0.0) or np.any(q > 1.0):
+            raise ValueError("Quantiles must be between 0 and 1")
+
+        values = np.empty((len(q), self._sorted.shape[1]))
+        for index in range(self._sorted.shape[1]):
+            values[:, index] = np.interp(q, self._cdf[:, index], self._sorted[:, index])
+        return values
 
-        return NestSamples(
-            model=self.model,
-            samples=samples,
-            number_live_points=self.number_live_points,
-            log_evidence=self.log_evidence,
-            total_samples=self.total_samples,
-            unconverged_sample_size=self.unconverged_sample_size,
-            time=self.time
-        )
 
 def quantile(x, q, weights=None):
     """
@@ -1,8 +1,14 @@
+import os
+import pickle
 from os import path
+
 import pytest
 
 import autofit as af
+from autofit.aggregator.phase_output import PhaseOutput
+from autofit.mock import mock
 from autofit.mock.mock import MockPhaseOutput
+from autofit.non_linear.samples import Sample
 
 
 def test_completed_aggregator(aggregator_directory):
@@ -96,3 +102,36 @@ class TestOperations:
             "phase2 dataset1",
             "phase2 dataset2",
         ]
+
+
+class TestIncompleteSamples:
+    @pytest.fixture(name="model")
+    def make_model(self):
+        return af.ModelMapper(mock_class=mock.MockClassx2)
+
+    @pytest.fixture(name="phase_output")
+    def make_phase_output(self, tmp_path, model):
+        (tmp_path / "metadata").write_text("pipeline=pipeline\nphase=phase\ndataset_name=dataset\n")
+        (tmp_path / "pickles").mkdir()
+        with open(tmp_path / "pickles" / "model.pickle", "wb") as f:
+            pickle.dump(model, f)
+        (tmp_path / "samples").mkdir()
+        Sample.from_lists(
+            model=model,
+            parameters=[[float(i), 2.0 * i] for i in range(5)],
+            log_likelihoods=[float(i) for i in range(5)],
+            log_priors=5 * [0.0],
+            weights=5 * [1.0],
+        ).write_binary(filename=str(tmp_path / "samples" / "samples.bin"))
+        return PhaseOutput(str(tmp_path))
+
+    def test_samples_from_binary(self, phase_output):
+        samples = phase_output.samples
+
+        assert isinstance(samples, af.PDFSamples)
+        assert samples.max_log_likelihood_vector == [4.0, 8.0]
+
+    def test_no_samples(self, phase_output):
+        os.remove(path.join(phase_output.directory, "samples", "samples.bin"))
+
+        assert phase_output.samples is None
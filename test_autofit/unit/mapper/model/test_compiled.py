@@ -0,0 +1,301 @@
+import pickle
+
+import pytest
+
+import autofit as af
+from autofit import exc
+from autofit.mock import mock
+
+
+@pytest.fixture(name="model")
+def make_model():
+    model = af.ModelMapper()
+    model.one = mock.MockClassx4
+    model.tuple = af.PriorModel(mock.MockClassx2Tuple)
+    model.collection = af.CollectionPriorModel(
+        first=mock.MockClassx2,
+        second=mock.MockClassx2
+    )
+    return model
+
+
+class TestCompile:
+    def test_cached(self, model):
+        assert model.compile() is model.compile()
+
+    def test_instance(self, model):
+        vector = [0.05 * (i + 1) for i in range(model.prior_count)]
+        compiled_instance = model.compile().instance_from_vector(vector)
+        instance = model.instance_for_arguments(
+            dict(zip(model.compile().priors, vector))
+        )
+
+        assert compiled_instance.one.one == instance.one.one
+        assert compiled_instance.one.four == instance.one.four
+        assert compiled_instance.tuple.one_tuple == instance.tuple.one_tuple
+        assert compiled_instance.collection.first.one == instance.collection.first.one
+        assert compiled_instance.collection.second.two == instance.collection.second.two
+
+    def test_invalidated_by_mutation(self, model):
+        compiled = model.compile()
+        model.one.one = 1.0
+
+        assert model.compile() is not compiled
+        assert model.compile().prior_count == 9
+
+        instance = model.instance_from_vector([0.5] * 9)
+        assert instance.one.one == 1.0
+
+    def test_invalidated_by_nested_mutation(self, model):
+        compiled = model.compile()
+        model.collection.first.one = 2.0
+
+        assert model.compile() is not compiled
+        assert model.instance_from_vector([0.5] * 9).collection.first.one == 2.0
+
+    def test_invalidated_by_tuple_mutation(self, model):
+        model.compile()
+        model.tuple.one_tuple.one_tuple_0 = 3.0
+
+        instance = model.instance_from_vector([0.5] * 9)
+        assert instance.tuple.one_tuple == (3.0, 0.5)
+
+    def test_not_invalidated_by_other_models(self, model):
+        compiled = model.compile()
+
+        af.UniformPrior(0.0, 1.0)
+        other = af.PriorModel(mock.MockClassx2)
+        other.one = 1.0
+        model.copy().one.one = 1.0
+
+        assert model.compile() is compiled
+
+    def test_invalidated_for_containing_models(self, model):
+        compiled = model.compile()
+        collection_compiled = model.collection.compile()
+        tuple_compiled = model.tuple.compile()
+
+        model.collection.first.two.upper_limit = 0.5
+
+        assert model.compile() is not compiled
+        assert model.collection.compile() is not collection_compiled
+        assert model.tuple.compile() is tuple_compiled
+
+    def test_not_pickled(self, model):
+        model.compile()
+        assert "_structure_cache" not in pickle.loads(
+            pickle.dumps(model)
+        ).__dict__
+        assert "_structure_cache" not in model.copy().__dict__
+
+    def test_limits(self, model):
+        with pytest.raises(exc.PriorLimitException):
+            model.instance_from_vector([2.0] * 10)
+
+    def test_limits_nan(self, model):
+        with pytest.raises(exc.PriorLimitException):
+            model.instance_from_vector([float("nan")] + [0.5] * 9)
+
+    def test_limits_not_asserted(self, model):
+        instance = model.compile().instance_from_vector(
+            [200.0] + [0.5] * 9,
+            assert_priors_in_limits=False
+        )
+        assert instance.one.one == 200.0
+
+    def test_changed_limits(self):
+        model = af.PriorModel(
+            mock.MockClassx2,
+            one=af.UniformPrior(0.0, 1.0),
+            two=af.UniformPrior(0.0, 1.0),
+        )
+        model.instance_from_vector([0.5, 0.5])
+
+        model.one.upper_limit = 0.25
+
+        with pytest.raises(exc.PriorLimitException):
+            model.instance_from_vector([0.5, 0.5])
+
+    def test_assertions(self):
+        model = af.PriorModel(mock.MockClassx2)
+        model.add_assertion(model.one < model.two)
+
+        assert model.instance_from_vector([0.1, 0.2]).one == 0.1
+        with pytest.raises(exc.FitException):
+            model.instance_from_vector([0.2, 0.1])
+
+    def test_compound_prior(self):
+        model = af.PriorModel(mock.MockClassx2)
+        model.two = model.one * 2
+
+        instance = model.instance_from_vector([0.25])
+        assert instance.two == 0.5
+
+
+@pytest.fixture(name="assertion_model")
+def make_assertion_model():
+    return af.PriorModel(
+        mock.MockClassx2,
+        one=af.UniformPrior(0.0, 1.0),
+        two=af.UniformPrior(0.0, 1.0),
+    )
+
+
+class TestAssertionsHold:
+    def test_no_assertions(self, assertion_model):
+        assert assertion_model.compile().assertions_hold(
+            [[0.2, 0.1], [0.1, 0.2]]
+        ).tolist() == [True, True]
+
+    def test_priors(self, assertion_model):
+        assertion_model.add_assertion(assertion_model.one < assertion_model.two)
+        assert assertion_model.compile().assertions_hold(
+            [[0.2, 0.1], [0.1, 0.2], [0.2, 0.2]]
+        ).tolist() == [False, True, False]
+
+    def test_equal(self, assertion_model):
+        assertion_model.add_assertion(assertion_model.one <= assertion_model.two)
+        assert assertion_model.compile().assertions_hold(
+            [[0.2, 0.1], [0.1, 0.2], [0.2, 0.2]]
+        ).tolist() == [False, True, True]
+
+    def test_constants(self, assertion_model):
+        assertion_model.add_assertion((0.2 < assertion_model.one) < 0.5)
+        assert assertion_model.compile().assertions_hold(
+            [[0.1, 0.0], [0.3, 0.0], [0.6, 0.0]]
+        ).tolist() == [False, True, False]
+
+    def test_arithmetic(self, assertion_model):
+        assertion_model.add_assertion(
+            assertion_model.one + assertion_model.two < 2 * assertion_model.two
+        )
+        assert assertion_model.compile().assertions_hold(
+            [[0.2, 0.1], [0.1, 0.2]]
+        ).tolist() == [False, True]
+
+    def test_evaluated_per_vector(self, assertion_model):
+        assertion_model.add_assertion(
+            assertion_model.one / assertion_model.two < 0.5
+        )
+        assert assertion_model.compile().assertions_hold(
+            [[0.2, 0.1], [0.1, 0.4]]
+        ).tolist() == [False, True]
+
+    def test_boolean(self, assertion_model):
+        assertion_model.add_assertion(False)
+        assert assertion_model.compile().assertions_hold(
+            [[0.1, 0.2]]
+        ).tolist() == [False]
+
+    def test_nested(self, model):
+        model.collection.first.add_assertion(
+            model.collection.first.one < model.collection.first.two
+        )
+        compiled = model.compile()
+        index = compiled.priors.index(model.collection.first.one)
+
+        vectors = [[0.5] * 10, [0.5] * 10]
+        vectors[0][index] = 0.1
+        vectors[1][index] = 0.9
+
+        assert compiled.assertions_hold(vectors).tolist() == [True, False]
+
+    def test_exception(self, assertion_model):
+        assertion_model.add_assertion(assertion_model.one < assertion_model.two)
+        assertion_model.add_assertion(assertion_model.one < 0.5)
+        with pytest.raises(exc.FitException, match="1 assertions failed"):
+            assertion_model.instance_from_vector([0.2, 0.1])
+
+
+class TestView:
+    def test_attributes(self, model):
+        vector = [0.05 * (i + 1) for i in range(model.prior_count)]
+        instance = model.instance_from_vector(vector)
+        view = model.instance_from_vector(vector, view=True)
+
+        assert isinstance(view, af.ModelInstance)
+        assert isinstance(view.one, mock.MockClassx4)
+        assert view.one.one == instance.one.one
+        assert view.one.four == instance.one.four
+        assert view.tuple.one_tuple == instance.tuple.one_tuple
+        assert view.collection.first.one == instance.collection.first.one
+        assert view.collection.second.two == instance.collection.second.two
+
+    def test_collection(self, model):
+        view = model.instance_from_vector([0.5] * 10, view=True)
+
+        assert list(view.dict) == ["one", "tuple", "collection"]
+        assert len(view.collection) == 2
+        assert view.collection[1].one == 0.5
+        assert view.collection["first"].two == 0.5
+        assert [item.one for item in view.collection] == [0.5, 0.5]
+
+    @pytest.mark.parametrize(
+        "cls",
+        [mock.MockClassx4, mock.MockClassx2, mock.MockClassx2Tuple, float, tuple]
+    )
+    def test_traversal(self, model, cls):
+        vector = [0.05 * (i + 1) for i in range(model.prior_count)]
+        instance = model.instance_from_vector(vector)
+        view = model.instance_from_vector(vector, view=True)
+
+        def paths(tuples):
+            return sorted(path for path, _ in tuples)
+
+        assert len(instance.path_instance_tuples_for_class(cls)) > 0
+        assert paths(view.path_instance_tuples_for_class(cls)) == paths(
+            instance.path_instance_tuples_for_class(cls)
+        )
+        assert sorted(name for name, _ in view.attribute_tuples_with_type(cls)) == sorted(
+            name for name, _ in instance.attribute_tuples_with_type(cls)
+        )
+        assert [name for name, _ in view.direct_tuples_with_type(cls)] == [
+            name for name, _ in instance.direct_tuples_with_type(cls)
+        ]
+        assert sorted(
+            value for _, value in view.path_instance_tuples_for_class(float)
+        ) == sorted(
+            value for _, value in instance.path_instance_tuples_for_class(float)
+        )
+
+    def test_children_created_once(self, model):
+        view = model.instance_from_vector([0.5] * 10, view=True)
+
+        assert view.one is view.one
+        assert view.tuple.one_tuple is view.tuple.one_tuple
+        assert view.collection is view.collection
+        assert view.collection.first is view.collection.first
+
+    def test_reads_vector(self):
+        model = af.PriorModel(
+            mock.MockClassx2,
+            one=af.UniformPrior(0.0, 1.0),
+            two=af.UniformPrior(0.0, 1.0),
+        )
+        vector = [0.1, 0.2]
+        view = model.instance_from_vector(vector, view=True)
+        vector[0] = 0.3
+
+        assert view.one == 0.3
+
+    def test_constants_and_compound(self):
+        model = af.PriorModel(mock.MockClassx2)
+        model.one = 1.0
+        model.two = model.one * 2
+
+        view = model.instance_from_vector([], view=True)
+        assert view.one == 1.0
+        assert view.two == 2.0
+
+        model = af.PriorModel(mock.MockClassx2)
+        model.two = model.one * 2
+
+        view = model.instance_from_vector([0.25], view=True)
+        assert view.two == 0.5
+
+    def test_assertions(self):
+        model = af.PriorModel(mock.MockClassx2)
+        model.add_assertion(model.one < model.two)
+
+        with pytest.raises(exc.FitException):
+            model.instance_from_vector([0.2, 0.1], view=True)
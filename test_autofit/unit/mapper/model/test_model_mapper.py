@@ -519,6 +519,39 @@ class TestModelInstancesRealClasses:
 
         assert log_priors == [0.125, 0.2]
 
+    def test_log_priors_from_vectors(self):
+        mapper = af.ModelMapper()
+        mapper.mock_class = af.PriorModel(mock.MockClassx2)
+        mapper.mock_class.one = af.GaussianPrior(mean=1.0, sigma=2.0)
+        mapper.mock_class.two = af.LogUniformPrior(lower_limit=0.0, upper_limit=10.0)
+
+        log_priors = mapper.log_priors_from_vectors(vectors=[[0.0, 5.0], [1.0, 2.0]])
+
+        assert log_priors.shape == (2, 2)
+        assert list(log_priors[0]) == pytest.approx([0.125, 0.2])
+        assert list(log_priors[1]) == pytest.approx([0.0, 0.5])
+
+    def test_vectors_from_unit_vectors(self):
+        mapper = af.ModelMapper()
+        mapper.mock_class = af.PriorModel(mock.MockClassx4)
+        mapper.mock_class.one = af.UniformPrior(lower_limit=1.0, upper_limit=3.0)
+        mapper.mock_class.two = af.LogUniformPrior(lower_limit=1.0, upper_limit=100.0)
+        mapper.mock_class.three = af.GaussianPrior(mean=1.0, sigma=2.0)
+
+        unit_vectors = np.array([
+            [0.5, 0.5, 0.5, 0.5],
+            [0.1, 0.2, 0.3, 0.4],
+            [0.9, 0.8, 0.7, 0.6],
+        ])
+
+        vectors = mapper.vectors_from_unit_vectors(unit_vectors=unit_vectors)
+
+        assert vectors.shape == (3, 4)
+        for unit_vector, vector in zip(unit_vectors, vectors):
+            assert list(vector) == pytest.approx(
+                mapper.vector_from_unit_vector(unit_vector=unit_vector), 1.0e-8
+            )
+
     def test_random_unit_vector_within_limits(self):
 
         mapper = af.ModelMapper()
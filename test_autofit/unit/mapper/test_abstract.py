@@ -1,4 +1,7 @@
+import pytest
+
 import autofit as af
+from autofit import exc
 from autofit.mock import mock
 
 
@@ -24,3 +27,145 @@ class TestCase:
         instance = result.instance_from_unit_vector([])
         assert result.profile.one_tuple == (0.0, 0.0)
         assert isinstance(instance.profile, mock.MockClassx2Tuple)
+
+
+class TestStructureCache:
+    def test_cached(self):
+        model = af.PriorModel(mock.MockClassx2)
+
+        assert model.prior_tuples_ordered_by_id is model.prior_tuples_ordered_by_id
+        assert model.prior_count == 2
+
+    def test_set_attribute(self):
+        model = af.PriorModel(mock.MockClassx2)
+        ordered = model.prior_tuples_ordered_by_id
+
+        model.one = 1.0
+
+        assert model.prior_tuples_ordered_by_id is not ordered
+        assert model.prior_count == 1
+
+    def test_nested_collection(self):
+        model = af.ModelMapper()
+        model.collection = af.CollectionPriorModel([mock.MockClassx2])
+        assert model.prior_count == 2
+
+        model.collection.append(mock.MockClassx2)
+        assert model.prior_count == 4
+
+        model.collection.remove(model.collection[0])
+        assert model.prior_count == 2
+
+    def test_prior_id_map(self):
+        model = af.PriorModel(mock.MockClassx2)
+        prior = af.UniformPrior()
+
+        model.one = prior
+
+        assert model.prior_with_id(prior.id) is prior
+
+
+class TestClone:
+    def test_independent(self):
+        model = af.ModelMapper()
+        model.profile = af.PriorModel(mock.MockClassx2Tuple)
+        model.collection = af.CollectionPriorModel(first=mock.MockClassx2)
+
+        clone = model.clone()
+
+        assert clone.profile is not model.profile
+        assert clone.collection.first is not model.collection.first
+        assert clone.profile.one_tuple is not model.profile.one_tuple
+        assert clone.prior_count == model.prior_count
+        assert clone.priors == model.priors
+
+        clone.collection.first.one = 1.0
+        assert model.prior_count == 4
+        assert clone.prior_count == 3
+
+    def test_shared_priors(self):
+        model = af.ModelMapper()
+        model.first = mock.MockClassx2
+        model.second = mock.MockClassx2
+        model.second.one = model.first.one
+
+        clone = model.clone()
+
+        assert clone.prior_count == 3
+        assert clone.second.one is clone.first.one
+        assert clone.first.one is not model.first.one
+
+    def test_replace_priors(self):
+        model = af.PriorModel(mock.MockClassx2)
+        prior = af.GaussianPrior(mean=1.0, sigma=2.0)
+
+        clone = model.clone({model.one: prior})
+
+        assert clone.one is prior
+        assert clone.two == model.two
+        assert model.one != prior
+
+    def test_assertions(self):
+        model = af.PriorModel(mock.MockClassx2)
+        model.add_assertion(model.one < model.two)
+
+        clone = model.clone()
+
+        assert clone.instance_from_vector([0.1, 0.2]).one == 0.1
+        with pytest.raises(exc.FitException):
+            clone.instance_from_vector([0.2, 0.1])
+
+    def test_constants_copied(self):
+        model = af.PriorModel(mock.MockClassx2)
+        model.constant = [[1.0]]
+
+        clone = model.clone()
+
+        assert clone.constant == [[1.0]]
+        assert clone.constant[0] is not model.constant[0]
+
+
+class TestPriorPassing:
+    @pytest.fixture(name="model")
+    def make_model(self):
+        model = af.ModelMapper()
+        model.component = mock.MockClassx2
+        model.component.add_assertion(
+            model.component.one < model.component.two
+        )
+        model.add_assertion(
+            model.component.one < 0.9
+        )
+        return model
+
+    def test_nested_assertions_cleared(self, model):
+        new_model = model.mapper_from_gaussian_tuples(
+            [(0.5, 0.1), (0.5, 0.1)]
+        )
+
+        assert new_model.component._assertions == []
+        assert new_model.component.instance_from_vector([0.2, 0.1]).one == 0.2
+        assert len(model.component._assertions) == 1
+
+    def test_top_level_assertions_kept(self, model):
+        new_model = model.mapper_from_gaussian_tuples(
+            [(0.5, 0.1), (0.5, 0.1)]
+        )
+
+        assert new_model.instance_from_vector([0.2, 0.1]).component.one == 0.2
+        with pytest.raises(exc.FitException):
+            new_model.instance_from_vector([0.95, 0.1])
+
+    def test_gaussian_prior_model_for_arguments(self, model):
+        model.component.constant = [1.0]
+        arguments = {
+            prior: af.GaussianPrior(mean=0.5, sigma=0.1)
+            for prior in model.priors
+        }
+
+        new_component = model.component.gaussian_prior_model_for_arguments(arguments)
+
+        assert new_component._assertions == []
+        assert new_component.one is arguments[model.component.one]
+        assert new_component.constant == [1.0]
+        assert new_component.constant is not model.component.constant
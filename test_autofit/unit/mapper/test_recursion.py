@@ -1,4 +1,7 @@
+import autofit as af
+from autofit.mapper.model import path_instances_of_class
 from autofit.mapper.prior_model.recursion import DynamicRecursionCache
+from autofit.mock import mock
 
 
 class Wrapper:
@@ -44,3 +47,46 @@ def test_sub_recursion():
 
     result = dict_recurse(a)
     assert isinstance(result, Wrapper)
+
+
+class TestPathInstances:
+    def test_cycle(self):
+        a = A(B())
+        a.b.a = a
+        a.value = 1.0
+
+        assert path_instances_of_class(a, float) == [(("value",), 1.0)]
+
+    def test_shared(self):
+        b = B(1.0)
+        a = A(b)
+        a.c = b
+
+        assert path_instances_of_class(a, float) == [
+            (("b", "a"), 1.0),
+            (("c", "a"), 1.0),
+        ]
+
+    def test_cached(self):
+        model = af.PriorModel(mock.MockClassx2)
+
+        assert model.path_instance_tuples_for_class(
+            af.Prior
+        ) == model.path_instance_tuples_for_class(
+            af.Prior
+        )
+        assert model.path_instance_tuples_for_class(
+            af.Prior
+        ) is not model.path_instance_tuples_for_class(
+            af.Prior
+        )
+
+        model.one = 1.0
+
+        assert [
+            path for path, _ in model.path_instance_tuples_for_class(af.Prior)
+        ] == [("two",)]
+        assert model.path_instance_tuples_for_class(
+            float,
+            ignore_class=af.Prior
+        ) == [(("one",), 1.0)]
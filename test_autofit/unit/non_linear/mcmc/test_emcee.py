@@ -1,11 +1,17 @@
+import os
 from os import path
+import pickle
 import shutil
 
+import emcee
+import numpy as np
 import pytest
 
 import autofit as af
 from autoconf import conf
 from autofit.mock import mock
+from autofit.non_linear.mcmc.emcee import EmceeChain, EmceeSamples
+from autofit.non_linear.samples import Sample
 
 directory = path.dirname(path.realpath(__file__))
 pytestmark = pytest.mark.filterwarnings("ignore::FutureWarning")
@@ -193,3 +199,219 @@ class TestCopyWithNameExtension:
             is search.auto_correlation_change_threshold
         )
         assert copy.number_of_cores is search.number_of_cores
+
+
+def log_prob(x):
+    return -0.5 * (x[0] ** 2 + 100.0 * (x[1] - x[0]) ** 2)
+
+
+@pytest.fixture(name="sampler")
+def make_sampler(tmpdir):
+    np.random.seed(1)
+    backend = emcee.backends.HDFBackend(path.join(tmpdir, "emcee.hdf"))
+    backend.reset(6, 2)
+    return emcee.EnsembleSampler(6, 2, log_prob, backend=backend)
+
+
+class TestEmceeChain:
+    def test_reads_new_steps(self, sampler):
+        chain = EmceeChain(filename=sampler.backend.filename)
+
+        state = sampler.run_mcmc(np.random.randn(6, 2), 10, progress=False)
+        chain.update()
+        sampler.run_mcmc(state, 5, progress=False)
+        chain.update()
+
+        assert chain.iteration == 15
+        assert chain.total_walkers == 6
+        assert (chain.parameters == sampler.backend.get_chain(flat=True)).all()
+        assert (chain.log_probs == sampler.backend.get_log_prob(flat=True)).all()
+
+    def test_reset(self, sampler):
+        chain = EmceeChain(filename=sampler.backend.filename)
+
+        sampler.run_mcmc(np.random.randn(6, 2), 10, progress=False)
+        chain.update()
+
+        sampler.backend.reset(6, 2)
+        sampler.run_mcmc(np.random.randn(6, 2), 12, progress=False)
+        chain.update()
+
+        assert (chain.parameters == sampler.backend.get_chain(flat=True)).all()
+
+    def test_no_steps(self, sampler):
+        with pytest.raises(AttributeError):
+            EmceeChain(filename=sampler.backend.filename).update()
+
+    def test_auto_correlation_times(self, sampler):
+        chain = EmceeChain(filename=sampler.backend.filename)
+        chain.initial_max_lag = 2
+
+        state = np.random.randn(6, 2)
+        for iterations in (5, 20, 100, 400):
+            state = sampler.run_mcmc(state, iterations, progress=False)
+            chain.update()
+
+            for iteration in (chain.iteration - 2, chain.iteration):
+                assert chain.auto_correlation_times(iteration) == pytest.approx(
+                    emcee.autocorr.integrated_time(sampler.backend.get_chain()[:iteration], tol=0),
+                    rel=1.0e-8,
+                    nan_ok=True
+                )
+
+        assert len(chain._lag_sums) < chain.iteration
+
+    def test_auto_correlated_chain(self, tmpdir):
+        chain_array = auto_correlated_chain(total_steps=3000, total_walkers=4)
+
+        backend = emcee.backends.HDFBackend(path.join(tmpdir, "emcee.hdf"))
+        backend.reset(4, 2)
+        chain = EmceeChain(filename=backend.filename)
+        chain.initial_max_lag = 4
+
+        for steps in np.split(chain_array, [10, 150, 1000]):
+            backend.grow(len(steps), None)
+            for step in steps:
+                backend.save_step(
+                    emcee.State(step, log_prob=np.zeros(4), random_state=np.random.get_state()),
+                    np.ones(4, dtype=bool)
+                )
+            chain.update()
+
+            assert chain.auto_correlation_times() == pytest.approx(
+                emcee.autocorr.integrated_time(chain_array[:chain.iteration], tol=0),
+                rel=1.0e-8
+            )
+
+        assert chain.iteration == 3000
+        assert (chain.auto_correlation_times() > 10.0).all()
+        assert len(chain._lag_sums) > 5
+
+    def test_pickle(self, sampler):
+        chain = EmceeChain(filename=sampler.backend.filename)
+        sampler.run_mcmc(np.random.randn(6, 2), 10, progress=False)
+        chain.update()
+
+        chain = pickle.loads(pickle.dumps(chain))
+        assert chain.iteration == 0
+
+
+def auto_correlated_chain(total_steps, total_walkers, correlation=0.95):
+    """
+    A chain of two parameters for each walker in which every step is drawn from the previous one, with an integrated
+    auto correlation time of about (1 + correlation) / (1 - correlation) steps.
+    """
+    random_state = np.random.RandomState(1)
+    chain = np.zeros((total_steps, total_walkers, 2))
+    for step in range(1, total_steps):
+        chain[step] = correlation * chain[step - 1] + random_state.randn(total_walkers, 2)
+    return chain
+
+
+class TestSamplesFromTable:
+    @pytest.fixture(name="model")
+    def make_model(self):
+        return af.ModelMapper(
+            mock_class=af.PriorModel(
+                mock.MockClassx2,
+                one=af.UniformPrior(-100.0, 100.0),
+                two=af.UniformPrior(-100.0, 100.0),
+            )
+        )
+
+    @pytest.fixture(name="search")
+    def make_search(self):
+        search = af.Emcee(paths=af.Paths(name="samples_from_table"))
+        os.makedirs(search.paths.samples_path, exist_ok=True)
+        yield search
+        shutil.rmtree(search.paths.output_path, ignore_errors=True)
+
+    def write(self, search, model, chain):
+        total_steps, total_walkers, _ = chain.shape
+        samples = EmceeSamples(
+            model=model,
+            samples=Sample.from_lists(
+                model=model,
+                parameters=chain.reshape(-1, 2).tolist(),
+                log_likelihoods=len(chain.reshape(-1, 2)) * [0.0],
+                log_priors=len(chain.reshape(-1, 2)) * [0.0],
+                weights=len(chain.reshape(-1, 2)) * [1.0],
+            ),
+            auto_correlation_times=None,
+            auto_correlation_check_size=10,
+            auto_correlation_required_length=50,
+            auto_correlation_change_threshold=0.01,
+            total_walkers=total_walkers,
+            total_steps=total_steps,
+        )
+        samples.write_table(filename=search.paths.samples_file)
+        samples.info_to_json(filename=search.paths.info_file)
+
+    def test_auto_correlation_times_estimated(self, search, model):
+        chain = auto_correlated_chain(total_steps=500, total_walkers=4)
+        self.write(search, model, chain)
+
+        samples = search.samples_via_csv_json_from_model(model=model)
+
+        assert samples.auto_correlation_times == pytest.approx(
+            emcee.autocorr.integrated_time(chain, tol=0),
+            rel=1.0e-8
+        )
+        assert len(samples.thin().samples) < len(chain.reshape(-1, 2))
+
+    def test_incomplete_steps(self, search, model):
+        chain = auto_correlated_chain(total_steps=1, total_walkers=4)
+        self.write(search, model, chain)
+
+        samples = search.samples_via_csv_json_from_model(model=model)
+
+        assert samples.auto_correlation_times is None
+        assert samples._posterior_weights.tolist() == 4 * [1.0]
+
+
+def emcee_samples_with_times(auto_correlation_times):
+    model = af.ModelMapper(
+        mock_class=af.PriorModel(
+            mock.MockClassx2,
+            one=af.UniformPrior(0.0, 100.0),
+            two=af.UniformPrior(0.0, 100.0),
+        )
+    )
+    total_walkers = 2
+    total_steps = 20
+    return EmceeSamples(
+        model=model,
+        samples=Sample.from_lists(
+            model=model,
+            parameters=[[float(i), float(i)] for i in range(total_walkers * total_steps)],
+            log_likelihoods=[float(i) for i in range(total_walkers * total_steps)],
+            log_priors=total_walkers * total_steps * [0.0],
+            weights=total_walkers * total_steps * [1.0],
+        ),
+        auto_correlation_times=auto_correlation_times,
+        auto_correlation_check_size=10,
+        auto_correlation_required_length=50,
+        auto_correlation_change_threshold=0.01,
+        total_walkers=total_walkers,
+        total_steps=total_steps,
+    )
+
+
+class TestPosteriorWeights:
+    def test_burn_in(self):
+        samples = emcee_samples_with_times(np.array([2.0, 1.0]))
+
+        weights = samples._posterior_weights
+        assert weights[:12].tolist() == 12 * [0.0]
+        assert weights[12:14].tolist() == [1.0, 1.0]
+        assert samples.effective_sample_size == pytest.approx(np.sum(weights))
+
+    @pytest.mark.parametrize(
+        "auto_correlation_times",
+        [None, np.array([np.inf, 1.0]), np.array([np.nan, 1.0]), np.array([1.0, 1.0])]
+    )
+    def test_burn_in_undefined(self, auto_correlation_times):
+        samples = emcee_samples_with_times(auto_correlation_times)
+
+        assert samples._posterior_weights.tolist() == 40 * [1.0]
+        assert len(samples.thin().samples) == 40
@@ -326,6 +326,23 @@ class TestMulitNest:
 
         assert weights == [0.02, 0.02, 0.01, 0.05, 0.1, 0.1, 0.1, 0.1, 0.2, 0.3]
 
+    def test__weighted_samples_from_file(self, multi_nest_samples_path):
+        conf.instance.output_path = path.join(multi_nest_samples_path, "1_class")
+
+        multi_nest = af.MultiNest()
+
+        create_weighted_samples_4_parameters(file_path=multi_nest.paths.path)
+
+        parameters, log_likelihoods, weights = mn.weighted_samples_from_file(
+            file_weighted_samples=path.join(multi_nest.paths.path, "multinest.txt"),
+            prior_count=4,
+        )
+
+        assert parameters.shape == (10, 4)
+        assert parameters[1].tolist() == [0.9, 1.9, 2.9, 3.9]
+        assert log_likelihoods.tolist() == 10 * [-0.5 * 9999999.9]
+        assert weights.tolist() == [0.02, 0.02, 0.01, 0.05, 0.1, 0.1, 0.1, 0.1, 0.2, 0.3]
+
     def test__read_total_samples_from_file_resume(self, multi_nest_resume_path):
         conf.instance.output_path = path.join(multi_nest_resume_path, "1_class")
 
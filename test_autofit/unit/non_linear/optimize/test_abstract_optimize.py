@@ -1,3 +1,4 @@
+import os
 from os import path
 
 import pytest
@@ -65,3 +66,18 @@ class TestJsonCSV:
         assert samples.log_priors == [0.0, 0.0, 0.0, 0.0, 0.0]
         assert samples.log_posteriors == [1.0, 2.0, 3.0, 10.0, 5.0]
         assert samples.weights == [1.0, 1.0, 1.0, 1.0, 1.0]
+
+    def test__from_binary_samples(self, samples):
+        optimize = af.PySwarmsGlobal()
+
+        samples.write_binary(filename=optimize.paths.samples_binary_file)
+
+        model = af.ModelMapper(mock_class_1=MockClassx4)
+
+        loaded = optimize.samples_via_csv_json_from_model(model=model)
+
+        os.remove(optimize.paths.samples_binary_file)
+        os.remove(path.join(optimize.paths.samples_path, "samples.json"))
+
+        assert loaded.parameters == samples.parameters
+        assert loaded.log_posteriors == [1.0, 2.0, 3.0, 10.0, 5.0]
@@ -1,4 +1,6 @@
 from os import path
+
+import numpy as np
 import pytest
 
 from autoconf import conf
@@ -150,6 +152,90 @@ class TestPySwarmsGlobalConfig:
         assert len(samples.log_likelihoods) == 500
 
 
+def make_mock_class():
+    return af.PriorModel(
+        mock.MockClassx2,
+        one=af.UniformPrior(lower_limit=0.0, upper_limit=2.0),
+        two=af.UniformPrior(lower_limit=0.0, upper_limit=2.0),
+    )
+
+
+class BatchAnalysis(af.Analysis):
+    def __init__(self):
+        self.batches = list()
+
+    def log_likelihood_function(self, instance):
+        raise AssertionError("log_likelihood_function should not be called")
+
+    def log_likelihood_batch(self, instances, parameters):
+        self.batches.append(parameters)
+        return -np.sum(parameters ** 2.0, axis=1)
+
+
+class TestPySwarmsFitness:
+    def test__log_likelihood_batch(self):
+        model = af.ModelMapper(mock_class=make_mock_class())
+        analysis = BatchAnalysis()
+
+        fitness = af.PySwarmsGlobal.Fitness(
+            paths=None,
+            model=model,
+            analysis=analysis,
+            samples_from_model=None,
+        )
+
+        assert fitness.has_log_likelihood_batch
+
+        figures_of_merit = fitness(np.array([[0.5, 1.0], [1.0, 1.0], [0.5, 3.0]]))
+
+        assert len(analysis.batches) == 1
+        assert analysis.batches[0].shape == (2, 2)
+        assert figures_of_merit[0:2] == pytest.approx([2.5, 4.0])
+        assert figures_of_merit[2] == np.inf
+        assert fitness.max_log_likelihood == pytest.approx(-1.25)
+
+    def test__no_log_likelihood_batch(self):
+        fitness = af.PySwarmsGlobal.Fitness(
+            paths=None,
+            model=af.ModelMapper(mock_class=make_mock_class()),
+            analysis=mock.MockAnalysis(),
+            samples_from_model=None,
+        )
+
+        assert not fitness.has_log_likelihood_batch
+
+
+class ViewAnalysis(af.Analysis):
+    view_instances = True
+
+    def __init__(self):
+        self.instances = list()
+
+    def log_likelihood_function(self, instance):
+        self.instances.append(instance)
+        return -instance.mock_class.one
+
+
+class TestViewInstances:
+    def test__fitness_uses_views(self):
+        model = af.ModelMapper(mock_class=make_mock_class())
+        analysis = ViewAnalysis()
+
+        fitness = af.PySwarmsGlobal.Fitness(
+            paths=None,
+            model=model,
+            analysis=analysis,
+            samples_from_model=None,
+        )
+
+        assert fitness.log_likelihood_from_parameters([0.5, 1.0]) == -0.5
+
+        instance = analysis.instances[0]
+        assert isinstance(instance.mock_class, mock.MockClassx2)
+        assert type(instance.mock_class) is not mock.MockClassx2
+        assert instance.mock_class.two == 1.0
+
+
 class TestCopyWithNameExtension:
     @staticmethod
     def assert_non_linear_attributes_equal(copy):
@@ -2,6 +2,7 @@ import os
 from os import path
 import pickle
 import shutil
+import threading
 
 import numpy as np
 import pytest
@@ -10,6 +11,7 @@ import autofit as af
 from autoconf import conf
 from autofit.mock import mock
 from autofit.mock.mock_search import MockSamples
+from autofit.non_linear.samples import Sample, load_from_binary
 
 directory = path.dirname(path.realpath(__file__))
 pytestmark = pytest.mark.filterwarnings("ignore::FutureWarning")
@@ -194,3 +196,242 @@ class TestMovePickleFiles:
 
         if path.exists(test_path):
             shutil.rmtree(test_path)
+
+
+@pytest.fixture(name="optimizer_samples")
+def make_optimizer_samples():
+    model = af.ModelMapper(mock_class=mock.MockClassx2)
+    return af.OptimizerSamples(
+        model=model,
+        samples=Sample.from_lists(
+            model=model,
+            parameters=[[float(i), 2.0 * i] for i in range(5)],
+            log_likelihoods=[float(i) for i in range(5)],
+            log_priors=5 * [0.0],
+            weights=5 * [1.0],
+        )
+    )
+
+
+@pytest.fixture(name="writing_search")
+def make_writing_search():
+    search = mock.MockSearch(paths=af.Paths(name="write_samples"))
+    shutil.rmtree(search.paths.samples_path, ignore_errors=True)
+    os.makedirs(search.paths.samples_path)
+    return search
+
+
+def first_row(search):
+    with open(search.paths.samples_binary_file, "rb") as f:
+        return np.frombuffer(f.read(8), dtype="<f8")[0]
+
+
+def corrupt_first_row(search):
+    with open(search.paths.samples_binary_file, "r+b") as f:
+        f.write(np.array([-1.0], dtype="<f8").tobytes())
+
+
+def write_new_samples(search, samples, stop, start=None):
+    """
+    Write the first stop samples as an appending search would, with the samples after start as new samples.
+    """
+    if start is None:
+        start = getattr(search, "_samples_offset", None) or 0
+    search.write_samples(
+        samples=af.OptimizerSamples(
+            model=samples.model,
+            samples=samples.samples[:stop]
+        ),
+        new_samples=samples.samples[start:stop],
+        new_samples_start=start
+    )
+
+
+class TestWriteSamples:
+    def test_appends(self, writing_search, optimizer_samples):
+        writing_search.appends_samples = True
+
+        write_new_samples(writing_search, optimizer_samples, stop=3)
+        corrupt_first_row(writing_search)
+        write_new_samples(writing_search, optimizer_samples, stop=5)
+
+        assert writing_search._samples_offset == 5
+        assert first_row(writing_search) == -1.0
+        assert writing_search.load_samples_table().log_likelihoods.tolist() == optimizer_samples.log_likelihoods
+
+        with open(writing_search.paths.samples_file) as f:
+            assert len(f.readlines()) == 6
+
+    def test_skips_samples_already_written(self, writing_search, optimizer_samples):
+        writing_search.appends_samples = True
+
+        write_new_samples(writing_search, optimizer_samples, stop=3)
+        write_new_samples(writing_search, optimizer_samples, stop=5, start=1)
+
+        assert writing_search.load_samples_table().log_likelihoods.tolist() == optimizer_samples.log_likelihoods
+
+    def test_rewrites(self, writing_search, optimizer_samples):
+        writing_search.write_samples(samples=optimizer_samples)
+        corrupt_first_row(writing_search)
+        writing_search.write_samples(samples=optimizer_samples)
+
+        assert first_row(writing_search) == 0.0
+
+    def test_rewrites_without_new_samples(self, writing_search, optimizer_samples):
+        writing_search.appends_samples = True
+
+        write_new_samples(writing_search, optimizer_samples, stop=3)
+        corrupt_first_row(writing_search)
+        writing_search.write_samples(samples=optimizer_samples)
+
+        assert first_row(writing_search) == 0.0
+        assert writing_search._samples_offset == 5
+
+    def test_rewrites_after_reset(self, writing_search, optimizer_samples):
+        writing_search.appends_samples = True
+
+        write_new_samples(writing_search, optimizer_samples, stop=5)
+        corrupt_first_row(writing_search)
+        write_new_samples(writing_search, optimizer_samples, stop=2, start=0)
+
+        assert first_row(writing_search) == 0.0
+        assert len(writing_search.load_samples_table()) == 2
+
+    def test_resume_rewrites_changed_samples(self, writing_search, optimizer_samples):
+        writing_search.appends_samples = True
+        write_new_samples(writing_search, optimizer_samples, stop=5)
+
+        resumed = pickle.loads(pickle.dumps(writing_search))
+        assert getattr(resumed, "_samples_offset", None) is None
+
+        corrupt_first_row(resumed)
+        optimizer_samples.samples.weights[4] = 0.5
+        write_new_samples(resumed, optimizer_samples, stop=5)
+
+        assert first_row(resumed) == 0.0
+        assert resumed.load_samples_table().weights.tolist()[-1] == 0.5
+
+    def test_equal_weight_samples(self, writing_search, optimizer_samples):
+        writing_search.write_equal_weight_samples(samples=optimizer_samples)
+        assert not path.exists(writing_search.paths.samples_equal_weights_file)
+
+        optimizer_samples.samples.weights[:] = [0.0, 0.0, 0.5, 0.0, 0.5]
+        writing_search.write_equal_weight_samples(
+            samples=af.PDFSamples(
+                model=optimizer_samples.model,
+                samples=optimizer_samples.samples
+            )
+        )
+
+        equal_weight_samples = load_from_binary(writing_search.paths.samples_equal_weights_file)
+        assert equal_weight_samples.log_likelihoods.tolist() == [2.0, 4.0]
+        assert equal_weight_samples.weights.tolist() == [0.5, 0.5]
+
+
+class TestLazySamples:
+    def test_lazy_samples(self, writing_search, optimizer_samples):
+        writing_search.save_samples_summary(samples=optimizer_samples)
+
+        samples = writing_search.lazy_samples_from_model(model=optimizer_samples.model)
+
+        assert samples.max_log_likelihood_vector == [4.0, 8.0]
+        assert samples.gaussian_priors_at_sigma(
+            sigma=writing_search.prior_passer.sigma
+        ) == [(4.0, 0.0), (8.0, 0.0)]
+        assert samples._loaded_samples is None
+
+    def test_no_summary(self, writing_search, optimizer_samples):
+        writing_search.samples = optimizer_samples
+
+        assert writing_search.lazy_samples_from_model(
+            model=optimizer_samples.model
+        ) is optimizer_samples
+
+    def test_summary_written_at_end(self, writing_search, optimizer_samples):
+        for during_analysis in (True, False):
+            writing_search.output_update(
+                samples=optimizer_samples,
+                analysis=None,
+                during_analysis=during_analysis,
+                visualize=False,
+                output_model_results=False,
+            )
+            assert path.exists(writing_search.paths.samples_binary_file)
+            assert path.exists(writing_search.paths.samples_summary_file) is not during_analysis
+
+
+class VisualizingAnalysis(af.Analysis):
+    def __init__(self):
+        self.visualized = list()
+
+    def visualize(self, paths, instance, during_analysis):
+        self.visualized.append((during_analysis, threading.current_thread()))
+
+
+class TestAsyncUpdates:
+    def test_async(self, writing_search):
+        model = af.ModelMapper(
+            mock_class=af.PriorModel(
+                mock.MockClassx2,
+                one=af.UniformPrior(0.0, 10.0),
+                two=af.UniformPrior(0.0, 10.0),
+            )
+        )
+        optimizer_samples = af.OptimizerSamples(
+            model=model,
+            samples=Sample.from_lists(
+                model=model,
+                parameters=[[float(i), 2.0 * i] for i in range(5)],
+                log_likelihoods=[float(i) for i in range(5)],
+                log_priors=5 * [0.0],
+                weights=5 * [1.0],
+            )
+        )
+
+        writing_search.async_updates = True
+        writing_search.timer.start()
+        writing_search.samples_via_sampler_from_model = lambda model: optimizer_samples
+        analysis = VisualizingAnalysis()
+
+        release = threading.Event()
+        write_threads = list()
+        write_samples = writing_search.write_samples
+
+        def blocking_write_samples(**kwargs):
+            release.wait()
+            write_threads.append(threading.current_thread())
+            write_samples(**kwargs)
+
+        writing_search.write_samples = blocking_write_samples
+
+        for _ in range(3):
+            samples = af.NonLinearSearch.perform_update(
+                writing_search,
+                model=optimizer_samples.model,
+                analysis=analysis,
+                during_analysis=True
+            )
+            assert samples is optimizer_samples
+
+        # Visualization is performed while the samples are still being written
+        assert [during_analysis for during_analysis, _ in analysis.visualized] == [True, True, True]
+
+        release.set()
+        af.NonLinearSearch.perform_update(
+            writing_search,
+            model=optimizer_samples.model,
+            analysis=analysis,
+            during_analysis=False
+        )
+
+        assert {thread for _, thread in analysis.visualized} == {threading.current_thread()}
+        assert write_threads[0] is not threading.current_thread()
+        assert write_threads[-1] is threading.current_thread()
+        assert len(write_threads) in (2, 3)
+        assert writing_search.updater.is_idle
+        assert path.exists(writing_search.paths.file_results)
+
+    def test_not_pickled(self, writing_search):
+        writing_search.updater
+
+        assert "_updater" not in pickle.loads(pickle.dumps(writing_search)).__dict__
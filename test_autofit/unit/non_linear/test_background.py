@@ -0,0 +1,63 @@
+import threading
+
+import pytest
+
+from autofit.non_linear.background import BackgroundUpdater
+
+
+@pytest.fixture(name="updater")
+def make_updater():
+    return BackgroundUpdater()
+
+
+class TestBackgroundUpdater:
+    def test_performs(self, updater):
+        performed = []
+
+        updater.submit(performed.append, 1)
+        updater.wait()
+
+        assert performed == [1]
+        assert updater.is_idle
+
+    def test_coalesces_pending(self, updater):
+        started = threading.Event()
+        release = threading.Event()
+        performed = []
+
+        def block(value):
+            started.set()
+            release.wait()
+            performed.append(value)
+
+        updater.submit(block, 1)
+        started.wait()
+
+        for value in range(2, 5):
+            updater.submit(performed.append, value)
+
+        release.set()
+        updater.wait()
+
+        assert performed == [1, 4]
+
+    def test_exception(self, updater):
+        def fail():
+            raise ValueError("failed")
+
+        updater.submit(fail)
+
+        with pytest.raises(ValueError, match="failed"):
+            updater.wait()
+
+        updater.wait()
+
+    def test_restarts(self, updater):
+        performed = []
+
+        updater.submit(performed.append, 1)
+        updater.wait()
+        updater.submit(performed.append, 2)
+        updater.wait()
+
+        assert performed == [1, 2]
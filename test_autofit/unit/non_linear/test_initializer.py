@@ -42,6 +42,20 @@ class TestInitializePrior:
 
         assert initial_figures_of_merit == [1.0, 1.0]
 
+    def test__prior__initial_samples_satisfy_assertions(self):
+
+        model = af.PriorModel(MockClassx4)
+        model.add_assertion(model.one < model.two)
+
+        initializer = af.InitializerPrior()
+
+        initial_unit_parameters, initial_parameters, initial_figures_of_merit = initializer.initial_samples_from_model(
+            total_points=20, model=model, fitness_function=MockFitness()
+        )
+
+        assert len(initial_parameters) == 20
+        assert all(parameters[0] < parameters[1] for parameters in initial_parameters)
+
     def test__initial_samples_in_test_model(self):
 
         model = af.PriorModel(MockClassx4)
@@ -0,0 +1,246 @@
+from os import path
+
+import numpy as np
+import pytest
+
+import autofit as af
+from autofit import exc
+from autofit.mock import mock
+from autofit.non_linear.likelihood_cache import LikelihoodCache
+from autofit.non_linear.pool import WorkerPool
+
+
+@pytest.fixture(name="filename")
+def make_filename(tmpdir):
+    return str(tmpdir.join("likelihood_cache.bin"))
+
+
+class TestLikelihoodCache:
+    def test_get(self):
+        cache = LikelihoodCache(size=2)
+
+        assert cache.get([0.1, 0.2]) is None
+        cache.add([0.1, 0.2], 1.0)
+
+        assert cache.get([0.1, 0.2]) == 1.0
+        assert cache.get(np.array([0.1, 0.2])) == 1.0
+        assert (cache.hits, cache.misses) == (2, 1)
+        assert cache.hit_rate == pytest.approx(2 / 3)
+
+    def test_least_recently_used(self):
+        cache = LikelihoodCache(size=2)
+        cache.add([0.1], 1.0)
+        cache.add([0.2], 2.0)
+        cache.get([0.1])
+        cache.add([0.3], 3.0)
+
+        assert len(cache) == 2
+        assert cache.get([0.1]) == 1.0
+        assert cache.get([0.2]) is None
+
+    def test_decimals(self):
+        cache = LikelihoodCache(size=2, decimals=3)
+        cache.add([0.1], 1.0)
+
+        assert cache.get([0.1 + 1e-9]) == 1.0
+        assert cache.get([0.11]) is None
+
+    def test_nan_not_cached(self, filename):
+        cache = LikelihoodCache(size=2, filename=filename)
+        cache.add([0.1], np.nan)
+        cache.flush()
+
+        assert len(cache) == 0
+        assert cache.get([0.1]) is None
+        assert not path.exists(filename)
+
+    def test_persist(self, filename):
+        cache = LikelihoodCache(size=10, filename=filename)
+        cache.add([0.1, 0.2], 1.0)
+        cache.add([0.3, 0.4], 2.0)
+
+        assert not path.exists(filename)
+        cache.flush()
+
+        cache = LikelihoodCache(size=10, filename=filename)
+        cache.load(prior_count=2)
+
+        assert len(cache) == 2
+        assert cache.get([0.3, 0.4]) == 2.0
+
+    def test_compact(self, filename):
+        cache = LikelihoodCache(size=2, filename=filename)
+        for i in range(5):
+            cache.add([float(i)], float(i))
+        cache.flush()
+
+        cache = LikelihoodCache(size=2, filename=filename)
+        cache.load(prior_count=1)
+
+        assert np.fromfile(filename).tolist() == [3.0, 3.0, 4.0, 4.0]
+        assert cache.get([4.0]) == 4.0
+
+    def test_wrong_model(self, filename):
+        cache = LikelihoodCache(size=10, filename=filename)
+        cache.add([0.1, 0.2], 1.0)
+        cache.flush()
+
+        cache = LikelihoodCache(size=10, filename=filename)
+        cache.load(prior_count=3)
+
+        assert len(cache) == 0
+
+
+class CountingAnalysis(af.Analysis):
+    likelihood_cache_size = 10
+
+    def __init__(self):
+        self.calls = 0
+
+    def log_likelihood_function(self, instance):
+        self.calls += 1
+        return -instance.one
+
+    def log_likelihood_batch(self, instances, parameters):
+        self.calls += len(instances)
+        return [-instance.one for instance in instances]
+
+
+@pytest.fixture(name="model")
+def make_model():
+    return af.PriorModel(
+        mock.MockClassx2,
+        one=af.UniformPrior(0.0, 1.0),
+        two=af.UniformPrior(0.0, 1.0),
+    )
+
+
+def make_fitness(model, analysis):
+    return af.NonLinearSearch.Fitness(
+        paths=None,
+        model=model,
+        analysis=analysis,
+        samples_from_model=None,
+    )
+
+
+class TestFitness:
+    def test_cached(self, model):
+        analysis = CountingAnalysis()
+        fitness = make_fitness(model, analysis)
+
+        assert fitness.log_likelihood_from_parameters([0.5, 0.5]) == -0.5
+        assert fitness.log_likelihood_from_parameters([0.5, 0.5]) == -0.5
+        assert analysis.calls == 1
+        assert fitness.likelihood_cache.hits == 1
+
+    def test_batch(self, model):
+        analysis = CountingAnalysis()
+        fitness = make_fitness(model, analysis)
+        fitness.log_likelihood_from_parameters([0.5, 0.5])
+
+        log_likelihoods = fitness.log_likelihoods_from_parameters_batch(
+            [[0.5, 0.5], [0.25, 0.5], [2.0, 0.5]]
+        )
+
+        assert log_likelihoods[:2].tolist() == [-0.5, -0.25]
+        assert np.isnan(log_likelihoods[2])
+        assert analysis.calls == 2
+
+    def test_nan_not_cached(self, model):
+        analysis = CountingAnalysis()
+        analysis.log_likelihood_function = lambda instance: np.nan
+        fitness = make_fitness(model, analysis)
+
+        fitness.log_likelihood_from_parameters([0.5, 0.5])
+
+        assert len(fitness.likelihood_cache) == 0
+
+    def test_decimals_outside_limits(self, model):
+        analysis = CountingAnalysis()
+        analysis.likelihood_cache_decimals = 2
+        fitness = make_fitness(model, analysis)
+
+        assert fitness.log_likelihood_from_parameters([1.0, 0.5]) == -1.0
+        assert fitness.log_likelihood_from_parameters([0.999, 0.5]) == -1.0
+
+        with pytest.raises(exc.PriorLimitException):
+            fitness.log_likelihood_from_parameters([1.001, 0.5])
+
+        log_likelihoods = fitness.log_likelihoods_from_parameters_batch(
+            [[1.001, 0.5], [0.999, 0.5]]
+        )
+        assert np.isnan(log_likelihoods[0])
+        assert log_likelihoods[1] == -1.0
+        assert analysis.calls == 1
+
+    def test_disabled(self, model):
+        analysis = CountingAnalysis()
+        analysis.likelihood_cache_size = 0
+        fitness = make_fitness(model, analysis)
+
+        fitness.log_likelihood_from_parameters([0.5, 0.5])
+        fitness.log_likelihood_from_parameters([0.5, 0.5])
+
+        assert fitness.likelihood_cache is None
+        assert analysis.calls == 2
+
+
+@pytest.fixture(name="pool", scope="module")
+def make_pool():
+    pool = WorkerPool(2)
+    yield pool
+    pool.close()
+
+
+class TestPersistence:
+    def test_flushed_by_parent(self, model, filename, pool):
+        fitness = make_fitness(model, CountingAnalysis())
+        fitness.likelihood_cache.filename = filename
+        fitness.share(pool)
+
+        parameters = [[0.1, 0.5], [0.2, 0.5], [0.3, 0.5], [0.4, 0.5]]
+        pool.map(fitness.log_likelihood_from_parameters, parameters, chunksize=1)
+        fitness.log_likelihood_from_parameters([0.9, 0.5])
+
+        assert not path.exists(filename)
+
+        fitness.flush_likelihood_cache(pool=pool)
+
+        rows = np.fromfile(filename).reshape(-1, 3)
+        assert sorted(rows[:, 0].tolist()) == [0.1, 0.2, 0.3, 0.4, 0.9]
+
+        fitness.release(pool)
+
+        cache = LikelihoodCache(size=10, filename=filename)
+        cache.load(prior_count=2)
+
+        assert len(cache) == 5
+        assert cache.get([0.3, 0.5]) == -0.3
+
+    def test_flushed_by_search(self, model, filename):
+        search = mock.MockSearch()
+        fitness = make_fitness(model, CountingAnalysis())
+        fitness.likelihood_cache.filename = filename
+        search._fitness_function = fitness
+
+        fitness.log_likelihood_from_parameters([0.5, 0.5])
+        search.flush_likelihood_cache()
+
+        assert np.fromfile(filename).tolist() == [0.5, 0.5, -0.5]
+        assert "_fitness_function" not in search.__getstate__()
+
+    def test_counts_collected_from_workers(self, model, pool):
+        fitness = make_fitness(model, CountingAnalysis())
+        fitness.log_likelihood_from_parameters([0.9, 0.5])
+        fitness.share(pool)
+
+        parameters = 4 * [[0.1, 0.5], [0.2, 0.5]]
+        pool.map(fitness.log_likelihood_from_parameters, parameters, chunksize=1)
+        fitness.flush_likelihood_cache(pool=pool)
+        fitness.release(pool)
+
+        cache = fitness.likelihood_cache
+        assert cache.hits + cache.misses == 9
+        assert 3 <= cache.misses <= 5
+        assert str(cache).endswith(f"{cache.hits} hits, {cache.misses} misses")
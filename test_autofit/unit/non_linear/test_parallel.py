@@ -0,0 +1,82 @@
+import os
+import time
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from autofit.non_linear.parallel import (
+    AbstractJob,
+    AbstractJobResult,
+    JobExecutor,
+    Process,
+    run_jobs,
+)
+
+
+class Job(AbstractJob):
+    def __init__(self, delay=0.0):
+        super().__init__()
+        self.delay = delay
+
+    def perform(self):
+        time.sleep(self.delay)
+        return AbstractJobResult(self.number)
+
+
+class FailingJob(AbstractJob):
+    def perform(self):
+        raise ValueError("failed")
+
+
+class DyingJob(AbstractJob):
+    def perform(self):
+        os._exit(1)
+
+
+class TestRunJobs:
+    def test_all_results(self):
+        jobs = [Job() for _ in range(10)]
+        results = list(run_jobs(jobs, number_of_cores=3))
+
+        assert sorted(results) == sorted(AbstractJobResult(job.number) for job in jobs)
+
+    def test_ordered(self):
+        jobs = [Job(delay=0.2), Job(), Job()]
+
+        ordered = list(run_jobs(jobs, number_of_cores=3, ordered=True))
+        assert [result.number for result in ordered] == [job.number for job in jobs]
+
+        jobs = [Job(delay=0.2), Job(), Job()]
+
+        completed = list(run_jobs(jobs, number_of_cores=3))
+        assert completed[-1].number == jobs[0].number
+
+    def test_no_jobs(self):
+        assert list(run_jobs([], number_of_cores=2)) == []
+
+    def test_exception(self):
+        with pytest.raises(ValueError, match="failed"):
+            list(run_jobs([Job(), FailingJob()], number_of_cores=2))
+
+    def test_worker_death(self):
+        with pytest.raises(BrokenProcessPool):
+            list(run_jobs([DyingJob(), Job()], number_of_cores=2))
+
+    def test_too_few_cores(self):
+        with pytest.raises(AssertionError):
+            JobExecutor(1)
+
+
+def test_futures():
+    job = Job()
+    with JobExecutor(2) as executor:
+        assert executor.submit_job(job).result() == AbstractJobResult(job.number)
+
+
+def test_process_run_jobs():
+    jobs = [Job() for _ in range(3)]
+
+    with pytest.warns(DeprecationWarning):
+        results = list(Process.run_jobs(jobs, 2))
+
+    assert sorted(results) == sorted(AbstractJobResult(job.number) for job in jobs)
@@ -0,0 +1,249 @@
+import os
+import pickle
+from os import path
+
+import numpy as np
+import pytest
+
+import autofit as af
+from autofit.mock import mock
+from autofit.non_linear import pool as pool_module
+from autofit.non_linear.pool import WorkerPool, shared_object
+
+
+class Analysis(af.Analysis):
+    def __init__(self, centre=1.0):
+        self.data = np.zeros(100000)
+        self.centre = centre
+
+    def log_likelihood_function(self, instance):
+        return -(instance.one - self.centre) ** 2
+
+    def visualize(self, paths, instance, during_analysis):
+        pass
+
+
+class SharedAnalysis(Analysis):
+    shared_arrays = ("data", "dataset.noise")
+
+    def __init__(self):
+        super().__init__()
+        self.data = np.arange(100000, dtype="float")
+        self.dataset = af.ModelInstance()
+        self.dataset.noise = np.ones((10, 10))
+
+
+class Grid(np.ndarray):
+    pass
+
+
+class SubclassAnalysis(Analysis):
+    shared_arrays = ("grid",)
+
+    def __init__(self):
+        super().__init__()
+        self.grid = np.arange(10, dtype="float").view(Grid)
+
+
+def fitness_pid(fitness):
+    return id(fitness.analysis.data), os.getpid()
+
+
+def shared_data(fitness):
+    analysis = fitness.analysis
+    return (
+        analysis.data.flags.writeable,
+        analysis.data.sum(),
+        analysis.dataset.noise.shape,
+        analysis.data.flags.owndata,
+    )
+
+
+class WorkerFailingAnalysis(SharedAnalysis):
+    def __init__(self):
+        super().__init__()
+        self.pid = os.getpid()
+
+    def log_likelihood_function(self, instance):
+        if os.getpid() != self.pid:
+            raise ValueError("failed")
+        return super().log_likelihood_function(instance)
+
+
+def shared_state():
+    return sorted(pool_module._shared), sorted(pool_module._memory)
+
+
+def shared_blocks():
+    """
+    The names of the blocks of shared memory which exist, on systems which list them.
+    """
+    if not path.isdir("/dev/shm"):
+        return None
+    return set(name for name in os.listdir("/dev/shm") if name.startswith("psm_"))
+
+
+def grid_type(fitness):
+    return type(fitness.analysis.grid).__name__, fitness.analysis.grid.sum()
+
+
+def fail_in(pid):
+    if os.getpid() == pid:
+        raise ValueError("failed")
+    return os.getpid()
+
+
+@pytest.fixture(name="pool", scope="module")
+def make_pool():
+    pool = WorkerPool(2)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(name="fitness")
+def make_fitness():
+    model = af.PriorModel(
+        mock.MockClassx2,
+        one=af.UniformPrior(0.0, 10.0),
+        two=af.UniformPrior(0.0, 10.0),
+    )
+    return af.NonLinearSearch.Fitness(
+        paths=None,
+        model=model,
+        analysis=Analysis(),
+        samples_from_model=None,
+    )
+
+
+class TestWorkerPool:
+    def test_ids(self, pool):
+        ids = pool.ids
+
+        assert len(set(ids)) == 2
+        assert os.getpid() not in ids
+        assert pool.ids is ids
+
+    def test_share(self, pool, fitness):
+        parameters = [[0.5, 0.5], [1.0, 0.5], [2.0, 0.5]]
+        serial = list(map(fitness.log_likelihood_from_parameters, parameters))
+
+        fitness.share(pool)
+
+        assert len(pickle.dumps(fitness)) < 1000
+        assert pool.map(fitness.log_likelihood_from_parameters, parameters) == serial
+
+    def test_shared_once(self, pool, fitness):
+        fitness.share(pool)
+
+        results = pool.map(fitness_pid, [fitness] * 20, chunksize=1)
+
+        # Every task in a worker uses the same copy of the analysis
+        assert len(set(results)) == len({pid for _, pid in results})
+
+    def test_not_shared(self, fitness):
+        assert len(pickle.dumps(fitness)) > 100000
+
+    def test_shared_arrays(self, pool, fitness):
+        fitness.analysis = SharedAnalysis()
+        fitness.share(pool)
+        key = fitness.shared_key
+
+        assert len(pool._memory[key]) == 2
+        assert pool.map(shared_data, [fitness] * 2) == 2 * [
+            (False, fitness.analysis.data.sum(), (10, 10), False)
+        ]
+        assert fitness.analysis.data.flags.writeable
+
+        fitness.release(pool)
+
+        assert fitness.shared_key is None
+        assert key not in pool._memory
+
+    def test_array_subclass_keeps_type(self, pool, fitness):
+        fitness.analysis = SubclassAnalysis()
+        fitness.share(pool)
+
+        assert pool._memory[fitness.shared_key] == []
+        assert pool.map(grid_type, [fitness] * 2) == 2 * [("Grid", 45.0)]
+
+        fitness.release(pool)
+
+    def test_shared_until_released(self, pool, fitness):
+        other = af.NonLinearSearch.Fitness(
+            paths=None,
+            model=fitness.model,
+            analysis=SharedAnalysis(),
+            samples_from_model=None,
+        )
+        other.analysis.centre = 2.0
+
+        parameters = [[1.0, 0.5], [2.0, 0.5]]
+        serial = list(map(fitness.log_likelihood_from_parameters, parameters))
+        other_serial = list(map(other.log_likelihood_from_parameters, parameters))
+
+        fitness.share(pool)
+        other.share(pool)
+
+        assert pool.map(fitness.log_likelihood_from_parameters, parameters) == serial
+        assert pool.map(other.log_likelihood_from_parameters, parameters) == other_serial
+
+        key = fitness.shared_key
+        fitness.release(pool)
+
+        assert pool.map(other.log_likelihood_from_parameters, parameters) == other_serial
+        assert pool.map(shared_data, [other] * 2)[0][1] == other.analysis.data.sum()
+        with pytest.raises(KeyError):
+            pool.map(shared_object, [key] * 2)
+
+        other.release(pool)
+
+    def test_broadcast_exception(self, pool):
+        with pytest.raises(ValueError, match="failed"):
+            pool.broadcast(fail_in, min(pool.ids))
+
+        assert sorted(pool.broadcast(fail_in, None)) == sorted(pool.ids)
+
+    def test_shared_arrays_must_be_numeric(self, pool, fitness):
+        with pytest.raises(ValueError):
+            pool.share(fitness, arrays=[np.array([None])])
+
+    def test_pickle(self, pool):
+        pool.ids
+
+        unpickled = pickle.loads(pickle.dumps(pool))
+
+        assert unpickled.number_of_cores == 2
+        assert unpickled._pool is None
+
+    def test_for_cores(self):
+        assert WorkerPool.for_cores(3) is WorkerPool.for_cores(3)
+        assert WorkerPool.for_cores(3) is not WorkerPool.for_cores(4)
+
+    def test_too_few_cores(self):
+        with pytest.raises(ValueError):
+            WorkerPool(1)
+
+
+class TestFailingFit:
+    def test_released(self):
+        search = af.Emcee(
+            paths=af.Paths(name="failing_fit"),
+            nwalkers=4,
+            nsteps=10,
+            number_of_cores=2,
+        )
+        model = af.PriorModel(
+            mock.MockClassx2,
+            one=af.UniformPrior(0.0, 10.0),
+            two=af.UniformPrior(0.0, 10.0),
+        )
+
+        pool = WorkerPool.for_cores(2)
+        blocks = shared_blocks()
+
+        with pytest.raises(ValueError, match="failed"):
+            search.fit(model=model, analysis=WorkerFailingAnalysis())
+
+        assert pool.broadcast(shared_state) == 2 * [([], [])]
+        assert pool._memory == dict()
+        assert shared_blocks() == blocks
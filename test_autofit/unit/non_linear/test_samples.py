@@ -1,10 +1,21 @@
 import os
+import pickle
 
+import numpy as np
 import pytest
 
 import autofit as af
 from autofit.mock.mock import MockClassx2, MockClassx4
-from autofit.non_linear.samples import OptimizerSamples, PDFSamples, Sample
+from autofit.non_linear.samples import (
+    LazySamples,
+    OptimizerSamples,
+    PDFSamples,
+    Sample,
+    WeightedQuantiles,
+    load_from_binary,
+    quantile,
+    samples_cache,
+)
 
 pytestmark = pytest.mark.filterwarnings("ignore::FutureWarning")
 
@@ -177,6 +188,405 @@ class TestOptimizerSamples:
         assert instance.mock_class.three == 7.0
         assert instance.mock_class.four == 8.0
 
+
+class TestSampleArrays:
+    def test_columns(self, samples):
+        assert samples.samples.parameters.shape == (5, 4)
+        assert samples.samples.log_likelihoods.tolist() == [1.0, 2.0, 3.0, 10.0, 5.0]
+        assert samples.parameters_extract[0] == [0.0, 0.0, 0.0, 21.0, 0.0]
+
+    def test_sample(self, samples):
+        sample = samples.samples[3]
+
+        assert isinstance(sample, Sample)
+        assert sample.log_likelihood == 10.0
+        assert sample.kwargs["mock_class_1_one"] == 21.0
+        assert samples.max_log_likelihood_sample.log_likelihood == 10.0
+
+    def test_mask(self, samples):
+        selected = samples.samples[samples.samples.log_likelihoods > 2.5]
+
+        assert len(selected) == 3
+        assert [sample.log_likelihood for sample in selected] == [3.0, 10.0, 5.0]
+
+    def test_from_samples(self, samples):
+        samples = OptimizerSamples(
+            model=samples.model,
+            samples=list(samples.samples)
+        )
+
+        assert samples.max_log_likelihood_vector == [21.0, 22.0, 23.0, 24.0]
+
+    def test_nan_likelihood_ignored(self, samples):
+        samples.samples.log_likelihoods[3] = float("nan")
+
+        assert samples.max_log_likelihood_index == 4
+
+    def test_unpickle_list_of_samples(self, samples):
+        state = dict(samples.__dict__)
+        state["samples"] = list(state.pop("_samples"))
+
+        unpickled = pickle.loads(pickle.dumps(samples))
+        unpickled.__setstate__(state)
+
+        assert unpickled.log_likelihoods == [1.0, 2.0, 3.0, 10.0, 5.0]
+        assert unpickled.parameters[3] == [21.0, 22.0, 23.0, 24.0]
+
+
+@pytest.fixture(name="binary_file")
+def make_binary_file(tmpdir):
+    return str(tmpdir.join("samples.bin"))
+
+
+class TestBinary:
+    def test_round_trip(self, samples, binary_file):
+        samples.write_binary(filename=binary_file)
+        loaded = load_from_binary(filename=binary_file)
+
+        assert loaded.paths == samples.samples.paths
+        assert loaded.parameters.tolist() == samples.parameters
+        assert loaded.log_likelihoods.tolist() == samples.log_likelihoods
+        assert loaded.weights.tolist() == samples.weights
+
+        samples = OptimizerSamples(model=samples.model, samples=loaded)
+        assert samples.max_log_likelihood_vector == [21.0, 22.0, 23.0, 24.0]
+
+    def test_not_mapped(self, samples, binary_file):
+        samples.write_binary(filename=binary_file)
+        loaded = load_from_binary(filename=binary_file, mmap=False)
+
+        assert loaded.log_priors.tolist() == samples.log_priors
+
+    def test_rewrite_while_mapped(self, samples, binary_file):
+        samples.write_binary(filename=binary_file)
+        loaded = load_from_binary(filename=binary_file)
+
+        samples.samples[:1].write_binary(filename=binary_file)
+
+        assert loaded.parameters.tolist() == samples.parameters
+        assert len(load_from_binary(filename=binary_file)) == 1
+        assert not os.path.exists(f"{binary_file}.tmp")
+
+    def test_append(self, samples, binary_file):
+        samples.samples[:2].append_binary(filename=binary_file)
+        samples.samples[2:].append_binary(filename=binary_file)
+
+        loaded = load_from_binary(filename=binary_file)
+        assert loaded.parameters.tolist() == samples.parameters
+        assert loaded.log_likelihoods.tolist() == samples.log_likelihoods
+
+    def test_append_discards_uncounted_rows(self, samples, binary_file):
+        samples.samples[:2].write_binary(filename=binary_file)
+        with open(binary_file, "ab") as f:
+            f.write(b"\0" * 12)
+
+        samples.samples[2:].append_binary(filename=binary_file)
+
+        assert load_from_binary(filename=binary_file).parameters.tolist() == samples.parameters
+
+    def test_append_different_paths(self, samples, binary_file):
+        samples.write_binary(filename=binary_file)
+
+        with pytest.raises(ValueError):
+            Sample.from_lists(
+                model=af.ModelMapper(mock_class=MockClassx2),
+                parameters=[[1.0, 2.0]],
+                log_likelihoods=[1.0],
+                log_priors=[0.0],
+                weights=[1.0],
+            ).append_binary(filename=binary_file)
+
+    def test_empty(self, samples, binary_file):
+        samples.samples[:0].write_binary(filename=binary_file)
+
+        assert len(load_from_binary(filename=binary_file)) == 0
+
+
+class TestWeightedQuantiles:
+    def test_same_as_quantile(self):
+        values = np.array([
+            [1.0, 4.0],
+            [3.0, 2.0],
+            [2.0, 2.0],
+            [5.0, 1.0],
+            [4.0, 3.0],
+        ])
+        weights = [0.1, 0.3, 0.2, 0.0, 0.4]
+        q = [0.0, 0.2, 0.5, 0.9, 1.0]
+
+        quantiles = WeightedQuantiles(values=values, weights=weights)(q)
+
+        assert quantiles.shape == (5, 2)
+        for index in range(2):
+            assert quantiles[:, index].tolist() == quantile(
+                x=values[:, index], q=q, weights=weights
+            )
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            WeightedQuantiles(values=[[1.0], [2.0]], weights=[1.0])
+        with pytest.raises(ValueError):
+            WeightedQuantiles(values=[[1.0], [2.0]], weights=[1.0, 1.0])(1.5)
+
+    def test_cached(self, samples):
+        samples = PDFSamples(model=samples.model, samples=samples.samples)
+
+        assert samples.weighted_quantiles is samples.weighted_quantiles
+        assert "_cache" not in pickle.loads(
+            pickle.dumps(samples)
+        ).__dict__
+
+        quantiles = samples.weighted_quantiles
+        samples.samples = samples.samples[:3]
+        assert samples.weighted_quantiles is not quantiles
+
+
+class TestCache:
+    def test_copies_lists(self, samples):
+        vector = samples.max_log_likelihood_vector
+        vector[0] = 100.0
+
+        assert samples.max_log_likelihood_vector == [21.0, 22.0, 23.0, 24.0]
+
+    def test_read_only_arrays(self, samples):
+        parameters = samples._parameters
+
+        with pytest.raises(ValueError):
+            parameters[0, 0] = 100.0
+        assert samples.samples.parameters.flags.writeable
+
+    def test_override_calling_super(self, samples):
+        class OverridingSamples(OptimizerSamples):
+            @property
+            @samples_cache
+            def max_log_likelihood_vector(self):
+                return [2 * value for value in super().max_log_likelihood_vector]
+
+        samples = OverridingSamples(model=samples.model, samples=samples.samples)
+
+        assert samples.max_log_likelihood_vector == [42.0, 44.0, 46.0, 48.0]
+        assert samples.max_log_likelihood_vector == [42.0, 44.0, 46.0, 48.0]
+        assert OptimizerSamples.max_log_likelihood_vector.fget(samples) == [21.0, 22.0, 23.0, 24.0]
+
+    def test_arguments(self, samples):
+        samples.samples.weights[:] = 0.2
+        samples = PDFSamples(model=samples.model, samples=samples.samples)
+
+        assert samples.vector_at_sigma(1.0) != samples.vector_at_sigma(3.0)
+        assert samples.vector_at_sigma(sigma=1.0) == samples.vector_at_sigma(1.0)
+
+    def test_append(self, samples):
+        assert samples.max_log_likelihood_index == 3
+
+        samples.append(
+            Sample.from_lists(
+                model=samples.model,
+                parameters=[[5.0, 6.0, 7.0, 8.0]],
+                log_likelihoods=[20.0],
+                log_priors=[0.0],
+                weights=[1.0],
+            )
+        )
+
+        assert samples.total_samples == 6
+        assert samples.max_log_likelihood_index == 5
+        assert samples.max_log_likelihood_vector == [5.0, 6.0, 7.0, 8.0]
+
+    def test_append_different_paths(self, samples):
+        with pytest.raises(ValueError):
+            samples.append(
+                Sample.from_lists(
+                    model=af.ModelMapper(mock_class=MockClassx2),
+                    parameters=[[1.0, 2.0]],
+                    log_likelihoods=[1.0],
+                    log_priors=[0.0],
+                    weights=[1.0],
+                )
+            )
+
+    def test_clear_cache(self, samples):
+        assert samples.max_log_posterior_index == 3
+
+        samples.samples.log_likelihoods[0] = 100.0
+        assert samples.max_log_posterior_index == 3
+
+        samples.clear_cache()
+        assert samples.max_log_posterior_index == 0
+
+
+class TestWhere:
+    def test_where(self, samples):
+        samples.time = 10.0
+        selected = samples.where(
+            samples.samples.log_likelihoods > 2.5
+        )
+
+        assert isinstance(selected, OptimizerSamples)
+        assert selected.time == 10.0
+        assert selected.samples.log_likelihoods.tolist() == [3.0, 10.0, 5.0]
+        assert selected.max_log_likelihood_vector == [21.0, 22.0, 23.0, 24.0]
+        assert samples.total_samples == 5
+
+    def test_parameters_not_copied(self, samples):
+        selected = samples.where([False, False, True, True, False])
+
+        assert selected.samples._parameters is samples.samples._parameters
+        assert selected.samples._rows.tolist() == [2, 3]
+
+        selected_again = selected.where([False, True])
+        assert selected_again.samples._parameters is samples.samples._parameters
+        assert selected_again.parameters == [[21.0, 22.0, 23.0, 24.0]]
+
+        assert selected.parameters == [[0.0, 1.0, 2.0, 3.0], [21.0, 22.0, 23.0, 24.0]]
+
+    def test_pickle(self, samples):
+        selected = pickle.loads(
+            pickle.dumps(samples.where([False, False, False, True, False]))
+        )
+        assert selected.samples._parameters.shape == (1, 4)
+        assert selected.parameters == [[21.0, 22.0, 23.0, 24.0]]
+
+    def test_mask_within_ranges(self, samples):
+        mask = samples.mask_within_ranges({
+            0: (-1.0, 1.0),
+            "mock_class_1_three": (1.5, 2.5),
+        })
+        assert mask.tolist() == [True, True, True, False, True]
+
+        mask = samples.mask_within_ranges({
+            0: (-1.0, 1.0),
+            3: (3.5, 30.0),
+        })
+        assert mask.tolist() == [False] * 5
+
+    def test_wrong_shape(self, samples):
+        with pytest.raises(ValueError):
+            samples.where([True, False])
+
+
+class TestResample:
+    def test_effective_sample_size(self, samples):
+        samples = PDFSamples(model=samples.model, samples=samples.samples)
+        assert samples.effective_sample_size == pytest.approx(5.0)
+
+        samples.samples.weights[:] = [0.0, 0.0, 0.5, 0.5, 0.0]
+        samples.clear_cache()
+        assert samples.effective_sample_size == pytest.approx(2.0)
+
+    def test_systematic(self, samples):
+        samples.samples.weights[:] = [0.0, 0.25, 0.0, 0.75, 0.0]
+        samples = PDFSamples(model=samples.model, samples=samples.samples)
+
+        for seed in range(5):
+            resampled = samples.resample_equal_weights(8, seed=seed)
+
+            assert isinstance(resampled, PDFSamples)
+            assert resampled.samples.log_likelihoods.tolist() == 2 * [2.0] + 6 * [10.0]
+            assert resampled.samples.weights.tolist() == 8 * [0.125]
+            assert resampled.parameters[-1] == [21.0, 22.0, 23.0, 24.0]
+
+    def test_cached(self, samples):
+        samples = PDFSamples(model=samples.model, samples=samples.samples)
+
+        assert samples.resample_equal_weights(3, seed=1) is samples.resample_equal_weights(3, seed=1)
+        assert samples.thin(seed=1) is samples.resample_equal_weights(5, 1)
+
+    def test_not_cached_without_seed(self, samples):
+        samples.samples.weights[:] = [0.1, 0.2, 0.3, 0.2, 0.2]
+        samples = PDFSamples(model=samples.model, samples=samples.samples)
+
+        assert samples.resample_equal_weights(3) is not samples.resample_equal_weights(3)
+
+        np.random.seed(0)
+        offsets = {
+            tuple(samples.resample_equal_weights(2).samples.log_likelihoods)
+            for _ in range(20)
+        }
+        assert len(offsets) > 1
+
+    def test_thin(self, samples):
+        samples.samples.weights[:] = [0.0, 0.5, 0.0, 0.5, 0.0]
+        samples = PDFSamples(model=samples.model, samples=samples.samples)
+
+        assert len(samples.thin().samples) == 2
+        assert len(samples.thin(target_ess=1).samples) == 1
+        assert len(samples.thin(target_ess=100).samples) == 2
+
+    def test_no_weight(self, samples):
+        samples.samples.weights[:] = 0.0
+        samples = PDFSamples(model=samples.model, samples=samples.samples)
+
+        with pytest.raises(ValueError):
+            samples.thin()
+
+
+def fail_to_load():
+    raise AssertionError("Samples should not be loaded")
+
+
+class TestLazySamples:
+    def test_summary(self, samples):
+        samples.samples.weights[:] = 0.2
+        samples = PDFSamples(model=samples.model, samples=samples.samples)
+        lazy = LazySamples(
+            model=samples.model,
+            summary=samples.summary(sigma=3.0),
+            load=fail_to_load
+        )
+
+        assert lazy.max_log_likelihood == 10.0
+        assert lazy.max_log_likelihood_vector == [21.0, 22.0, 23.0, 24.0]
+        assert lazy.max_log_likelihood_instance.mock_class_1.four == 24.0
+        assert lazy.max_log_posterior_vector == samples.max_log_posterior_vector
+        assert lazy.median_pdf_vector == samples.median_pdf_vector
+        assert lazy.gaussian_priors_at_sigma(sigma=3.0) == samples.gaussian_priors_at_sigma(sigma=3.0)
+
+    def test_loads(self, samples):
+        loads = []
+
+        def load():
+            loads.append(samples)
+            return samples
+
+        lazy = LazySamples(
+            model=samples.model,
+            summary=samples.summary(sigma=3.0),
+            load=load
+        )
+
+        assert lazy.gaussian_priors_at_sigma(sigma=1.0) == samples.gaussian_priors_at_sigma(sigma=1.0)
+        assert lazy.log_likelihoods == samples.log_likelihoods
+        assert len(loads) == 1
+
+        with pytest.raises(AttributeError):
+            lazy.log_evidence
+
+    def test_json(self, samples, tmpdir):
+        filename = os.path.join(tmpdir, "summary.json")
+        samples.summary_to_json(filename)
+
+        lazy = LazySamples.from_json(
+            model=samples.model,
+            filename=filename,
+            load=fail_to_load
+        )
+        assert lazy.max_log_likelihood_vector == samples.max_log_likelihood_vector
+
+    def test_pickle(self, samples):
+        lazy = LazySamples(
+            model=samples.model,
+            summary=samples.summary(),
+            load=lambda: samples
+        )
+        lazy.loaded_samples
+
+        lazy.__dict__["_load"] = fail_to_load
+        lazy = pickle.loads(pickle.dumps(lazy))
+
+        assert lazy._loaded_samples is None
+        assert lazy.max_log_likelihood_vector == [21.0, 22.0, 23.0, 24.0]
+
+
 class TestPDFSamples:
     def test__from_csv_table(self, samples):
         filename = "samples.csv"